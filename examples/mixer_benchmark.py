@@ -0,0 +1,87 @@
+"""
+Benchmark of PCM mixing with pauses and crossfades.
+
+Compares building an episode with pydub, appending one segment at a time
+(`combined += silence`, `combined.append(audio, crossfade=...)`), with
+PCMMixer, which allocates the whole episode once and writes every segment
+into it. Both mix the same decoded 16-bit audio: every other boundary is a
+pause (a new section) and the rest are crossfades (a speaker change).
+Decoding and encoding are left out, as they are the same for both. No
+ffmpeg, credentials or network access are needed.
+"""
+
+import time
+from typing import List
+
+import numpy as np
+from pydub import AudioSegment
+
+from pdf2podcast.core.mixer import PCMMixer
+
+CHUNK_COUNTS = [50, 200]
+CHUNK_SECONDS = 10.0
+SAMPLE_RATE = 24000  # Polly's neural voices
+PAUSE = 0.6
+CROSSFADE = 0.15
+
+
+def build_chunks(count: int) -> List[np.ndarray]:
+    """Noise chunks with a slightly different length each."""
+    rng = np.random.default_rng(7)
+    chunks = []
+    for index in range(count):
+        length = int(SAMPLE_RATE * CHUNK_SECONDS) + index * 97
+        samples = rng.normal(0, 3000, size=(length, 1))
+        chunks.append(samples.astype("<i2"))
+    return chunks
+
+
+def mix_pydub(chunks: List[np.ndarray]) -> AudioSegment:
+    """Append segments one by one, as with pydub."""
+    pause = AudioSegment.silent(duration=PAUSE * 1000, frame_rate=SAMPLE_RATE)
+    combined = AudioSegment.empty()
+    for index, chunk in enumerate(chunks):
+        audio = AudioSegment(
+            data=chunk.tobytes(), sample_width=2, frame_rate=SAMPLE_RATE, channels=1
+        )
+        if index == 0:
+            combined += audio
+        elif index % 2:
+            combined += pause
+            combined += audio
+        else:
+            combined = combined.append(audio, crossfade=CROSSFADE * 1000)
+    return combined
+
+
+def mix_numpy(chunks: List[np.ndarray]) -> np.ndarray:
+    """Mix all segments into one preallocated buffer."""
+    boundaries = range(1, len(chunks))
+    pauses = [PAUSE if index % 2 else 0.0 for index in boundaries]
+    crossfades = [0.0 if index % 2 else CROSSFADE for index in boundaries]
+    return PCMMixer(SAMPLE_RATE).mix(chunks, pauses, crossfades)
+
+
+def main():
+    print(f"{CHUNK_SECONDS:.0f}s chunks at {SAMPLE_RATE} Hz, mono")
+    for count in CHUNK_COUNTS:
+        chunks = build_chunks(count)
+
+        start = time.perf_counter()
+        combined = mix_pydub(chunks)
+        pydub_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mixed = mix_numpy(chunks)
+        numpy_elapsed = time.perf_counter() - start
+
+        print(
+            f"{count} chunks ({len(mixed) / SAMPLE_RATE / 60:.1f} min): "
+            f"pydub {pydub_elapsed:.2f}s ({combined.duration_seconds / 60:.1f} min), "
+            f"PCMMixer {numpy_elapsed:.3f}s "
+            f"({pydub_elapsed / numpy_elapsed:.0f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark of concurrent TTS chunk synthesis.
+
+Synthesizes a 40,000-character script with the offline "fake" TTS provider,
+which answers each chunk request after a Polly-like latency, and compares
+wall-clock time for different max_concurrency settings. No credentials,
+network access or ffmpeg are needed; the silent MP3 chunks are joined at
+frame level. Run it from the repository root with the package installed
+(or with PYTHONPATH=.).
+"""
+
+import os
+import tempfile
+import time
+
+from pdf2podcast.core.fake import FakeTTS, fake_script
+from pdf2podcast.core.text import pack_text
+
+SCRIPT_LENGTH = 40000
+CONCURRENCY_LEVELS = [1, 2, 4, 8]
+
+# Latency per chunk request in seconds: normally distributed around LATENCY
+LATENCY = 0.8
+LATENCY_JITTER = 0.2
+
+
+def run(max_concurrency: int, script: str, workdir: str) -> float:
+    """Synthesize the script once and return the elapsed seconds."""
+    tts = FakeTTS(
+        latency=LATENCY,
+        latency_jitter=LATENCY_JITTER,
+        latency_distribution="normal",
+        seed=42,
+        max_concurrency=max_concurrency,
+        temp_dir=os.path.join(workdir, f"chunks_{max_concurrency}"),
+    )
+    output_path = os.path.join(workdir, f"output_{max_concurrency}.mp3")
+
+    start = time.perf_counter()
+    result = tts.generate_audio(script, output_path)
+    elapsed = time.perf_counter() - start
+
+    if not result["success"]:
+        raise RuntimeError(f"Synthesis failed: {result['error']}")
+    return elapsed
+
+
+def main():
+    script = fake_script("benchmark", SCRIPT_LENGTH)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        chunks = pack_text(script, FakeTTS(temp_dir=workdir).max_chunk_length)
+        print(
+            f"Script: {len(script)} characters in {len(chunks)} chunks, "
+            f"latency {LATENCY}s +/- {LATENCY_JITTER}s per chunk"
+        )
+        baseline = None
+        for level in CONCURRENCY_LEVELS:
+            elapsed = run(level, script, workdir)
+            baseline = baseline or elapsed
+            print(
+                f"max_concurrency={level}: {elapsed:.2f}s "
+                f"({baseline / elapsed:.1f}x faster than sequential)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of TTS text packing.
+
+Compares the former split on ". " with the sentence packer used by the TTS
+providers: number of requests, billed characters and synthesis time per
+10,000 characters of script. Both pack greedily up to the same limit, so
+request counts are equal; the packer balances chunk lengths, which
+shortens the longest chunk that concurrent synthesis waits for. Synthesis uses the offline "fake" TTS provider
+with a latency that grows with the chunk length, as Polly's does. No
+credentials or network access are needed.
+"""
+
+import os
+import random
+import tempfile
+import time
+from typing import List
+
+from pdf2podcast.core.fake import FakeTTS, fake_script
+from pdf2podcast.core.text import pack_text
+
+SCRIPT_LENGTHS = [10000, 40000]
+MAX_CHUNK_LENGTH = 3000  # Polly's request limit
+MAX_CONCURRENCY = 4
+
+
+def legacy_split(text: str, max_length: int) -> List[str]:
+    """The former split_text: split on ". " and append ". " to every piece."""
+    chunks = []
+    current_chunk = ""
+    for sentence in text.split(". "):
+        if not sentence.strip():
+            continue
+        sentence = sentence.strip() + ". "
+        if len(current_chunk) + len(sentence) > max_length:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+            current_chunk = sentence
+        else:
+            current_chunk += sentence
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def build_script(length: int) -> str:
+    """Filler script with questions, exclamations and paragraph breaks."""
+    rng = random.Random(7)
+    sentences = fake_script("packing", length).split(". ")
+    parts = []
+    for sentence in sentences:
+        sentence = sentence.rstrip(".") + rng.choice([".", ".", ".", "?", "!"])
+        parts.append(sentence + rng.choice([" ", " ", "\n\n"]))
+    return "".join(parts)
+
+
+def synthesize(chunks: List[str], workdir: str, name: str) -> float:
+    """Synthesize the chunks once and return the elapsed seconds."""
+    tts = FakeTTS(
+        latency=0.2,
+        latency_per_character=0.0003,
+        max_concurrency=MAX_CONCURRENCY,
+        temp_dir=workdir,
+    )
+    output_path = os.path.join(workdir, f"{name}.mp3")
+
+    start = time.perf_counter()
+    result = tts.generate_audio_from_chunks(chunks, output_path)
+    elapsed = time.perf_counter() - start
+
+    if not result["success"]:
+        raise RuntimeError(f"Synthesis failed: {result['error']}")
+    return elapsed
+
+
+def main():
+    print(f"max_chunk_length={MAX_CHUNK_LENGTH}, max_concurrency={MAX_CONCURRENCY}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for length in SCRIPT_LENGTHS:
+            script = build_script(length)
+            per_10k = 10000 / len(script)
+            print(f"Script: {len(script)} characters")
+
+            for name, chunks in [
+                ("legacy split", legacy_split(script, MAX_CHUNK_LENGTH)),
+                ("sentence packer", pack_text(script, MAX_CHUNK_LENGTH)),
+            ]:
+                elapsed = synthesize(chunks, workdir, name.replace(" ", "_"))
+                billed = sum(len(chunk) for chunk in chunks)
+                print(
+                    f"  {name}: {len(chunks) * per_10k:.2f} requests, "
+                    f"{billed * per_10k:.0f} billed characters, "
+                    f"{elapsed * per_10k:.2f}s per 10k characters "
+                    f"(longest chunk {max(len(chunk) for chunk in chunks)})"
+                )
+
+
+if __name__ == "__main__":
+    main()
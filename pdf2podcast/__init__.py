@@ -2,6 +2,8 @@
 pdf2podcast - A Python library to convert PDF documents into podcasts.
 """
 
+import importlib
+
 from .core.base import (
     BasePodcastGenerator,
     BaseRAG,
@@ -10,14 +12,30 @@ from .core.base import (
     BaseChunker,
     BaseRetriever,
     BasePromptBuilder,
+    StructuredPrompt,
 )
-from .core.rag import (
-    AdvancedPDFProcessor as SimplePDFProcessor,
-)  # For backward compatibility
-from .core.llm import GeminiLLM
-from .core.tts import AWSPollyTTS
-from .core.prompts import PodcastPromptBuilder
-from .core.processing import SimpleChunker, SemanticRetriever
+from .core.registry import register_llm_provider, register_tts_provider
+
+# Implementations are imported lazily on first attribute access, so that
+# importing the package does not pull in every provider SDK.
+_LAZY_ATTRIBUTES = {
+    "SimplePDFProcessor": (".core.rag", "AdvancedPDFProcessor"),
+    "GeminiLLM": (".core.llm", "GeminiLLM"),
+    "AWSPollyTTS": (".core.tts", "AWSPollyTTS"),
+    "GoogleTTS": (".core.tts", "GoogleTTS"),
+    "PodcastPromptBuilder": (".core.prompts", "PodcastPromptBuilder"),
+    "SimpleChunker": (".core.processing", "SimpleChunker"),
+    "SemanticRetriever": (".core.processing", "SemanticRetriever"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attr = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Main podcast generator class
@@ -39,11 +57,15 @@ __all__ = [
     "SimplePDFProcessor",
     "GeminiLLM",
     "AWSPollyTTS",
+    "GoogleTTS",
     "BaseRAG",
     "BaseLLM",
     "BaseTTS",
     "BaseChunker",
     "BaseRetriever",
+    "StructuredPrompt",
     "SimpleChunker",
     "SemanticRetriever",
+    "register_llm_provider",
+    "register_tts_provider",
 ]
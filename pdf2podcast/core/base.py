@@ -2,12 +2,55 @@
 Base abstract classes for the pdf2podcast library components.
 """
 
+import asyncio
+import logging
+import os
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from functools import partial
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Iterable, Iterator
+
+from .tokens import estimate_tokens, fit_chunks, record_usage
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class StructuredPrompt(str):
+    """
+    Prompt split into a static instruction prefix and dynamic content.
+
+    The object is the full prompt text (system, a blank line, content), so code
+    that treats prompts as plain strings keeps working. Providers supporting
+    system instructions or context caching send the two parts separately, so
+    an identical prefix can be reused between calls.
+    """
+
+    def __new__(cls, system: str, content: str):
+        """
+        Create a structured prompt.
+
+        Args:
+            system (str): Static instructions, identical for calls with the
+                same settings
+            content (str): Call-specific content (source text, script, ...)
+        """
+        prompt = super().__new__(cls, f"{system}\n\n{content}" if system else content)
+        prompt.system = system
+        prompt.content = content
+        return prompt
+
+    def __getnewargs__(self):
+        return (self.system, self.content)
 
 
 class BasePromptBuilder(ABC):
-    """Base class for building prompts."""
+    """
+    Base class for building prompts.
+
+    Builders may return a StructuredPrompt instead of a plain string to let
+    providers reuse the static instruction prefix.
+    """
 
     @abstractmethod
     def build_prompt(self, text: str, **kwargs) -> str:
@@ -37,6 +80,71 @@ class BasePromptBuilder(ABC):
         """
         pass
 
+    def build_section_expand_prompt(
+        self,
+        text: str,
+        target_length: int,
+        section_index: int,
+        section_count: int,
+        **kwargs,
+    ) -> str:
+        """
+        Build a prompt expanding one section of a script.
+
+        Optional: only required for sectional expansion.
+
+        Args:
+            text (str): Section text
+            target_length (int): Target length of the expanded section in characters
+            section_index (int): Zero-based position of the section
+            section_count (int): Total number of sections
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Formatted section expansion prompt
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support sectional expansion"
+        )
+
+    def build_map_prompt(
+        self, text: str, section_index: int, section_count: int, **kwargs
+    ) -> str:
+        """
+        Build a prompt extracting notes from one section of a long document.
+
+        Optional: only required for map-reduce generation.
+
+        Args:
+            text (str): Source text of the section
+            section_index (int): Zero-based position of the section
+            section_count (int): Total number of sections
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Formatted map prompt
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support map-reduce generation"
+        )
+
+    def build_reduce_prompt(self, notes: str, **kwargs) -> str:
+        """
+        Build a prompt composing the final script from ordered section notes.
+
+        Optional: only required for map-reduce generation.
+
+        Args:
+            notes (str): Notes produced for each section, in document order
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Formatted reduce prompt
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support map-reduce generation"
+        )
+
 
 class BaseRAG(ABC):
     """Base class for RAG (Retrieval Augmented Generation) implementations."""
@@ -104,14 +212,186 @@ class BaseRetriever(ABC):
 class BaseLLM(ABC):
     """Base class for Large Language Model implementations."""
 
-    def __init__(self, prompt_builder: Optional[BasePromptBuilder] = None):
+    def __init__(
+        self,
+        prompt_builder: Optional[BasePromptBuilder] = None,
+        response_cache: Optional[Any] = None,
+        max_input_tokens: Optional[int] = None,
+    ):
         """
         Initialize LLM with optional prompt builder.
 
         Args:
             prompt_builder (Optional[BasePromptBuilder]): Custom prompt builder
+            response_cache (Optional[ResponseCache]): Cache for model responses
+            max_input_tokens (Optional[int]): Token budget for a single prompt
         """
         self.prompt_builder = prompt_builder
+        self.response_cache = response_cache
+        self.max_input_tokens = max_input_tokens
+        # Token usage of the most recent generation on this instance; use
+        # pdf2podcast.core.tokens.track_usage for concurrent generations
+        self.last_usage: Optional[Dict[str, Any]] = None
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the tokens of a text for this model.
+
+        The default implementation is a character-based estimate; providers
+        with a tokenizer override it.
+
+        Args:
+            text (str): Text to measure
+
+        Returns:
+            int: Token count
+        """
+        return estimate_tokens(text)
+
+    def fit_text_chunks(self, chunks: List[str], **kwargs: Any) -> List[str]:
+        """
+        Drop the lowest-ranked chunks until the prompt fits max_input_tokens.
+
+        The prompt template is rendered without source text to measure its
+        fixed overhead; the remaining budget is filled with chunks in order.
+
+        Args:
+            chunks (List[str]): Source chunks, most relevant first
+            **kwargs: Prompt parameters (complexity, target_audience, ...)
+
+        Returns:
+            List[str]: Chunks that fit into the budget
+        """
+        if self.max_input_tokens is None or self.prompt_builder is None:
+            return chunks
+
+        kwargs.setdefault("complexity", "intermediate")
+        kwargs.setdefault("target_audience", "general")
+        kwargs.setdefault("min_length", 10000)
+        overhead = self.count_tokens(self.prompt_builder.build_prompt(text="", **kwargs))
+        kept = fit_chunks(chunks, self.max_input_tokens - overhead, self.count_tokens)
+
+        if len(kept) < len(chunks):
+            logger.warning(
+                f"Prompt over budget of {self.max_input_tokens} tokens: "
+                f"dropped {len(chunks) - len(kept)} of {len(chunks)} chunks"
+            )
+        return kept
+
+    def _cached_invoke(
+        self,
+        prompt: str,
+        invoke: Callable[[str], str],
+        bypass_cache: bool = False,
+        **params: Any,
+    ) -> str:
+        """
+        Call the model through the response cache, if one is configured.
+
+        Args:
+            prompt (str): Rendered prompt
+            invoke (Callable[[str], str]): Function sending the prompt to the model
+            bypass_cache (bool): Skip the lookup and refresh the cached entry
+            **params: Model parameters that are part of the cache key
+
+        Returns:
+            str: Model response
+        """
+        if self.response_cache is None:
+            return invoke(prompt)
+
+        key = self.response_cache.make_key(prompt, **params)
+        if not bypass_cache:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                record_usage(0, 0, cached=True)
+                return cached
+
+        result = invoke(prompt)
+        self.response_cache.set(key, result)
+        return result
+
+    async def _acached_invoke(
+        self,
+        prompt: str,
+        ainvoke: Callable[[str], Awaitable[str]],
+        bypass_cache: bool = False,
+        **params: Any,
+    ) -> str:
+        """
+        Async counterpart of _cached_invoke.
+
+        Args:
+            prompt (str): Rendered prompt
+            ainvoke (Callable[[str], Awaitable[str]]): Coroutine function sending
+                the prompt to the model
+            bypass_cache (bool): Skip the lookup and refresh the cached entry
+            **params: Model parameters that are part of the cache key
+
+        Returns:
+            str: Model response
+        """
+        if self.response_cache is None:
+            return await ainvoke(prompt)
+
+        key = self.response_cache.make_key(prompt, **params)
+        if not bypass_cache:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                record_usage(0, 0, cached=True)
+                return cached
+
+        result = await ainvoke(prompt)
+        self.response_cache.set(key, result)
+        return result
+
+    def _cached_stream(
+        self,
+        prompt: str,
+        stream: Callable[[str], Iterable[str]],
+        bypass_cache: bool = False,
+        **params: Any,
+    ) -> Iterator[str]:
+        """
+        Stream a model response through the response cache, if one is configured.
+
+        A cache hit is yielded as a single fragment; a streamed response is
+        stored once it has been fully consumed.
+
+        Args:
+            prompt (str): Rendered prompt
+            stream (Callable[[str], Iterable[str]]): Function streaming text
+                fragments for the prompt
+            bypass_cache (bool): Skip the lookup and refresh the cached entry
+            **params: Model parameters that are part of the cache key
+
+        Yields:
+            str: Response text fragments
+        """
+        if self.response_cache is None:
+            yield from stream(prompt)
+            return
+
+        key = self.response_cache.make_key(prompt, **params)
+        if not bypass_cache:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                record_usage(0, 0, cached=True)
+                yield cached
+                return
+
+        parts = []
+        fragments = stream(prompt)
+        try:
+            for fragment in fragments:
+                parts.append(fragment)
+                yield fragment
+        finally:
+            # Closing an aborted stream lets it finish its bookkeeping now
+            close = getattr(fragments, "close", None)
+            if close is not None:
+                close()
+        self.response_cache.set(key, "".join(parts).strip())
 
     @abstractmethod
     def generate_podcast_script(
@@ -131,6 +411,48 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def agenerate_podcast_script(
+        self, text: str, complexity: str = "intermediate", **kwargs: Dict[str, Any]
+    ) -> str:
+        """
+        Asynchronously generate a podcast script from input text.
+
+        The default implementation runs generate_podcast_script in the event
+        loop's default executor; providers with a native async API override it.
+
+        Args:
+            text (str): Input text to convert into a podcast script
+            complexity (str): Desired complexity level of the output
+            **kwargs: Additional model-specific parameters
+
+        Returns:
+            str: Generated podcast script
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(self.generate_podcast_script, text, complexity, **kwargs),
+        )
+
+    def stream_podcast_script(
+        self, text: str, complexity: str = "intermediate", **kwargs: Dict[str, Any]
+    ) -> Iterator[str]:
+        """
+        Generate a podcast script as a stream of text fragments.
+
+        The default implementation yields the complete script at once;
+        providers with a streaming API override it.
+
+        Args:
+            text (str): Input text to convert into a podcast script
+            complexity (str): Desired complexity level of the output
+            **kwargs: Additional model-specific parameters
+
+        Yields:
+            str: Script text fragments in order
+        """
+        yield self.generate_podcast_script(text, complexity, **kwargs)
+
 
 class BaseTTS(ABC):
     """Base class for Text-to-Speech implementations."""
@@ -153,11 +475,127 @@ class BaseTTS(ABC):
             **kwargs: Additional TTS-specific parameters
 
         Returns:
-            Dict[str, Any]: Dictionary containing audio metadata
-                          (e.g., {'duration': float, 'size': int})
+            Dict[str, Any]: Dictionary containing audio metadata:
+                          'success', 'path' and 'size' in bytes, and where
+                          known without decoding 'duration' in seconds,
+                          average 'bitrate' in kbps, 'sample_rate',
+                          'channels' and 'chunk_offsets' (start of each
+                          synthesized chunk in seconds)
         """
         pass
 
+    def generate_audio_from_chunks(
+        self,
+        chunks: Iterable[str],
+        output_path: str,
+        voice_id: Optional[str] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Convert a stream of text chunks to speech and save as one audio file.
+
+        Chunks may be produced lazily (e.g. while an LLM is still generating);
+        providers that synthesize in chunks start working on each chunk as
+        soon as it arrives. The default implementation waits for all chunks
+        and calls generate_audio.
+
+        Args:
+            chunks (Iterable[str]): Text chunks in order
+            output_path (str): Path where to save the audio file
+            voice_id (Optional[str]): ID of the voice to use
+            **kwargs: Additional TTS-specific parameters
+
+        Returns:
+            Dict[str, Any]: Dictionary containing audio metadata
+        """
+        return self.generate_audio(
+            " ".join(chunks), output_path, voice_id=voice_id, **kwargs
+        )
+
+    def generate_dialogue(
+        self,
+        script: str,
+        output_path: str,
+        voices: Optional[Dict[str, str]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Convert a speaker-tagged script to speech with one voice per speaker.
+
+        Args:
+            script (str): Script with lines labelled by speaker ("Alex: ...")
+            output_path (str): Path where to save the audio file
+            voices (Optional[Dict[str, str]]): Speaker name -> voice ID
+            **kwargs: Additional TTS-specific parameters
+
+        Returns:
+            Dict[str, Any]: Dictionary containing audio metadata
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support multi-speaker dialogue"
+        )
+
+    def stream_audio(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[bytes]:
+        """
+        Convert text to speech and yield the audio as it becomes available.
+
+        The concatenated pieces form one MP3 stream, suitable for chunked
+        HTTP responses. Providers that synthesize in chunks yield each
+        chunk's audio as soon as it and all earlier chunks are done. The
+        default implementation renders the whole file first.
+
+        Args:
+            text (str): Text to convert to speech
+            voice_id (Optional[str]): ID of the voice to use
+            **kwargs: Additional TTS-specific parameters
+
+        Yields:
+            bytes: MP3 data in playback order
+
+        Raises:
+            RuntimeError: If no audio could be generated
+        """
+        fd, path = tempfile.mkstemp(suffix=".mp3")
+        os.close(fd)
+        try:
+            result = self.generate_audio(text, path, voice_id=voice_id, **kwargs)
+            if not result.get("success", True):
+                raise RuntimeError(f"Audio generation failed: {result.get('error')}")
+            with open(path, "rb") as file:
+                while True:
+                    block = file.read(64 * 1024)
+                    if not block:
+                        break
+                    yield block
+        finally:
+            os.remove(path)
+
+    def stream_audio_from_chunks(
+        self,
+        chunks: Iterable[str],
+        voice_id: Optional[str] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[bytes]:
+        """
+        Convert a stream of text chunks to speech and yield the audio progressively.
+
+        The default implementation waits for all chunks and calls stream_audio.
+
+        Args:
+            chunks (Iterable[str]): Text chunks in order
+            voice_id (Optional[str]): ID of the voice to use
+            **kwargs: Additional TTS-specific parameters
+
+        Yields:
+            bytes: MP3 data in playback order
+        """
+        yield from self.stream_audio(" ".join(chunks), voice_id=voice_id, **kwargs)
+
 
 class BasePodcastGenerator:
     """Base class for podcast generation orchestration."""
@@ -207,6 +645,7 @@ class BasePodcastGenerator:
         complexity: str = "intermediate",
         voice_id: Optional[str] = None,
         query: Optional[str] = None,
+        stream: bool = False,
         **kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
@@ -218,10 +657,170 @@ class BasePodcastGenerator:
             complexity (str): Desired complexity of the podcast script
             voice_id (Optional[str]): ID of the voice to use for TTS
             query (Optional[str]): Query for semantic retrieval of relevant chunks
+            stream (bool): Feed complete sentences from the streamed script to TTS
+                while the script is still being generated (default: False)
+            **kwargs: Additional parameters for RAG, LLM, or TTS systems
+
+        Returns:
+            Dict[str, Any]: Dictionary containing generation results and metadata
+                          ({'script': str, 'audio': dict, 'usage': dict}, where
+                          usage holds input/output token counts per LLM call)
+        """
+        from .prompts import PodcastPromptTemplate
+        from .text import strip_section_headings
+        from .tokens import track_usage
+
+        text = self._prepare_text(pdf_path, complexity, query, **kwargs)
+
+        if stream:
+            return self._generate_streaming(
+                text, output_path, complexity, voice_id, **kwargs
+            )
+
+        # Generate podcast script; usage is tracked per call, as the LLM's
+        # last_usage is shared by concurrent generations
+        with track_usage() as usage:
+            script = self.llm.generate_podcast_script(
+                text=text, complexity=complexity, **kwargs
+            )
+
+        # Section headings, if requested with section_headings, are not narrated
+        narration = strip_section_headings(script, PodcastPromptTemplate.SECTIONS)
+
+        # Convert script to audio, one voice per speaker if voices are set
+        if getattr(self.tts, "voices", None):
+            audio_result = self.tts.generate_dialogue(
+                script=narration, output_path=output_path, **kwargs
+            )
+        else:
+            audio_result = self.tts.generate_audio(
+                text=narration, output_path=output_path, voice_id=voice_id, **kwargs
+            )
+
+        return {
+            "script": script,
+            "audio": audio_result,
+            "usage": usage.as_dict(),
+        }
+
+    def generate_chapters(
+        self,
+        pdf_path: str,
+        output_dir: str,
+        complexity: str = "intermediate",
+        voice_id: Optional[str] = None,
+        query: Optional[str] = None,
+        segment_duration: float = 10.0,
+        **kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Generate a podcast from a PDF document as chapterized output.
+
+        The script is generated with a "[title]" heading line before each
+        section, which is kept in the returned script but not narrated. Each
+        section is synthesized into its own file, and output_dir gets the
+        joined episode with chapter markers, chapters.json and an HLS
+        playlist. See render_chapters for re-rendering edited scripts.
+
+        Args:
+            pdf_path (str): Path to the input PDF file
+            output_dir (str): Directory for the output files
+            complexity (str): Desired complexity of the podcast script
+            voice_id (Optional[str]): ID of the voice to use for TTS
+            query (Optional[str]): Query for semantic retrieval of relevant chunks
+            segment_duration (float): Target HLS segment length in seconds
+                (default: 10)
             **kwargs: Additional parameters for RAG, LLM, or TTS systems
 
         Returns:
             Dict[str, Any]: Dictionary containing generation results and metadata
+                          ({'script': str, 'audio': dict, 'usage': dict}, where
+                          audio is the result of render_chapters)
+        """
+        from .chapters import render_chapters
+        from .tokens import track_usage
+
+        text = self._prepare_text(pdf_path, complexity, query, **kwargs)
+        # The script marks each section with a heading line for render_chapters
+        script_kwargs = dict(kwargs, section_headings=True)
+        with track_usage() as usage:
+            script = self.llm.generate_podcast_script(
+                text=text, complexity=complexity, **script_kwargs
+            )
+        audio_result = render_chapters(
+            self.tts,
+            script,
+            output_dir,
+            voice_id=voice_id,
+            segment_duration=segment_duration,
+            **kwargs,
+        )
+
+        return {
+            "script": script,
+            "audio": audio_result,
+            "usage": usage.as_dict(),
+        }
+
+    def stream_audio(
+        self,
+        pdf_path: str,
+        complexity: str = "intermediate",
+        voice_id: Optional[str] = None,
+        query: Optional[str] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[bytes]:
+        """
+        Generate a podcast from a PDF document as a progressive MP3 stream.
+
+        The script is streamed from the LLM, complete sentences are handed to
+        TTS as TTS-sized chunks, and the audio of each chunk is yielded as
+        soon as it and all earlier chunks are synthesized. Nothing is written
+        to disk, so the stream can be served over chunked HTTP while the rest
+        of the episode is still being generated.
+
+        Args:
+            pdf_path (str): Path to the input PDF file
+            complexity (str): Desired complexity of the podcast script
+            voice_id (Optional[str]): ID of the voice to use for TTS
+            query (Optional[str]): Query for semantic retrieval of relevant chunks
+            **kwargs: Additional parameters for RAG, LLM, or TTS systems
+
+        Yields:
+            bytes: MP3 data in playback order
+        """
+        from .prompts import PodcastPromptTemplate
+        from .text import iter_sentence_chunks, iter_without_headings
+
+        text = self._prepare_text(pdf_path, complexity, query, **kwargs)
+        fragments = iter_without_headings(
+            self.llm.stream_podcast_script(text=text, complexity=complexity, **kwargs),
+            PodcastPromptTemplate.SECTIONS,
+        )
+
+        max_length = getattr(self.tts, "max_chunk_length", 3000)
+        yield from self.tts.stream_audio_from_chunks(
+            iter_sentence_chunks(fragments, max_length), voice_id=voice_id, **kwargs
+        )
+
+    def _prepare_text(
+        self,
+        pdf_path: str,
+        complexity: str,
+        query: Optional[str],
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Extract the source text of a document, narrowed to a query if given.
+
+        Args:
+            pdf_path (str): Path to the input PDF file
+            complexity (str): Desired complexity of the podcast script
+            query (Optional[str]): Query for semantic retrieval of relevant chunks
+            **kwargs: Additional parameters for the LLM prompt
+
+        Returns:
+            str: Source text for the script
         """
         # Extract text from PDF
         text = self.rag.process_document(pdf_path)
@@ -234,16 +833,81 @@ class BasePodcastGenerator:
             if query:
                 # Use retrieved chunks if query provided
                 relevant_chunks = self.retriever.get_relevant_chunks(query, k=self.k)
+                # Drop the lowest-ranked chunks if the prompt would be over budget
+                relevant_chunks = self.llm.fit_text_chunks(
+                    relevant_chunks, complexity=complexity, **kwargs
+                )
                 text = "\n\n".join(relevant_chunks)
 
-        # Generate podcast script
-        script = self.llm.generate_podcast_script(
-            text=text, complexity=complexity, **kwargs
-        )
+        return text
 
-        # Convert script to audio
-        audio_result = self.tts.generate_audio(
-            text=script, output_path=output_path, voice_id=voice_id, **kwargs
-        )
+    def _generate_streaming(
+        self,
+        text: str,
+        output_path: str,
+        complexity: str,
+        voice_id: Optional[str],
+        **kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Generate script and audio with overlapping LLM and TTS work.
+
+        Script fragments are assembled into TTS-sized chunks of whole sentences
+        and each chunk is handed to the TTS provider as soon as it is complete.
+        If the script stream fails, the error is raised once TTS has stopped,
+        rather than being reported as a failed audio result.
+
+        Args:
+            text (str): Source text for the script
+            output_path (str): Path where to save the output audio file
+            complexity (str): Desired complexity of the podcast script
+            voice_id (Optional[str]): ID of the voice to use for TTS
+            **kwargs: Additional parameters for LLM or TTS systems
+
+        Returns:
+            Dict[str, Any]: Dictionary containing generation results and metadata
 
-        return {"script": script, "audio": audio_result}
+        Raises:
+            Exception: Any error of the LLM's script stream
+        """
+        from .prompts import PodcastPromptTemplate
+        from .text import iter_sentence_chunks, iter_without_headings
+        from .tokens import track_usage
+
+        script_parts: List[str] = []
+        script_errors: List[Exception] = []
+        with track_usage() as usage:
+            # The stream takes the tracker when it is created, so usage is
+            # recorded wherever TTS consumes it
+            script = self.llm.stream_podcast_script(
+                text=text, complexity=complexity, **kwargs
+            )
+
+        def fragments() -> Iterator[str]:
+            try:
+                for fragment in script:
+                    script_parts.append(fragment)
+                    yield fragment
+            except Exception as e:
+                # TTS turns this into a failed result; it is raised below
+                script_errors.append(e)
+                raise
+
+        max_length = getattr(self.tts, "max_chunk_length", 3000)
+        audio_result = self.tts.generate_audio_from_chunks(
+            iter_sentence_chunks(
+                iter_without_headings(fragments(), PodcastPromptTemplate.SECTIONS),
+                max_length,
+            ),
+            output_path=output_path,
+            voice_id=voice_id,
+            **kwargs,
+        )
+        if script_errors:
+            raise script_errors[0]
+
+        return {
+            "script": "".join(script_parts).strip(),
+            "audio": audio_result,
+            "usage": usage.as_dict(),
+        }
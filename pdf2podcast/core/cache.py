@@ -0,0 +1,299 @@
+"""
+Persistent caches for pdf2podcast.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache for LLM responses.
+
+    Entries are keyed by a hash of the rendered prompt and the model
+    parameters, expire after an optional TTL and are evicted least recently
+    used first once the cache holds more than max_entries responses. The
+    database can be shared by several processes on the same host.
+    """
+
+    def __init__(
+        self,
+        path: str = os.path.join(".pdf2podcast_cache", "llm_responses.sqlite"),
+        ttl: Optional[float] = None,
+        max_entries: int = 1000,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            path (str): Path of the SQLite database file
+            ttl (Optional[float]): Entry lifetime in seconds (default: no expiry)
+            max_entries (int): Maximum number of cached responses (default: 1000)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    @staticmethod
+    def make_key(prompt: str, **params: Any) -> str:
+        """
+        Build a cache key from a rendered prompt and model parameters.
+
+        Args:
+            prompt (str): Rendered prompt
+            **params: Model name and sampling parameters
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {"prompt": prompt, "params": params}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            Optional[str]: Cached response, or None if missing or expired
+        """
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                value, created = row
+                if self.ttl is not None and now - created > self.ttl:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+
+                self._conn.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                )
+                return value
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache lookup failed: {str(e)}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response and evict the least recently used entries if needed.
+
+        Args:
+            key (str): Cache key from make_key
+            value (str): Response text
+        """
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created, accessed) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache store failed: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class AudioCache:
+    """
+    Content-addressed disk cache for synthesized audio chunks.
+
+    Entries are keyed by a hash of the provider, voice, engine, output format
+    and normalized chunk text, stored as one file each and evicted least
+    recently used first once the cache grows beyond max_bytes. The directory
+    can be shared by several processes on the same host.
+    """
+
+    def __init__(
+        self,
+        directory: str = os.path.join(".pdf2podcast_cache", "audio"),
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Initialize audio cache.
+
+        Args:
+            directory (str): Directory holding the cached audio files
+            max_bytes (int): Maximum total size of cached audio (default: 512 MiB)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        voice: Optional[str],
+        engine: Optional[str],
+        text: str,
+        audio_format: str = "mp3",
+    ) -> str:
+        """
+        Build a cache key for a synthesis request.
+
+        Whitespace differences in the text do not change the key.
+
+        Args:
+            provider (str): Provider name (e.g. "polly", "gtts")
+            voice (Optional[str]): Voice ID or language
+            engine (Optional[str]): Engine or other voice settings
+            text (str): Chunk text
+            audio_format (str): Output format (default: "mp3")
+
+        Returns:
+            str: Hex digest identifying the audio
+        """
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        payload = json.dumps(
+            [provider, voice, engine, audio_format, normalized], default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _entries(self):
+        """Yield (path, size, last access) of every cached file."""
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up cached audio.
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            Optional[bytes]: Cached audio, or None if missing
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # The modification time records the last access for eviction
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Audio cache lookup failed: {str(e)}")
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """
+        Store audio and evict the least recently used entries if needed.
+
+        Args:
+            key (str): Cache key from make_key
+            data (bytes): Audio data
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so readers never see partial audio
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            # An overwritten entry no longer counts towards the size
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Audio cache store failed: {str(e)}")
+            return
+
+        with self._lock:
+            self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the cache fits into max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._size = total
+
+    def clear(self) -> None:
+        """Remove all cached audio."""
+        with self._lock:
+            for path, _, _ in list(self._entries()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size = 0
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
@@ -0,0 +1,347 @@
+"""
+Chapterized episode output.
+
+A script is rendered section by section into separate MP3 files, so a
+changed section can be re-rendered and swapped in on its own. From the
+section files, which are only read at frame level, an output directory
+gets:
+
+- episode.mp3: all sections joined, with ID3v2 chapter frames (CHAP/CTOC)
+- chapters.json: chapter titles and start times (Podcasting 2.0 format)
+- playlist.m3u8: an HLS playlist of short packed-audio segments in hls/
+- manifest.json: a fingerprint of each section, to detect changes
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import math
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base import BaseTTS
+from .mp3 import FrameJoiner, id3_frame, id3v2_tag, iter_frames
+from .prompts import PodcastPromptTemplate
+from .text import split_sections
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+SECTIONS_DIR = "sections"
+HLS_DIR = "hls"
+EPISODE_NAME = "episode.mp3"
+CHAPTERS_NAME = "chapters.json"
+PLAYLIST_NAME = "playlist.m3u8"
+MANIFEST_NAME = "manifest.json"
+
+# HLS packed audio segments start with an ID3 PRIV frame holding the
+# 33-bit MPEG-2 timestamp (90 kHz clock) of their first sample
+_HLS_TIMESTAMP_OWNER = b"com.apple.streaming.transportStreamTimestamp"
+
+
+def section_fingerprint(tts: BaseTTS, text: str, voice_id: Optional[str]) -> str:
+    """
+    Fingerprint the audio a section would be rendered to.
+
+    Args:
+        tts (BaseTTS): TTS provider
+        text (str): Section text
+        voice_id (Optional[str]): Voice override
+
+    Returns:
+        str: Hex digest covering the text and the provider's audio settings
+    """
+    postprocessor = getattr(tts, "postprocessor", None)
+    settings = {
+        "provider": type(tts).__name__,
+        "voice": voice_id,
+        "default_voice": getattr(tts, "voice_id", getattr(tts, "language", None)),
+        "engine": getattr(tts, "engine", None),
+        "voices": getattr(tts, "voices", None),
+        "output_format": getattr(tts, "output_format", "mp3"),
+        "bitrate": getattr(tts, "bitrate", None),
+        "postprocess": vars(postprocessor) if postprocessor is not None else None,
+        "text": text,
+    }
+    payload = json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _chapter_tag(chapters: List[Dict[str, Any]]) -> bytes:
+    """Build an ID3v2 tag with a table of contents and one CHAP per chapter."""
+    frames = []
+    element_ids = []
+    for index, chapter in enumerate(chapters):
+        element_id = f"chp{index}".encode("ascii")
+        element_ids.append(element_id)
+        start = round(chapter["start"] * 1000)
+        end = round((chapter["start"] + chapter["duration"]) * 1000)
+        title = id3_frame("TIT2", b"\x03" + chapter["title"].encode("utf-8"))
+        frames.append(
+            id3_frame(
+                "CHAP",
+                element_id
+                + b"\x00"
+                + start.to_bytes(4, "big")
+                + end.to_bytes(4, "big")
+                # No byte offsets, times only
+                + b"\xff" * 8
+                + title,
+            )
+        )
+
+    # Top-level, ordered table of contents listing every chapter
+    toc = b"toc\x00\x03" + bytes([len(element_ids)])
+    toc += b"".join(element_id + b"\x00" for element_id in element_ids)
+    return id3v2_tag([id3_frame("CTOC", toc)] + frames)
+
+
+def _timestamp_tag(seconds: float) -> bytes:
+    """Build the ID3v2 tag carrying an HLS packed audio timestamp."""
+    timestamp = round(seconds * 90000) & (2**33 - 1)
+    body = _HLS_TIMESTAMP_OWNER + b"\x00" + timestamp.to_bytes(8, "big")
+    return id3v2_tag([id3_frame("PRIV", body)])
+
+
+def _write_episode(section_audio: List[bytes], chapters: List[Dict], path: str) -> int:
+    """Join section audio at frame level behind a chapter tag."""
+    joiner = FrameJoiner()
+    with open(path, "wb") as output:
+        output.write(_chapter_tag(chapters))
+        for audio in section_audio:
+            for run in joiner.feed(audio):
+                output.write(run)
+    return os.path.getsize(path)
+
+
+def _write_hls(
+    section_audio: List[bytes],
+    chapters: List[Dict[str, Any]],
+    output_dir: str,
+    segment_duration: float,
+) -> str:
+    """Cut sections into packed-audio segments at frame boundaries."""
+    hls_dir = os.path.join(output_dir, HLS_DIR)
+    os.makedirs(hls_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(hls_dir, "*.mp3")):
+        os.remove(path)
+
+    entries = []
+    for audio, chapter in zip(section_audio, chapters):
+        # Group frames into segments of about segment_duration
+        segments: List[List[Tuple[int, int]]] = [[]]
+        durations = [0.0]
+        for offset, header in iter_frames(audio):
+            if durations[-1] >= segment_duration:
+                segments.append([])
+                durations.append(0.0)
+            segments[-1].append((offset, offset + header.frame_length))
+            durations[-1] += header.duration
+
+        view = memoryview(audio)
+        position = chapter["start"]
+        for index, (frames, duration) in enumerate(zip(segments, durations)):
+            if not frames:
+                continue
+            name = f"{chapter['key']}-{index:03d}.mp3"
+            with open(os.path.join(hls_dir, name), "wb") as segment:
+                segment.write(_timestamp_tag(position))
+                for start, end in frames:
+                    segment.write(view[start:end])
+            entries.append((duration, chapter["title"], f"{HLS_DIR}/{name}"))
+            position += duration
+
+    target = max((math.ceil(duration) for duration, _, _ in entries), default=1)
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:3",
+        f"#EXT-X-TARGETDURATION:{target}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+    ]
+    for duration, title, uri in entries:
+        lines += [f"#EXTINF:{duration:.3f},{title}", uri]
+    lines.append("#EXT-X-ENDLIST")
+
+    path = os.path.join(output_dir, PLAYLIST_NAME)
+    with open(path, "w", encoding="utf-8") as playlist:
+        playlist.write("\n".join(lines) + "\n")
+    return path
+
+
+def _load_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    """Read the previous manifest, keyed by section."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return {entry["key"]: entry for entry in manifest.get("sections", [])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def render_chapters(
+    tts: BaseTTS,
+    script: str,
+    output_dir: str,
+    voice_id: Optional[str] = None,
+    sections: Optional[Iterable[Tuple[str, str, float]]] = None,
+    segment_duration: float = 10.0,
+    **kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Render a script as chapterized output.
+
+    Every section is synthesized into its own file. Sections whose text and
+    audio settings are unchanged since the last render into output_dir are
+    reused, so editing one section and rendering again only synthesizes
+    that section. A re-rendered section replaces the old file only once it
+    is complete. The joined episode, chapters and HLS playlist are rebuilt
+    from the section files at frame level, without decoding.
+
+    Args:
+        tts (BaseTTS): TTS provider producing MP3
+        script (str): Script text, split with split_sections
+        output_dir (str): Directory for the output files
+        voice_id (Optional[str]): Voice override
+        sections (Optional[Iterable[Tuple[str, str, float]]]): (key, title,
+            share) of each section (default: PodcastPromptTemplate.SECTIONS)
+        segment_duration (float): Target HLS segment length in seconds
+            (default: 10)
+        **kwargs: Additional TTS-specific parameters
+
+    Returns:
+        Dict[str, Any]: Paths of the episode ('path'), 'chapters',
+            'playlist' and 'manifest', total 'duration' and 'size', and per
+            section its 'key', 'title', 'path', 'start', 'duration' and
+            whether it was 'rendered' this time
+
+    Raises:
+        ValueError: If the TTS provider does not produce MP3
+    """
+    output_format = getattr(tts, "output_format", "mp3")
+    if output_format != "mp3":
+        raise ValueError(f"Chapterized output needs MP3 audio, not {output_format}")
+
+    sections_dir = os.path.join(output_dir, SECTIONS_DIR)
+    os.makedirs(sections_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = _load_manifest(manifest_path)
+
+    parts = split_sections(script, sections or PodcastPromptTemplate.SECTIONS)
+    if not parts:
+        return {"success": False, "error": "Script is empty", "path": None, "size": 0}
+
+    chapters = []
+    section_audio = []
+    start = 0.0
+    for key, title, text in parts:
+        fingerprint = section_fingerprint(tts, text, voice_id)
+        path = os.path.join(sections_dir, f"{key}.mp3")
+        entry = previous.get(key, {})
+        rendered = not (
+            entry.get("fingerprint") == fingerprint and os.path.exists(path)
+        )
+
+        if rendered:
+            logger.info(f"Rendering section {key}")
+            partial_path = os.path.join(sections_dir, f"{key}.partial.mp3")
+            if getattr(tts, "voices", None):
+                result = tts.generate_dialogue(
+                    script=text, output_path=partial_path, **kwargs
+                )
+            else:
+                result = tts.generate_audio(
+                    text=text, output_path=partial_path, voice_id=voice_id, **kwargs
+                )
+            if not result.get("success", True) or not os.path.exists(partial_path):
+                error = result.get("error", "no audio")
+                return {
+                    "success": False,
+                    "error": f"Section {key} failed: {error}",
+                    "path": None,
+                    "size": 0,
+                }
+            os.replace(partial_path, path)
+
+        with open(path, "rb") as f:
+            audio = f.read()
+        duration = sum(header.duration for _, header in iter_frames(audio))
+        section_audio.append(audio)
+        chapters.append(
+            {
+                "key": key,
+                "title": title,
+                "path": path,
+                "start": start,
+                "duration": duration,
+                "rendered": rendered,
+                "fingerprint": fingerprint,
+            }
+        )
+        start += duration
+
+    # Files of sections the script no longer has
+    current = {chapter["path"] for chapter in chapters}
+    for path in glob.glob(os.path.join(sections_dir, "*.mp3")):
+        if path not in current:
+            os.remove(path)
+
+    episode_path = os.path.join(output_dir, EPISODE_NAME)
+    size = _write_episode(section_audio, chapters, episode_path)
+    playlist_path = _write_hls(section_audio, chapters, output_dir, segment_duration)
+
+    chapters_path = os.path.join(output_dir, CHAPTERS_NAME)
+    with open(chapters_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": "1.2.0",
+                "chapters": [
+                    {
+                        "startTime": round(chapter["start"], 3),
+                        "endTime": round(chapter["start"] + chapter["duration"], 3),
+                        "title": chapter["title"],
+                    }
+                    for chapter in chapters
+                ],
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "sections": [
+                    {
+                        "key": chapter["key"],
+                        "title": chapter["title"],
+                        "file": f"{SECTIONS_DIR}/{chapter['key']}.mp3",
+                        "fingerprint": chapter["fingerprint"],
+                        "duration": chapter["duration"],
+                    }
+                    for chapter in chapters
+                ]
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    return {
+        "success": True,
+        "path": episode_path,
+        "size": size,
+        "duration": start,
+        "chapters": chapters_path,
+        "playlist": playlist_path,
+        "manifest": manifest_path,
+        "sections": [
+            {
+                key: chapter[key]
+                for key in ("key", "title", "path", "start", "duration", "rendered")
+            }
+            for chapter in chapters
+        ],
+    }
@@ -0,0 +1,396 @@
+"""
+Offline stand-in providers for testing and load testing.
+
+FakeLLM and FakeTTS implement the provider interfaces without network
+access: scripts are derived deterministically from the input text and
+audio is valid silent MP3 of realistic duration. Latency follows a
+configurable distribution, so the whole generation path can be
+benchmarked without spending provider quota.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from .base import BaseLLM
+from .cache import AudioCache
+from .mp3 import silent_mp3
+from .prompts import PodcastPromptBuilder
+from .tokens import estimate_tokens, record_usage, usage_tracked
+from .tts import ChunkedTTS
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+_WORDS = (
+    "energy system model signal process result method structure analysis "
+    "network pattern theory value field measure sample layer function data "
+    "balance surface control design factor source change level range effect"
+).split()
+
+
+class LatencyModel:
+    """Samples request latencies from a configurable distribution."""
+
+    DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal")
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        distribution: str = "constant",
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize latency model.
+
+        Args:
+            latency (float): Typical latency in seconds (mean; median for
+                "lognormal")
+            jitter (float): Spread in seconds ("uniform": half width, "normal":
+                standard deviation) or sigma of the logarithm ("lognormal")
+            distribution (str): "constant", "uniform", "normal" or "lognormal"
+            seed (Optional[int]): Seed for reproducible latency sequences
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unsupported latency distribution: {distribution}")
+        self.latency = latency
+        self.jitter = jitter
+        self.distribution = distribution
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """
+        Draw one latency.
+
+        Returns:
+            float: Latency in seconds (never negative)
+        """
+        if self.latency <= 0 and self.jitter <= 0:
+            return 0.0
+        with self._lock:
+            if self.distribution == "uniform":
+                value = self._random.uniform(
+                    self.latency - self.jitter, self.latency + self.jitter
+                )
+            elif self.distribution == "normal":
+                value = self._random.gauss(self.latency, self.jitter)
+            elif self.distribution == "lognormal":
+                value = self.latency * self._random.lognormvariate(0.0, self.jitter)
+            else:
+                value = self.latency
+        return max(0.0, value)
+
+
+def fake_script(seed_text: str, length: int) -> str:
+    """
+    Build a deterministic script of exactly the given length.
+
+    Args:
+        seed_text (str): Text the script is derived from
+        length (int): Script length in characters
+
+    Returns:
+        str: Sentences of filler words; equal inputs give equal scripts
+    """
+    digest = hashlib.sha256(seed_text.encode("utf-8")).digest()
+    rng = random.Random(digest)
+
+    sentences = []
+    total = 0
+    while total < length:
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(6, 18))]
+        sentence = " ".join(words).capitalize() + "."
+        sentences.append(sentence)
+        total += len(sentence) + 1
+
+    script = " ".join(sentences)[:length].rstrip()
+    if script and not script.endswith("."):
+        script = script[:-1] + "."
+    return script.ljust(length, ".")
+
+
+class FakeLLM(BaseLLM):
+    """
+    Deterministic offline LLM.
+
+    The script depends only on the prompt, so repeated runs give identical
+    output. A call takes one latency sample (time to first token) plus the
+    output time at tokens_per_second, if set.
+    """
+
+    def __init__(
+        self,
+        script_length: Optional[int] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        latency_distribution: str = "constant",
+        tokens_per_second: Optional[float] = None,
+        stream_fragment_length: int = 40,
+        seed: Optional[int] = None,
+        prompt_builder: Optional[PodcastPromptBuilder] = None,
+        max_input_tokens: Optional[int] = None,
+        **kwargs: Dict[str, Any],
+    ):
+        """
+        Initialize fake LLM.
+
+        Args:
+            script_length (Optional[int]): Script length in characters
+                (default: the requested min_length)
+            latency (float): Typical time to first token in seconds (default: 0)
+            latency_jitter (float): Latency spread, see LatencyModel (default: 0)
+            latency_distribution (str): "constant", "uniform", "normal" or
+                "lognormal" (default: "constant")
+            tokens_per_second (Optional[float]): Output speed; unlimited if not set
+            stream_fragment_length (int): Characters per streamed fragment
+                (default: 40)
+            seed (Optional[int]): Seed for reproducible latencies
+            prompt_builder (Optional[PodcastPromptBuilder]): Custom prompt builder
+            max_input_tokens (Optional[int]): Token budget for a single prompt
+            **kwargs: Options of other providers, ignored
+        """
+        super().__init__(
+            prompt_builder or PodcastPromptBuilder(),
+            max_input_tokens=max_input_tokens,
+        )
+        self.script_length = script_length
+        self.latency = LatencyModel(
+            latency, latency_jitter, latency_distribution, seed=seed
+        )
+        self.tokens_per_second = tokens_per_second
+        self.stream_fragment_length = max(1, stream_fragment_length)
+        if kwargs:
+            logger.debug(f"FakeLLM ignores options: {', '.join(sorted(kwargs))}")
+
+    def _respond(
+        self,
+        text: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """Build the prompt, record usage and return the script for it."""
+        if not text or not text.strip():
+            raise ValueError("Input text cannot be empty")
+
+        prompt = self.prompt_builder.build_prompt(
+            text=text,
+            complexity=complexity,
+            target_audience=target_audience,
+            min_length=min_length,
+            **kwargs,
+        )
+        script = fake_script(prompt, self.script_length or min_length)
+        record_usage(estimate_tokens(prompt), estimate_tokens(script), estimated=True)
+        return script
+
+    def _output_time(self, text: str) -> float:
+        if not self.tokens_per_second:
+            return 0.0
+        return estimate_tokens(text) / self.tokens_per_second
+
+    @usage_tracked
+    def generate_podcast_script(
+        self,
+        text: str,
+        complexity: str = "intermediate",
+        target_audience: str = "general",
+        min_length: int = 10000,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Generate a deterministic podcast script.
+
+        Args:
+            text (str): Input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Generated script
+        """
+        script = self._respond(text, complexity, target_audience, min_length, **kwargs)
+        time.sleep(self.latency.sample() + self._output_time(script))
+        return script
+
+    @usage_tracked
+    async def agenerate_podcast_script(
+        self,
+        text: str,
+        complexity: str = "intermediate",
+        target_audience: str = "general",
+        min_length: int = 10000,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Asynchronously generate a deterministic podcast script.
+
+        Args:
+            text (str): Input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Generated script
+        """
+        script = self._respond(text, complexity, target_audience, min_length, **kwargs)
+        await asyncio.sleep(self.latency.sample() + self._output_time(script))
+        return script
+
+    @usage_tracked
+    def stream_podcast_script(
+        self,
+        text: str,
+        complexity: str = "intermediate",
+        target_audience: str = "general",
+        min_length: int = 10000,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Generate a deterministic podcast script as a stream of fragments.
+
+        Args:
+            text (str): Input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            **kwargs: Additional prompt parameters
+
+        Yields:
+            str: Script fragments in order
+        """
+        script = self._respond(text, complexity, target_audience, min_length, **kwargs)
+        time.sleep(self.latency.sample())
+
+        step = self.stream_fragment_length
+        for start in range(0, len(script), step):
+            fragment = script[start : start + step]
+            time.sleep(self._output_time(fragment))
+            yield fragment
+
+
+class FakeTTS(ChunkedTTS):
+    """
+    Offline TTS producing silent MP3 audio.
+
+    Each chunk becomes silence lasting as long as the text would take to
+    read at characters_per_second, encoded as valid MPEG-1 Layer III frames
+    (32 kbps, 44.1 kHz, mono), so merging and validation behave as with
+    real providers.
+    """
+
+    def __init__(
+        self,
+        characters_per_second: float = 15.0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        latency_distribution: str = "constant",
+        latency_per_character: float = 0.0,
+        seed: Optional[int] = None,
+        max_chunk_length: int = 3000,
+        max_concurrency: int = 4,
+        max_buffer_bytes: int = 64 * 1024 * 1024,
+        voices: Optional[Dict[str, str]] = None,
+        postprocess: Optional[Dict[str, Any]] = None,
+        temp_dir: str = "temp",
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = 512 * 1024 * 1024,
+        output_format: str = "mp3",
+        bitrate: Optional[str] = None,
+        pcm: bool = False,
+        **kwargs: Dict[str, Any],
+    ):
+        """
+        Initialize fake TTS.
+
+        Args:
+            characters_per_second (float): Speaking rate that determines audio
+                duration (default: 15, about 150 words per minute)
+            latency (float): Typical latency per chunk request in seconds
+                (default: 0)
+            latency_jitter (float): Latency spread, see LatencyModel (default: 0)
+            latency_distribution (str): "constant", "uniform", "normal" or
+                "lognormal" (default: "constant")
+            latency_per_character (float): Additional latency per character of
+                the chunk in seconds, as synthesis time grows with text length
+                (default: 0)
+            seed (Optional[int]): Seed for reproducible latencies
+            max_chunk_length (int): Maximum text length per chunk (default: 3000)
+            max_concurrency (int): Maximum chunk requests in flight (default: 4)
+            max_buffer_bytes (int): Chunk audio of one job kept in memory before
+                spilling to temp_dir (default: 64 MiB)
+            voices (Optional[Dict[str, str]]): Speaker name -> voice for
+                dialogue scripts
+            postprocess (Optional[Dict[str, Any]]): PostProcessor options for
+                ffmpeg post-processing of the assembled audio
+            temp_dir (str): Directory for chunks spilled from memory (default: "temp")
+            cache_dir (Optional[str]): Directory for caching synthesized chunks;
+                caching is disabled if not set
+            cache_max_bytes (int): Maximum size of the audio cache in bytes
+                (default: 512 MiB)
+            output_format (str): "mp3", "ogg", "opus", "aac" or "m4a"
+                (default: "mp3"); other formats are encoded once from the
+                MP3 chunks, as with Polly
+            bitrate (Optional[str]): Output bitrate, e.g. "32k" (default:
+                unchanged MP3 chunks)
+            pcm (bool): Encode from 16 kHz PCM chunks instead, as with Polly
+                (default: False)
+            **kwargs: Options of other providers, ignored
+        """
+        self.characters_per_second = characters_per_second
+        self.latency = LatencyModel(
+            latency, latency_jitter, latency_distribution, seed=seed
+        )
+        self.latency_per_character = latency_per_character
+        self.max_chunk_length = max_chunk_length
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_buffer_bytes = max_buffer_bytes
+        self.voices = voices
+        self._configure_output(
+            output_format,
+            bitrate,
+            postprocess,
+            pcm_sample_rate=16000 if pcm else None,
+        )
+        self.temp_dir = temp_dir
+        if cache_dir:
+            self.audio_cache = AudioCache(cache_dir, max_bytes=cache_max_bytes)
+        if kwargs:
+            logger.debug(f"FakeTTS ignores options: {', '.join(sorted(kwargs))}")
+
+        # Create temp directory if it doesn't exist
+        os.makedirs(temp_dir, exist_ok=True)
+
+    def _audio_cache_key(self, text: str, voice: Optional[str] = None) -> str:
+        return AudioCache.make_key(
+            "fake", voice, str(self.characters_per_second), text, self.chunk_format
+        )
+
+    def _generate_chunk(self, text: str, voice: Optional[str] = None) -> bytes:
+        """
+        Generate silent audio for a single text chunk.
+
+        Args:
+            text (str): Text to convert
+            voice (Optional[str]): Ignored
+
+        Returns:
+            bytes: Silent audio in chunk_format
+        """
+        time.sleep(self.latency.sample() + len(text) * self.latency_per_character)
+        duration = len(text) / self.characters_per_second
+        if self.chunk_format == "pcm":
+            return bytes(2 * round(duration * self.chunk_sample_rate))
+        return silent_mp3(duration)
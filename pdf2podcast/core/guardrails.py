@@ -0,0 +1,253 @@
+"""
+Output guardrails for generated podcast scripts.
+"""
+
+import logging
+import re
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional
+
+from .base import StructuredPrompt
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Content the generation prompts forbid. Every pattern must match at most
+# MAX_MATCH_LENGTH characters, so streamed text can be checked over a
+# sliding window.
+DEFAULT_PATTERNS = [
+    # Audio cues in brackets or parentheses: "[SFX: whoosh]", "(music swells)".
+    # The cue keyword must open the brackets, so parenthetical prose such as
+    # "(the speed of sound is 343 m/s)" is left alone.
+    r"[(\[]\s*(?:sfx|sound\s+effects?|music|jingle|applause|whoosh|swoosh|chime)\b"
+    r"[^()\[\]\n]{0,60}[)\]]",
+    # Audio cues in markdown emphasis: "*music swells*"
+    r"\*\s*(?:sfx|sound\s+effects?|music|jingle)\b[^*\n]{0,40}\*",
+    r"\b(?:intro|outro|theme)\s+(?:music|jingle|song)\b",
+    r"\b(?:whoosh|swoosh)\b",
+    r"\bwelcome\s+(?:back\s+)?to\s+(?:the|our|this|today's)\s+(?:show|podcast|episode)\b",
+    r"\bthanks?\s+(?:you\s+)?(?:so\s+much\s+)?for\s+(?:listening|tuning\s+in)\b",
+    # References to visual elements, matched as the whole sentence so that
+    # scrubbing does not leave a fragment behind
+    r"[^.!?\n]{0,60}\b(?:see|shown\s+in|refer\s+to)\s+(?:the\s+)?"
+    r"(?:(?:figure|fig\.)\s*(?:\d+|above|below)|diagram\b)[^.!?\n]{0,60}[.!?]?",
+]
+
+# Upper bound of the length of a single violation, in characters
+MAX_MATCH_LENGTH = 160
+
+
+class GuardrailViolation(Exception):
+    """Raised when generated text contains forbidden content."""
+
+    def __init__(self, text: str, position: int):
+        """
+        Initialize violation.
+
+        Args:
+            text (str): Offending text
+            position (int): Offset of the offending text in the output
+        """
+        super().__init__(f"Forbidden content in script: {text!r}")
+        self.text = text
+        self.position = position
+
+
+class ScriptGuardrail:
+    """
+    Detects forbidden content in generated scripts, including while streaming.
+
+    All patterns are compiled into a single case-insensitive regular
+    expression, so each piece of text is scanned once regardless of the
+    number of patterns. Streamed fragments are checked over a sliding window
+    of the last window characters, so checking cost does not grow with the
+    length of the output.
+    """
+
+    def __init__(
+        self, patterns: Optional[List[str]] = None, window: int = MAX_MATCH_LENGTH
+    ):
+        """
+        Initialize guardrail.
+
+        Args:
+            patterns (Optional[List[str]]): Regular expressions of forbidden
+                content (default: DEFAULT_PATTERNS)
+            window (int): Maximum length of a violation in characters
+                (default: MAX_MATCH_LENGTH)
+        """
+        self.patterns = list(patterns or DEFAULT_PATTERNS)
+        self.window = window
+        alternation = "|".join(f"(?:{pattern})" for pattern in self.patterns)
+        self.regex = re.compile(alternation, re.IGNORECASE)
+        # Also consumes the whitespace before a violation when removing it
+        self._scrub_regex = re.compile(f"[ \t]*(?:{alternation})", re.IGNORECASE)
+
+    def find(self, text: str) -> Optional[GuardrailViolation]:
+        """
+        Find the first violation in a complete text.
+
+        Args:
+            text (str): Text to check
+
+        Returns:
+            Optional[GuardrailViolation]: First violation, or None
+        """
+        match = self.regex.search(text)
+        if match is None:
+            return None
+        return GuardrailViolation(match.group(0), match.start())
+
+    def _check(self, tail: str, offset: int, fragment: str) -> str:
+        """
+        Check a streamed fragment following the already checked text.
+
+        Args:
+            tail (str): Last window characters of the text before the fragment
+            offset (int): Length of the text before the fragment
+            fragment (str): Fragment to check
+
+        Returns:
+            str: Tail of the text including the fragment
+
+        Raises:
+            GuardrailViolation: If the fragment completes forbidden content
+        """
+        text = tail + fragment
+        # Matches entirely within the tail were already checked
+        for match in self.regex.finditer(text):
+            if match.end() > len(tail):
+                raise GuardrailViolation(
+                    match.group(0), offset - len(tail) + match.start()
+                )
+        return text[-self.window :]
+
+    def monitor(self, fragments: Iterable[str]) -> Iterator[str]:
+        """
+        Pass streamed fragments through, aborting at the first violation.
+
+        The source is closed when a violation is found, which stops a
+        streaming model request.
+
+        Args:
+            fragments (Iterable[str]): Streamed text fragments
+
+        Yields:
+            str: Fragments checked so far
+
+        Raises:
+            GuardrailViolation: As soon as forbidden content has arrived
+        """
+        iterator = iter(fragments)
+        tail = ""
+        offset = 0
+        try:
+            for fragment in iterator:
+                tail = self._check(tail, offset, fragment)
+                offset += len(fragment)
+                yield fragment
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    async def amonitor(self, fragments: AsyncIterable[str]) -> AsyncIterator[str]:
+        """
+        Async counterpart of monitor.
+
+        Args:
+            fragments (AsyncIterable[str]): Streamed text fragments
+
+        Yields:
+            str: Fragments checked so far
+
+        Raises:
+            GuardrailViolation: As soon as forbidden content has arrived
+        """
+        iterator = fragments.__aiter__()
+        tail = ""
+        offset = 0
+        try:
+            async for fragment in iterator:
+                tail = self._check(tail, offset, fragment)
+                offset += len(fragment)
+                yield fragment
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def scrub(self, text: str) -> str:
+        """
+        Remove all violations from a text.
+
+        Args:
+            text (str): Text to clean
+
+        Returns:
+            str: Text without forbidden content
+        """
+        return self._scrub_regex.sub("", text)
+
+    def scrub_stream(self, fragments: Iterable[str]) -> Iterator[str]:
+        """
+        Remove violations from streamed text, holding back one window of text.
+
+        Used where output has already been handed on and the request cannot
+        be repeated (e.g. streaming into TTS).
+
+        Args:
+            fragments (Iterable[str]): Streamed text fragments
+
+        Yields:
+            str: Cleaned text, delayed by at most window characters
+        """
+        pending = ""
+        for fragment in fragments:
+            pending += fragment
+            # Text followed by a full window is final: any violation starting
+            # there has fully arrived
+            cut = len(pending) - self.window
+            if cut <= 0:
+                continue
+            for match in self._scrub_regex.finditer(pending):
+                if match.start() < cut < match.end():
+                    cut = match.start()
+            ready = self._scrub_logged(pending[:cut])
+            pending = pending[cut:]
+            if ready:
+                yield ready
+
+        pending = self._scrub_logged(pending)
+        if pending:
+            yield pending
+
+    def _scrub_logged(self, text: str) -> str:
+        if self.regex.search(text) is None:
+            return text
+        logger.warning("Removed forbidden content from streamed script")
+        return self.scrub(text)
+
+    @staticmethod
+    def corrective_prompt(prompt: str, violation: GuardrailViolation) -> str:
+        """
+        Extend a prompt with an instruction correcting a violation.
+
+        The correction is appended to the dynamic content, so the static
+        instructions of a structured prompt remain reusable.
+
+        Args:
+            prompt (str): Prompt that produced the violation
+            violation (GuardrailViolation): Detected violation
+
+        Returns:
+            str: Corrected prompt
+        """
+        correction = f"""
+        IMPORTANT: A previous answer to this request was rejected because it
+        contained "{violation.text}". Do NOT include sound effects, music,
+        audio cues, greetings, sign-offs or references to visual elements.
+        Write pure narration only.
+        """
+        if isinstance(prompt, StructuredPrompt):
+            return StructuredPrompt(prompt.system, prompt.content + correction)
+        return prompt + correction
@@ -4,64 +4,119 @@ Large Language Model (LLM) implementations for pdf2podcast.
 
 import os
 import re
+import math
 import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, Callable
-from functools import wraps
+import weakref
+import threading
+import itertools
+import contextlib
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterator, List, Tuple
 from dotenv import load_dotenv
 
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
-from google.api_core import retry
-from google.api_core.exceptions import GoogleAPIError
-from .base import BaseLLM
+from google.api_core import exceptions as google_exceptions
+from .base import BaseLLM, BasePromptBuilder, StructuredPrompt
+from .cache import ResponseCache
+from .guardrails import GuardrailViolation, ScriptGuardrail
+from .ratelimit import get_rate_limiter
+from .retry import RetryPolicy, get_circuit_breaker
+from .text import split_sentences
+from .tokens import estimate_tokens, record_usage, usage_tracked
 from .prompts import PodcastPromptBuilder
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
-def retry_on_exception(
-    retries: int = 3,
-    delay: float = 1.0,
-    backoff: float = 2.0,
-    exceptions: tuple = (GoogleAPIError,),
-) -> Callable:
+# Errors of a model request worth retrying. Current clients classify API
+# errors as LangChain model errors; older ones let the transient
+# google-api-core errors through.
+_RETRYABLE_ERRORS: Tuple[type, ...] = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServerError,
+    google_exceptions.DeadlineExceeded,
+    ConnectionError,
+    TimeoutError,
+)
+try:
+    from langchain_core.exceptions import (
+        ModelAPIError,
+        ModelConnectionError,
+        ModelRateLimitError,
+        ModelTimeoutError,
+    )
+
+    _RETRYABLE_ERRORS += (
+        ModelRateLimitError,
+        ModelAPIError,
+        ModelConnectionError,
+        ModelTimeoutError,
+    )
+except ImportError:
+    pass
+
+
+def _text_spans(text: str, boundary: str) -> List[Tuple[int, int]]:
+    """Return (start, end) of the non-blank pieces of text between boundaries."""
+    matches = list(re.finditer(boundary, text))
+    starts = [0] + [match.end() for match in matches]
+    ends = [match.start() for match in matches] + [len(text)]
+    spans = []
+    for start, end in zip(starts, ends):
+        piece = text[start:end]
+        if piece.strip():
+            start += len(piece) - len(piece.lstrip())
+            end -= len(piece) - len(piece.rstrip())
+            spans.append((start, end))
+    return spans
+
+
+# Process-wide cap on concurrent async model requests. asyncio semaphores are
+# bound to an event loop, so one semaphore is kept per running loop.
+_max_in_flight = 16
+_request_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def set_max_in_flight(limit: int) -> None:
     """
-    Retry decorator with exponential backoff.
+    Set the process-wide maximum number of in-flight async model requests.
+
+    Applies to event loops that have not issued a request yet.
 
     Args:
-        retries (int): Maximum number of retries
-        delay (float): Initial delay between retries in seconds
-        backoff (float): Backoff multiplier
-        exceptions (tuple): Exceptions to catch
+        limit (int): Maximum concurrent requests per event loop
     """
+    global _max_in_flight
+    if limit < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    _max_in_flight = limit
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            retry_delay = delay
-            last_exception = None
-
-            for i in range(retries):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if i < retries - 1:
-                        logger.warning(
-                            f"Attempt {i + 1}/{retries} failed: {str(e)}. "
-                            f"Retrying in {retry_delay:.1f}s..."
-                        )
-                        time.sleep(retry_delay)
-                        retry_delay *= backoff
-                    else:
-                        logger.error(f"All {retries} attempts failed.")
 
-            raise last_exception
+# Provider-side cached contents of static prompt prefixes, shared by all
+# instances: prefix key -> (cache name, expiry time). Prefixes the provider
+# refused to cache (e.g. below its minimum size, or on a transient error)
+# map to (None, time of the next attempt). Each prefix has its own lock, so
+# only requests for a prefix being cached wait for the provider.
+_context_caches: Dict[str, Tuple[Optional[str], float]] = {}
+_context_cache_locks: Dict[str, threading.Lock] = {}
+_context_caches_lock = threading.Lock()
 
-        return wrapper
 
-    return decorator
+def _request_semaphore() -> asyncio.Semaphore:
+    """Return the request semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_max_in_flight)
+        _request_semaphores[loop] = semaphore
+    return semaphore
 
 
 class GeminiLLM(BaseLLM):
@@ -69,6 +124,14 @@ class GeminiLLM(BaseLLM):
     Google's Gemini-based LLM implementation with optimized content generation.
     """
 
+    # Sectional expansion: maximum number of script sections, and minimum
+    # shortfall (characters) for a section to be worth an expansion request
+    MAX_EXPANSION_SECTIONS = 8
+    MIN_SECTION_SHORTFALL = 200
+
+    # Seconds before caching a prompt prefix is tried again after a failure
+    CONTEXT_CACHE_RETRY_DELAY = 300.0
+
     def __init__(
         self,
         api_key: str = None,
@@ -78,6 +141,27 @@ class GeminiLLM(BaseLLM):
         max_output_tokens: int = 4096,
         streaming: bool = False,
         prompt_builder: PodcastPromptBuilder = None,
+        generation_mode: str = "single",
+        map_chunk_size: int = 12000,
+        max_concurrency: int = 4,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 1000,
+        max_in_flight: Optional[int] = None,
+        max_input_tokens: Optional[int] = None,
+        token_counter: str = "estimate",
+        expansion_mode: str = "sectional",
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        rate_limit_dir: Optional[str] = None,
+        max_retries: int = 3,
+        request_timeout: Optional[float] = None,
+        retry_deadline: Optional[float] = None,
+        context_cache: bool = False,
+        context_cache_ttl: int = 3600,
+        guardrail: bool = False,
+        guardrail_patterns: Optional[List[str]] = None,
+        guardrail_retries: int = 2,
     ):
         """
         Initialize Gemini LLM system.
@@ -90,8 +174,100 @@ class GeminiLLM(BaseLLM):
             max_output_tokens (int): Maximum output length (default: 4096)
             streaming (bool): Whether to use streaming mode (default: False)
             prompt_builder (Optional[PodcastPromptBuilder]): Custom prompt builder
+            generation_mode (str): "single" sends the whole text in one prompt,
+                "map_reduce" summarizes text sections concurrently and composes the
+                script from the notes, "auto" uses map-reduce only for texts longer
+                than map_chunk_size (default: "single")
+            map_chunk_size (int): Maximum characters per section in map-reduce mode
+                (default: 12000)
+            max_concurrency (int): Maximum concurrent section requests (default: 4)
+            cache_path (Optional[str]): SQLite file for caching responses; caching
+                is disabled when not set (default: None)
+            cache_ttl (Optional[float]): Cached response lifetime in seconds
+                (default: no expiry)
+            cache_max_entries (int): Maximum number of cached responses (default: 1000)
+            max_in_flight (Optional[int]): Process-wide cap on concurrent async
+                requests; leaves the current limit (16) unchanged when not set
+            max_input_tokens (Optional[int]): Token budget for a single prompt.
+                Oversized prompts switch to map-reduce in "auto" mode and are
+                truncated at a sentence boundary otherwise (default: no budget)
+            token_counter (str): "estimate" for a local character-based count or
+                "model" to ask the Gemini API (default: "estimate")
+            expansion_mode (str): How scripts shorter than min_length are expanded:
+                "sectional" expands only the short sections concurrently, "full"
+                rewrites the whole script (default: "sectional")
+            requests_per_minute (Optional[float]): Request quota shared by all
+                instances using the same model (default: unlimited)
+            tokens_per_minute (Optional[float]): Input token quota shared by all
+                instances using the same model (default: unlimited)
+            rate_limit_dir (Optional[str]): Directory holding the quota state, to
+                share it between processes on the host (default: per process)
+            max_retries (int): Maximum attempts per model request (default: 3)
+            request_timeout (Optional[float]): Deadline of a single request in
+                seconds (default: client default)
+            retry_deadline (Optional[float]): Deadline of a request including all
+                retries in seconds (default: none)
+            context_cache (bool): Store the static instructions of structured
+                prompts as Gemini cached content and reference them instead of
+                resending them; falls back to a system instruction if the
+                prefix cannot be cached (default: False)
+            context_cache_ttl (int): Lifetime of cached content in seconds
+                (default: 3600)
+            guardrail (bool): Check generated scripts for forbidden content
+                (audio cues, greetings, visual references) while they stream,
+                aborting and re-prompting on a violation (default: False)
+            guardrail_patterns (Optional[List[str]]): Regular expressions of
+                forbidden content (default: pdf2podcast.core.guardrails.DEFAULT_PATTERNS)
+            guardrail_retries (int): Corrective re-prompts before violations are
+                removed from the last answer instead (default: 2)
         """
-        super().__init__(prompt_builder or PodcastPromptBuilder())
+        response_cache = None
+        if cache_path:
+            response_cache = ResponseCache(
+                cache_path, ttl=cache_ttl, max_entries=cache_max_entries
+            )
+        super().__init__(
+            prompt_builder or PodcastPromptBuilder(),
+            response_cache,
+            max_input_tokens=max_input_tokens,
+        )
+
+        if generation_mode not in ("single", "map_reduce", "auto"):
+            raise ValueError(f"Unsupported generation mode: {generation_mode}")
+        if token_counter not in ("estimate", "model"):
+            raise ValueError(f"Unsupported token counter: {token_counter}")
+        if expansion_mode not in ("sectional", "full"):
+            raise ValueError(f"Unsupported expansion mode: {expansion_mode}")
+
+        self.expansion_mode = expansion_mode
+        self.rate_limiter = get_rate_limiter(
+            f"gemini-{model_name}",
+            requests_per_minute=requests_per_minute,
+            units_per_minute=tokens_per_minute,
+            state_dir=rate_limit_dir,
+        )
+        # Retries apply to each model request; the breaker is shared by all
+        # instances using the same model
+        self.retry_policy = RetryPolicy(
+            max_attempts=max_retries,
+            attempt_timeout=request_timeout,
+            total_timeout=retry_deadline,
+            retry_on=_RETRYABLE_ERRORS,
+            breaker=get_circuit_breaker(f"gemini-{model_name}"),
+            name=f"gemini-{model_name}",
+        )
+
+        self.token_counter = token_counter
+        self.context_cache = context_cache
+        self.context_cache_ttl = context_cache_ttl
+        self.guardrail = ScriptGuardrail(guardrail_patterns) if guardrail else None
+        self.guardrail_retries = max(0, guardrail_retries)
+
+        self.generation_mode = generation_mode
+        self.map_chunk_size = map_chunk_size
+        self.max_concurrency = max(1, max_concurrency)
+        if max_in_flight is not None:
+            set_max_in_flight(max_in_flight)
 
         if api_key is None:
             load_dotenv()
@@ -99,6 +275,17 @@ class GeminiLLM(BaseLLM):
             if not api_key:
                 raise ValueError("No API key provided and GENAI_API_KEY not found")
 
+        self.api_key = api_key
+        self.model_name = model_name
+
+        # Parameters that change the response, part of the cache key
+        self.model_params = {
+            "model": model_name,
+            "temperature": temperature,
+            "top_p": top_p,
+            "max_output_tokens": max_output_tokens,
+        }
+
         self.llm = ChatGoogleGenerativeAI(
             model=model_name,
             temperature=temperature,
@@ -106,6 +293,10 @@ class GeminiLLM(BaseLLM):
             max_output_tokens=max_output_tokens,
             streaming=streaming,
             google_api_key=api_key,
+            timeout=request_timeout,
+            # Retries are left to retry_policy, so attempts are not multiplied;
+            # the client treats 0 as "use its default", 1 is a single attempt
+            max_retries=1,
         )
 
     def _clean_text(self, text: str) -> str:
@@ -133,13 +324,939 @@ class GeminiLLM(BaseLLM):
         processed = re.sub(r"\s+", " ", processed)
         return processed.strip()
 
-    @retry_on_exception()
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the tokens of a text.
+
+        Args:
+            text (str): Text to measure
+
+        Returns:
+            int: Token count (model count or local estimate)
+        """
+        if self.token_counter == "model":
+            try:
+                return self.llm.get_num_tokens(text)
+            except Exception as e:
+                logger.warning(f"Token counting failed, using estimate: {str(e)}")
+        return estimate_tokens(text)
+
+    def _record_usage(
+        self, prompt: str, output: str, usage_metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Record the token usage of a model call, estimating it if not reported.
+
+        Args:
+            prompt (str): Rendered prompt
+            output (str): Response text
+            usage_metadata (Optional[Dict[str, Any]]): Usage reported by the model
+        """
+        if usage_metadata:
+            record_usage(
+                usage_metadata.get("input_tokens", 0),
+                usage_metadata.get("output_tokens", 0),
+            )
+        else:
+            record_usage(
+                estimate_tokens(prompt), estimate_tokens(output), estimated=True
+            )
+
+    def _create_context_cache(self, system: str) -> str:
+        """
+        Create Gemini cached content holding a system instruction.
+
+        Args:
+            system (str): Static instructions to cache
+
+        Returns:
+            str: Name of the cached content
+        """
+        try:
+            from google import genai
+            from google.genai import types
+
+            client = genai.Client(api_key=self.api_key)
+            cached = client.caches.create(
+                model=self.model_name,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system,
+                    ttl=f"{self.context_cache_ttl}s",
+                    display_name="pdf2podcast",
+                ),
+            )
+        except ImportError:
+            import datetime
+            import google.generativeai as legacy_genai
+            from google.generativeai import caching
+
+            legacy_genai.configure(api_key=self.api_key)
+            cached = caching.CachedContent.create(
+                model=f"models/{self.model_name}",
+                system_instruction=system,
+                ttl=datetime.timedelta(seconds=self.context_cache_ttl),
+                display_name="pdf2podcast",
+            )
+        return cached.name
+
+    def _cached_prefix(self, system: str) -> Optional[str]:
+        """
+        Return the cached content holding a static prompt prefix, creating it if needed.
+
+        Args:
+            system (str): Static instructions of a structured prompt
+
+        Returns:
+            Optional[str]: Cached content name, or None if the prefix cannot be
+                cached (retried after CONTEXT_CACHE_RETRY_DELAY)
+        """
+        key = hashlib.sha256(f"{self.model_name}\0{system}".encode("utf-8")).hexdigest()
+        with _context_caches_lock:
+            lock = _context_cache_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            entry = _context_caches.get(key)
+            if entry is not None:
+                name, valid_until = entry
+                if name is None and time.time() < valid_until:
+                    return None
+                # Renew shortly before expiry so in-flight requests stay valid
+                if name is not None and time.time() < valid_until - 60:
+                    return name
+
+            try:
+                name = self._create_context_cache(system)
+            except Exception as e:
+                logger.warning(
+                    f"Could not cache prompt instructions, sending them as system "
+                    f"instruction: {str(e)}"
+                )
+                retry_at = time.time() + self.CONTEXT_CACHE_RETRY_DELAY
+                _context_caches[key] = (None, retry_at)
+                return None
+
+            _context_caches[key] = (name, time.time() + self.context_cache_ttl)
+            logger.info(f"Cached prompt instructions as {name}")
+            return name
+
+    def _model_input(self, prompt: str) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Convert a rendered prompt into model input and call arguments.
+
+        Structured prompts send their static instructions as a system
+        instruction, or reference them as cached content when context
+        caching is enabled; plain prompts are sent as they are.
+
+        Args:
+            prompt (str): Rendered prompt
+
+        Returns:
+            Tuple[Any, Dict[str, Any]]: Model input and extra call arguments
+        """
+        if not isinstance(prompt, StructuredPrompt) or not prompt.system:
+            return str(prompt), {}
+
+        if self.context_cache:
+            cached_content = self._cached_prefix(prompt.system)
+            if cached_content is not None:
+                return [HumanMessage(content=prompt.content)], {
+                    "cached_content": cached_content
+                }
+
+        return [
+            SystemMessage(content=prompt.system),
+            HumanMessage(content=prompt.content),
+        ], {}
+
+    def _invoke(self, prompt: str, bypass_cache: bool = False) -> str:
+        """
+        Send a single prompt to the model, going through the response cache.
+
+        Args:
+            prompt (str): Rendered prompt
+            bypass_cache (bool): Skip the cache lookup for this call
+
+        Returns:
+            str: Stripped response text
+        """
+
+        def attempt(rendered: str):
+            if self.rate_limiter:
+                self.rate_limiter.acquire(estimate_tokens(rendered))
+            model_input, call_kwargs = self._model_input(rendered)
+            return self.llm.invoke(model_input, **call_kwargs)
+
+        def invoke(rendered: str) -> str:
+            response = self.retry_policy.call(attempt, rendered)
+            content = response.content.strip()
+            self._record_usage(
+                rendered, content, getattr(response, "usage_metadata", None)
+            )
+            return content
+
+        return self._cached_invoke(
+            prompt, invoke, bypass_cache=bypass_cache, **self.model_params
+        )
+
+    @contextlib.asynccontextmanager
+    async def _admission(self, rendered: str):
+        """Wait for request quota and a slot under the shared in-flight limit."""
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire(estimate_tokens(rendered))
+        async with _request_semaphore():
+            yield
+
+    def _stream(self, prompt: str, bypass_cache: bool = False) -> Iterator[str]:
+        """
+        Stream the response to a single prompt, going through the response cache.
+
+        Args:
+            prompt (str): Rendered prompt
+            bypass_cache (bool): Skip the cache lookup for this call
+
+        Yields:
+            str: Response text fragments
+        """
+
+        def open_stream(rendered: str):
+            # Retrying is only possible until the first fragment is received
+            if self.rate_limiter:
+                self.rate_limiter.acquire(estimate_tokens(rendered))
+            model_input, call_kwargs = self._model_input(rendered)
+            chunks = iter(self.llm.stream(model_input, **call_kwargs))
+            first = next(chunks, None)
+            return ([first] if first is not None else []), chunks
+
+        def stream(rendered: str) -> Iterator[str]:
+            parts = []
+            usage: Dict[str, int] = {}
+            head, rest = self.retry_policy.call(open_stream, rendered)
+            try:
+                for chunk in itertools.chain(head, rest):
+                    # Streamed usage metadata is reported per chunk
+                    metadata = getattr(chunk, "usage_metadata", None) or {}
+                    for name, value in metadata.items():
+                        if isinstance(value, int):
+                            usage[name] = usage.get(name, 0) + value
+                    if isinstance(chunk.content, str) and chunk.content:
+                        parts.append(chunk.content)
+                        yield chunk.content
+            finally:
+                # Also when the consumer aborts (e.g. on a guardrail
+                # violation): the tokens of aborted attempts are billed too
+                self._record_usage(rendered, "".join(parts), usage)
+
+        return self._cached_stream(
+            prompt, stream, bypass_cache=bypass_cache, **self.model_params
+        )
+
+    async def _ainvoke(self, prompt: str, bypass_cache: bool = False) -> str:
+        """
+        Async counterpart of _invoke, limited by the shared request semaphore.
+
+        Only the model request is timed by the retry policy; waiting for
+        quota and for a request slot is not.
+
+        Args:
+            prompt (str): Rendered prompt
+            bypass_cache (bool): Skip the cache lookup for this call
+
+        Returns:
+            str: Stripped response text
+        """
+
+        async def ainvoke(rendered: str) -> str:
+            model_input, call_kwargs = self._model_input(rendered)
+            response = await self.retry_policy.acall(
+                self.llm.ainvoke,
+                model_input,
+                admission=lambda: self._admission(rendered),
+                **call_kwargs,
+            )
+            content = response.content.strip()
+            self._record_usage(
+                rendered, content, getattr(response, "usage_metadata", None)
+            )
+            return content
+
+        return await self._acached_invoke(
+            prompt, ainvoke, bypass_cache=bypass_cache, **self.model_params
+        )
+
+    def _guarded_invoke(self, prompt: str, bypass_cache: bool = False) -> str:
+        """
+        Generate a script, aborting and re-prompting on forbidden content.
+
+        The response is streamed through the guardrail, so a violation stops
+        the request as soon as it appears. After guardrail_retries corrective
+        prompts, violations are removed from the last answer instead.
+
+        Args:
+            prompt (str): Rendered prompt
+            bypass_cache (bool): Skip the cache lookup for this call
+
+        Returns:
+            str: Stripped response text
+        """
+        if self.guardrail is None:
+            return self._invoke(prompt, bypass_cache=bypass_cache)
+
+        for _ in range(self.guardrail_retries):
+            try:
+                fragments = self._stream(prompt, bypass_cache=bypass_cache)
+                return "".join(self.guardrail.monitor(fragments)).strip()
+            except GuardrailViolation as e:
+                logger.warning(f"{str(e)}; aborted generation, re-prompting")
+                prompt = self.guardrail.corrective_prompt(prompt, e)
+
+        return self._scrub(self._invoke(prompt, bypass_cache=bypass_cache))
+
+    async def _astream_guarded(self, prompt: str, bypass_cache: bool = False) -> str:
+        """
+        Stream the response to a single prompt through the guardrail.
+
+        Async counterpart of passing _stream through guardrail.monitor: a
+        violation cancels the request as soon as it appears. The response is
+        collected, so like _ainvoke the retry policy times and retries the
+        whole request, and the request slot is held until it ends. A cached
+        response is checked as a whole.
+
+        Args:
+            prompt (str): Rendered prompt
+            bypass_cache (bool): Skip the cache lookup for this call
+
+        Returns:
+            str: Stripped response text
+
+        Raises:
+            GuardrailViolation: As soon as forbidden content has arrived
+        """
+
+        async def attempt(rendered: str, model_input: Any, **call_kwargs) -> str:
+            parts = []
+            usage: Dict[str, int] = {}
+            chunks = self.llm.astream(model_input, **call_kwargs)
+
+            async def fragments():
+                try:
+                    async for chunk in chunks:
+                        # Streamed usage metadata is reported per chunk
+                        metadata = getattr(chunk, "usage_metadata", None) or {}
+                        for name, value in metadata.items():
+                            if isinstance(value, int):
+                                usage[name] = usage.get(name, 0) + value
+                        if isinstance(chunk.content, str) and chunk.content:
+                            parts.append(chunk.content)
+                            yield chunk.content
+                finally:
+                    aclose = getattr(chunks, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
+
+            try:
+                checked = [
+                    fragment async for fragment in self.guardrail.amonitor(fragments())
+                ]
+            finally:
+                # The tokens of aborted attempts are billed too
+                self._record_usage(rendered, "".join(parts), usage)
+            return "".join(checked).strip()
+
+        async def astream(rendered: str) -> str:
+            model_input, call_kwargs = self._model_input(rendered)
+            return await self.retry_policy.acall(
+                attempt,
+                rendered,
+                model_input,
+                admission=lambda: self._admission(rendered),
+                **call_kwargs,
+            )
+
+        script = await self._acached_invoke(
+            prompt, astream, bypass_cache=bypass_cache, **self.model_params
+        )
+        violation = self.guardrail.find(script)
+        if violation is not None:
+            raise violation
+        return script
+
+    async def _aguarded_invoke(self, prompt: str, bypass_cache: bool = False) -> str:
+        """
+        Async counterpart of _guarded_invoke.
+
+        Args:
+            prompt (str): Rendered prompt
+            bypass_cache (bool): Skip the cache lookup for this call
+
+        Returns:
+            str: Stripped response text
+        """
+        if self.guardrail is None:
+            return await self._ainvoke(prompt, bypass_cache=bypass_cache)
+
+        for _ in range(self.guardrail_retries):
+            try:
+                return await self._astream_guarded(prompt, bypass_cache=bypass_cache)
+            except GuardrailViolation as e:
+                logger.warning(f"{str(e)}; aborted generation, re-prompting")
+                prompt = self.guardrail.corrective_prompt(prompt, e)
+
+        return self._scrub(await self._ainvoke(prompt, bypass_cache=bypass_cache))
+
+    def _scrub(self, script: str) -> str:
+        """Remove forbidden content from a finished script, if guarded."""
+        if self.guardrail is None:
+            return script
+        cleaned = self.guardrail.scrub(script)
+        if cleaned != script:
+            logger.warning("Removed forbidden content from generated script")
+        return cleaned.strip()
+
+    def _prepare_text(self, text: str) -> str:
+        """
+        Validate and clean input text.
+
+        Args:
+            text (str): Raw input text
+
+        Returns:
+            str: Cleaned text
+
+        Raises:
+            ValueError: If the text is empty before or after cleaning
+        """
+        if not text or not text.strip():
+            raise ValueError("Input text cannot be empty")
+
+        processed_text = self._clean_text(text)
+        if not processed_text:
+            raise ValueError("Text cleaning resulted in empty content")
+
+        return processed_text
+
+    def _split_sections(
+        self, text: str, section_size: Optional[int] = None
+    ) -> List[str]:
+        """
+        Split cleaned text into sections of at most section_size characters,
+        breaking on sentence boundaries where possible.
+
+        Args:
+            text (str): Cleaned input text
+            section_size (Optional[int]): Maximum characters per section
+                (default: map_chunk_size)
+
+        Returns:
+            List[str]: Ordered text sections
+        """
+        section_size = section_size or self.map_chunk_size
+        sections = []
+        current = ""
+
+        # Sentences longer than a section are split on word boundaries
+        for sentence in split_sentences(text, section_size):
+            if current and len(current) + len(sentence) + 1 > section_size:
+                sections.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+
+        if current:
+            sections.append(current)
+
+        return sections
+
+    def _use_map_reduce(self, text: str) -> bool:
+        """Decide whether the configured mode requires map-reduce for this text."""
+        if self.generation_mode == "single":
+            return False
+        if self.generation_mode == "auto" and len(text) <= self.map_chunk_size:
+            over_budget = (
+                self.max_input_tokens is not None
+                and self.count_tokens(text) > self.max_input_tokens
+            )
+            if not over_budget:
+                return False
+        builder_type = type(self.prompt_builder)
+        if (
+            getattr(builder_type, "build_map_prompt", None)
+            is BasePromptBuilder.build_map_prompt
+        ):
+            logger.warning(
+                "Prompt builder does not support map-reduce, using single prompt"
+            )
+            return False
+        return True
+
+    def _build_prompt(
+        self,
+        text: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Build the single-pass generation prompt within max_input_tokens.
+
+        If the prompt is over budget, trailing sentences of the source text are
+        dropped until the rebuilt prompt fits, as measured by count_tokens.
+
+        Args:
+            text (str): Cleaned input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Generation prompt
+
+        Raises:
+            ValueError: If no source text fits into max_input_tokens
+        """
+        prompt_kwargs = dict(
+            complexity=complexity,
+            target_audience=target_audience,
+            min_length=min_length,
+            **kwargs,
+        )
+        prompt = self.prompt_builder.build_prompt(text=text, **prompt_kwargs)
+
+        if self.max_input_tokens is None:
+            return prompt
+
+        prompt_tokens = self.count_tokens(prompt)
+        if prompt_tokens <= self.max_input_tokens:
+            return prompt
+
+        sentences = split_sentences(text, max(1, len(text)))
+
+        def build(count: int) -> str:
+            return self.prompt_builder.build_prompt(
+                text=" ".join(sentences[:count]), **prompt_kwargs
+            )
+
+        # Most leading sentences whose whole prompt fits, counted with the
+        # configured counter; all of them are known not to fit
+        low, high = 0, len(sentences) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count_tokens(build(middle)) <= self.max_input_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        if low == 0:
+            raise ValueError(
+                f"No source text fits into the budget of {self.max_input_tokens} "
+                f"tokens; the prompt without it takes {self.count_tokens(build(0))}"
+            )
+        logger.warning(
+            f"Prompt of {prompt_tokens} tokens exceeds budget of "
+            f"{self.max_input_tokens}: keeping {low} of {len(sentences)} sentences"
+        )
+        return build(low)
+
+    def _build_map_prompts(
+        self,
+        text: str,
+        complexity: str,
+        target_audience: str,
+        **kwargs: Dict[str, Any],
+    ) -> List[str]:
+        """
+        Split text into sections and build the map prompt of each one.
+
+        Sections are at most map_chunk_size characters long, and short
+        enough for their prompts to fit into max_input_tokens.
+
+        Args:
+            text (str): Cleaned input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            List[str]: Map prompts in document order
+
+        Raises:
+            ValueError: If no source text fits into max_input_tokens
+        """
+        prompt_kwargs = dict(
+            complexity=complexity, target_audience=target_audience, **kwargs
+        )
+        section_size = self.map_chunk_size
+        if self.max_input_tokens is not None:
+            overhead = self.count_tokens(
+                self.prompt_builder.build_map_prompt(
+                    text="", section_index=0, section_count=1, **prompt_kwargs
+                )
+            )
+            available = self.max_input_tokens - overhead
+            if available <= 0:
+                raise ValueError(
+                    f"No source text fits into the budget of {self.max_input_tokens} "
+                    f"tokens; the map prompt without it takes {overhead}"
+                )
+            # Characters per token of this text, so sections of a dense text
+            # are shorter
+            chars_per_token = len(text) / max(self.count_tokens(text), 1)
+            section_size = max(1, min(section_size, int(available * chars_per_token)))
+
+        sections = self._split_sections(text, section_size)
+        logger.info(
+            f"Map-reduce generation over {len(sections)} sections "
+            f"(max concurrency: {self.max_concurrency})"
+        )
+        return [
+            self.prompt_builder.build_map_prompt(
+                text=section,
+                section_index=index,
+                section_count=len(sections),
+                **prompt_kwargs,
+            )
+            for index, section in enumerate(sections)
+        ]
+
+    def _build_reduce_prompt(
+        self,
+        notes: List[str],
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Build the reduce prompt from ordered section notes.
+
+        Args:
+            notes (List[str]): Notes of each section in document order
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Reduce prompt
+        """
+        combined_notes = "\n\n".join(
+            f"Part {i + 1} notes:\n{note}" for i, note in enumerate(notes)
+        )
+        return self.prompt_builder.build_reduce_prompt(
+            notes=combined_notes,
+            complexity=complexity,
+            target_audience=target_audience,
+            min_length=min_length,
+            **kwargs,
+        )
+
+    def _map_notes(
+        self,
+        text: str,
+        complexity: str,
+        target_audience: str,
+        bypass_cache: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> List[str]:
+        """
+        Run the map step: generate notes for every section concurrently.
+
+        Args:
+            text (str): Cleaned input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            bypass_cache (bool): Skip response cache lookups
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            List[str]: Section notes in document order
+        """
+        map_prompts = self._build_map_prompts(
+            text, complexity=complexity, target_audience=target_audience, **kwargs
+        )
+
+        def map_section(prompt: str) -> str:
+            return self._invoke(prompt, bypass_cache=bypass_cache)
+
+        workers = min(self.max_concurrency, len(map_prompts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Each task runs in a copy of the current context to keep usage tracking
+            futures = [
+                pool.submit(contextvars.copy_context().run, map_section, prompt)
+                for prompt in map_prompts
+            ]
+            return [future.result() for future in futures]
+
+    def _plan_expansion(
+        self, script: str, min_length: int
+    ) -> Tuple[List[str], Dict[int, int]]:
+        """
+        Split a draft script into sections and choose the ones to expand.
+
+        Each section's target length is its share of min_length; only sections
+        at least MIN_SECTION_SHORTFALL characters short are expanded (or the
+        single shortest one, if none is). Sections are slices of the script,
+        so the text between them can be kept when they are spliced back.
+
+        Args:
+            script (str): Draft script
+            min_length (int): Minimum target length of the whole script
+
+        Returns:
+            Tuple[List[str], Dict[int, int]]: Sections in order and the target
+                length of each section to expand, by index
+        """
+        # (start, end) of each paragraph, else each line, else each sentence
+        for boundary in (r"\n\s*\n", r"\n", r"(?<=[.!?])\s+"):
+            paragraphs = _text_spans(script, boundary)
+            if len(paragraphs) >= 2:
+                break
+
+        # Group paragraphs into at most MAX_EXPANSION_SECTIONS contiguous
+        # sections of similar length
+        section_count = min(len(paragraphs), self.MAX_EXPANSION_SECTIONS)
+        section_size = len(script) / max(section_count, 1)
+        sections: List[str] = []
+        current: List[Tuple[int, int]] = []
+        for paragraph in paragraphs:
+            current.append(paragraph)
+            length = sum(end - start for start, end in current)
+            remaining = section_count - len(sections) - 1
+            if length >= section_size and remaining > 0:
+                sections.append(script[current[0][0] : current[-1][1]])
+                current = []
+        if current:
+            sections.append(script[current[0][0] : current[-1][1]])
+
+        ratio = min_length / max(len(script), 1)
+        shortfalls = {
+            i: math.ceil(len(section) * ratio) - len(section)
+            for i, section in enumerate(sections)
+        }
+        targets = {
+            i: len(sections[i]) + short
+            for i, short in shortfalls.items()
+            if short >= self.MIN_SECTION_SHORTFALL
+        }
+        if not targets and shortfalls:
+            i = max(shortfalls, key=shortfalls.get)
+            targets[i] = len(sections[i]) + max(shortfalls[i], 1)
+
+        return sections, targets
+
+    def _sectional_expansion_supported(self) -> bool:
+        """Whether the prompt builder can build per-section expansion prompts."""
+        if self.expansion_mode != "sectional":
+            return False
+        return (
+            getattr(type(self.prompt_builder), "build_section_expand_prompt", None)
+            is not BasePromptBuilder.build_section_expand_prompt
+        )
+
+    def _build_section_expand_prompts(
+        self,
+        sections: List[str],
+        targets: Dict[int, int],
+        complexity: str,
+        target_audience: str,
+        **kwargs: Dict[str, Any],
+    ) -> Dict[int, str]:
+        """Build the expansion prompt of every section selected for expansion."""
+        return {
+            i: self.prompt_builder.build_section_expand_prompt(
+                text=sections[i],
+                target_length=target,
+                section_index=i,
+                section_count=len(sections),
+                complexity=complexity,
+                target_audience=target_audience,
+                **kwargs,
+            )
+            for i, target in targets.items()
+        }
+
+    @staticmethod
+    def _splice_sections(
+        script: str, sections: List[str], expanded: Dict[int, str]
+    ) -> str:
+        """Replace expanded sections, keeping the others and the text between them."""
+        merged = []
+        position = 0
+        for i, section in enumerate(sections):
+            start = script.index(section, position)
+            merged.append(script[position:start])
+            replacement = expanded.get(i)
+            if replacement and len(replacement.strip()) > len(section):
+                merged.append(replacement.strip())
+            else:
+                merged.append(section)
+            position = start + len(section)
+        merged.append(script[position:])
+        return "".join(merged)
+
+    def _expand_script(
+        self,
+        script: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        bypass_cache: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Expand a script shorter than min_length.
+
+        In sectional mode only the sections that are short are expanded, in
+        parallel, and spliced back; otherwise the whole script is rewritten.
+
+        Args:
+            script (str): Draft script
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            bypass_cache (bool): Skip response cache lookups
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Expanded script
+        """
+        if not self._sectional_expansion_supported():
+            expand_prompt = self.prompt_builder.build_expand_prompt(
+                text=script,
+                complexity=complexity,
+                target_audience=target_audience,
+                min_length=min_length,
+                **kwargs,
+            )
+            return self._invoke(expand_prompt, bypass_cache=bypass_cache)
+
+        sections, targets = self._plan_expansion(script, min_length)
+        prompts = self._build_section_expand_prompts(
+            sections, targets, complexity, target_audience, **kwargs
+        )
+        if not prompts:
+            # An empty draft has no sections to expand
+            return script
+        logger.info(
+            f"Expanding {len(prompts)} of {len(sections)} script sections concurrently"
+        )
+
+        def expand_section(prompt: str) -> str:
+            return self._invoke(prompt, bypass_cache=bypass_cache)
+
+        workers = min(self.max_concurrency, len(prompts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                i: pool.submit(contextvars.copy_context().run, expand_section, prompt)
+                for i, prompt in prompts.items()
+            }
+            expanded = {i: future.result() for i, future in futures.items()}
+
+        return self._splice_sections(script, sections, expanded)
+
+    async def _aexpand_script(
+        self,
+        script: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        bypass_cache: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Async counterpart of _expand_script.
+
+        Args:
+            script (str): Draft script
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            bypass_cache (bool): Skip response cache lookups
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Expanded script
+        """
+        if not self._sectional_expansion_supported():
+            expand_prompt = self.prompt_builder.build_expand_prompt(
+                text=script,
+                complexity=complexity,
+                target_audience=target_audience,
+                min_length=min_length,
+                **kwargs,
+            )
+            return await self._ainvoke(expand_prompt, bypass_cache=bypass_cache)
+
+        sections, targets = self._plan_expansion(script, min_length)
+        prompts = self._build_section_expand_prompts(
+            sections, targets, complexity, target_audience, **kwargs
+        )
+        if not prompts:
+            # An empty draft has no sections to expand
+            return script
+        logger.info(
+            f"Expanding {len(prompts)} of {len(sections)} script sections concurrently"
+        )
+
+        section_limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def expand_section(prompt: str) -> str:
+            async with section_limit:
+                return await self._ainvoke(prompt, bypass_cache=bypass_cache)
+
+        indices = list(prompts)
+        results = await asyncio.gather(*(expand_section(prompts[i]) for i in indices))
+
+        return self._splice_sections(script, sections, dict(zip(indices, results)))
+
+    def _generate_map_reduce(
+        self,
+        text: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        bypass_cache: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Generate a script by summarizing sections concurrently (map) and
+        composing the final script from the ordered notes (reduce).
+
+        Args:
+            text (str): Cleaned input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            bypass_cache (bool): Skip response cache lookups
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Generated podcast script
+        """
+        notes = self._map_notes(
+            text,
+            complexity=complexity,
+            target_audience=target_audience,
+            bypass_cache=bypass_cache,
+            **kwargs,
+        )
+        reduce_prompt = self._build_reduce_prompt(
+            notes,
+            complexity=complexity,
+            target_audience=target_audience,
+            min_length=min_length,
+            **kwargs,
+        )
+        return self._guarded_invoke(reduce_prompt, bypass_cache=bypass_cache)
+
+    @usage_tracked
     def generate_podcast_script(
         self,
         text: str,
         complexity: str = "intermediate",
         target_audience: str = "general",
         min_length: int = 10000,
+        bypass_cache: bool = False,
         **kwargs: Dict[str, Any],
     ) -> str:
         """
@@ -150,6 +1267,7 @@ class GeminiLLM(BaseLLM):
             complexity (str): Desired complexity level
             target_audience (str): Target audience category
             min_length (int): Minimum target length in characters
+            bypass_cache (bool): Skip response cache lookups and refresh entries
             **kwargs: Additional parameters
 
         Returns:
@@ -157,12 +1275,7 @@ class GeminiLLM(BaseLLM):
         """
         try:
             # Clean and validate input text
-            if not text or not text.strip():
-                raise ValueError("Input text cannot be empty")
-
-            processed_text = self._clean_text(text)
-            if not processed_text:
-                raise ValueError("Text cleaning resulted in empty content")
+            processed_text = self._prepare_text(text)
 
             logger.info(
                 f"Generating script with complexity: {complexity}, target length: {min_length}"
@@ -170,16 +1283,24 @@ class GeminiLLM(BaseLLM):
 
             # Generate initial script
             try:
-                prompt = self.prompt_builder.build_prompt(
-                    text=processed_text,
-                    complexity=complexity,
-                    target_audience=target_audience,
-                    min_length=min_length,
-                    **kwargs,
-                )
-
-                response = self.llm.invoke(prompt)
-                script = response.content.strip()
+                if self._use_map_reduce(processed_text):
+                    script = self._generate_map_reduce(
+                        processed_text,
+                        complexity=complexity,
+                        target_audience=target_audience,
+                        min_length=min_length,
+                        bypass_cache=bypass_cache,
+                        **kwargs,
+                    )
+                else:
+                    prompt = self._build_prompt(
+                        processed_text,
+                        complexity=complexity,
+                        target_audience=target_audience,
+                        min_length=min_length,
+                        **kwargs,
+                    )
+                    script = self._guarded_invoke(prompt, bypass_cache=bypass_cache)
 
                 # Expand if needed
                 if len(script) < min_length:
@@ -187,22 +1308,24 @@ class GeminiLLM(BaseLLM):
                         f"Initial script length ({len(script)}) below target ({min_length}). "
                         "Expanding content..."
                     )
-                    expand_prompt = self.prompt_builder.build_expand_prompt(
-                        text=script,
+                    script = self._expand_script(
+                        script,
                         complexity=complexity,
                         target_audience=target_audience,
                         min_length=min_length,
+                        bypass_cache=bypass_cache,
                         **kwargs,
                     )
-                    response = self.llm.invoke(expand_prompt)
-                    script = response.content.strip()
+                    script = self._scrub(script)
 
                 logger.info(f"Successfully generated script of length {len(script)}")
                 return script
 
-            except GoogleAPIError as e:
+            except (google_exceptions.GoogleAPIError,) + _RETRYABLE_ERRORS as e:
                 logger.error(f"Google API error: {str(e)}")
-                raise  # Will be caught by retry decorator
+                raise  # Already retried per request by retry_policy
+            except ValueError:
+                raise  # E.g. a token budget too small for any source text
             except Exception as e:
                 logger.error(f"Unexpected error in script generation: {str(e)}")
                 raise Exception(f"Failed to generate podcast script: {str(e)}")
@@ -213,3 +1336,204 @@ class GeminiLLM(BaseLLM):
         except Exception as e:
             logger.error(f"Script generation failed: {str(e)}")
             raise
+
+    @usage_tracked
+    def stream_podcast_script(
+        self,
+        text: str,
+        complexity: str = "intermediate",
+        target_audience: str = "general",
+        min_length: int = 10000,
+        bypass_cache: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Generate a podcast script as a stream of text fragments.
+
+        In map-reduce mode the section notes are generated first and only the
+        final reduce response is streamed. Streamed scripts are not expanded,
+        since fragments may already have been consumed when the length is known.
+        With a guardrail, forbidden content is removed from the stream.
+
+        Args:
+            text (str): Input text to convert into a podcast script
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            bypass_cache (bool): Skip response cache lookups and refresh entries
+            **kwargs: Additional parameters
+
+        Yields:
+            str: Script text fragments in order
+        """
+        processed_text = self._prepare_text(text)
+
+        logger.info(
+            f"Streaming script with complexity: {complexity}, target length: {min_length}"
+        )
+
+        if self._use_map_reduce(processed_text):
+            notes = self._map_notes(
+                processed_text,
+                complexity=complexity,
+                target_audience=target_audience,
+                bypass_cache=bypass_cache,
+                **kwargs,
+            )
+            prompt = self._build_reduce_prompt(
+                notes,
+                complexity=complexity,
+                target_audience=target_audience,
+                min_length=min_length,
+                **kwargs,
+            )
+        else:
+            prompt = self._build_prompt(
+                processed_text,
+                complexity=complexity,
+                target_audience=target_audience,
+                min_length=min_length,
+                **kwargs,
+            )
+
+        fragments = self._stream(prompt, bypass_cache=bypass_cache)
+        if self.guardrail is not None:
+            # Fragments may already be synthesized, so violations are removed
+            # instead of re-prompting
+            fragments = self.guardrail.scrub_stream(fragments)
+
+        length = 0
+        for fragment in fragments:
+            length += len(fragment)
+            yield fragment
+
+        if length < min_length:
+            logger.warning(
+                f"Streamed script length ({length}) below target ({min_length}); "
+                "expansion is not available in streaming mode"
+            )
+
+    async def _agenerate_map_reduce(
+        self,
+        text: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        bypass_cache: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Async counterpart of _generate_map_reduce.
+
+        Args:
+            text (str): Cleaned input text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            bypass_cache (bool): Skip response cache lookups
+            **kwargs: Additional prompt parameters
+
+        Returns:
+            str: Generated podcast script
+        """
+        map_prompts = self._build_map_prompts(
+            text, complexity=complexity, target_audience=target_audience, **kwargs
+        )
+        section_limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def map_section(prompt: str) -> str:
+            async with section_limit:
+                return await self._ainvoke(prompt, bypass_cache=bypass_cache)
+
+        notes = await asyncio.gather(*(map_section(p) for p in map_prompts))
+
+        reduce_prompt = self._build_reduce_prompt(
+            list(notes),
+            complexity=complexity,
+            target_audience=target_audience,
+            min_length=min_length,
+            **kwargs,
+        )
+        return await self._aguarded_invoke(reduce_prompt, bypass_cache=bypass_cache)
+
+    @usage_tracked
+    async def agenerate_podcast_script(
+        self,
+        text: str,
+        complexity: str = "intermediate",
+        target_audience: str = "general",
+        min_length: int = 10000,
+        bypass_cache: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> str:
+        """
+        Asynchronously generate a podcast script.
+
+        Uses the model's native async API. Each request is retried by
+        retry_policy with non-blocking backoff and counts against the process-wide in-flight limit
+        (see set_max_in_flight), so many generations can run on one event loop.
+
+        Args:
+            text (str): Input text to convert into a podcast script
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length in characters
+            bypass_cache (bool): Skip response cache lookups and refresh entries
+            **kwargs: Additional parameters
+
+        Returns:
+            str: Generated podcast script
+        """
+        try:
+            processed_text = self._prepare_text(text)
+
+            logger.info(
+                f"Generating script with complexity: {complexity}, target length: {min_length}"
+            )
+
+            if self._use_map_reduce(processed_text):
+                script = await self._agenerate_map_reduce(
+                    processed_text,
+                    complexity=complexity,
+                    target_audience=target_audience,
+                    min_length=min_length,
+                    bypass_cache=bypass_cache,
+                    **kwargs,
+                )
+            else:
+                prompt = self._build_prompt(
+                    processed_text,
+                    complexity=complexity,
+                    target_audience=target_audience,
+                    min_length=min_length,
+                    **kwargs,
+                )
+                script = await self._aguarded_invoke(
+                    prompt, bypass_cache=bypass_cache
+                )
+
+            # Expand if needed
+            if len(script) < min_length:
+                logger.info(
+                    f"Initial script length ({len(script)}) below target ({min_length}). "
+                    "Expanding content..."
+                )
+                script = await self._aexpand_script(
+                    script,
+                    complexity=complexity,
+                    target_audience=target_audience,
+                    min_length=min_length,
+                    bypass_cache=bypass_cache,
+                    **kwargs,
+                )
+                script = self._scrub(script)
+
+            logger.info(f"Successfully generated script of length {len(script)}")
+            return script
+
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Script generation failed: {str(e)}")
+            raise
@@ -2,9 +2,12 @@
 Manager classes for LLM and TTS provider selection.
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 import logging
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .base import BaseLLM, BaseTTS
+from .registry import LLM_PROVIDERS, TTS_PROVIDERS
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -13,22 +16,63 @@ logger = logging.getLogger(__name__)
 class LLMConfig(BaseModel):
     """Configuration model for LLM providers."""
 
+    # Provider-specific options (e.g. prompt_builder) are passed through as-is
+    model_config = ConfigDict(extra="allow", protected_namespaces=())
+
     api_key: Optional[str] = Field(None, description="API key for the provider")
     model_name: Optional[str] = None
     temperature: float = Field(0.2, ge=0.0, le=1.0)
     top_p: float = Field(0.9, ge=0.0, le=1.0)
     max_output_tokens: int = Field(4096, gt=0)
     streaming: bool = False
+    generation_mode: str = Field("single", pattern="^(single|map_reduce|auto)$")
+    map_chunk_size: int = Field(12000, gt=0)
+    max_concurrency: int = Field(4, gt=0)
+    cache_path: Optional[str] = None
+    cache_ttl: Optional[float] = Field(None, gt=0)
+    cache_max_entries: int = Field(1000, gt=0)
+    max_in_flight: Optional[int] = Field(None, gt=0)
+    max_input_tokens: Optional[int] = Field(None, gt=0)
+    token_counter: str = Field("estimate", pattern="^(estimate|model)$")
+    expansion_mode: str = Field("sectional", pattern="^(sectional|full)$")
+    requests_per_minute: Optional[float] = Field(None, gt=0)
+    tokens_per_minute: Optional[float] = Field(None, gt=0)
+    rate_limit_dir: Optional[str] = None
+    max_retries: int = Field(3, gt=0)
+    request_timeout: Optional[float] = Field(None, gt=0)
+    retry_deadline: Optional[float] = Field(None, gt=0)
+    context_cache: bool = False
+    context_cache_ttl: int = Field(3600, gt=0)
+    guardrail: bool = False
+    guardrail_patterns: Optional[List[str]] = None
+    guardrail_retries: int = Field(2, ge=0)
 
 
 class TTSConfig(BaseModel):
     """Configuration model for TTS providers."""
 
+    # Provider-specific options (e.g. tld, slow) are passed through as-is
+    model_config = ConfigDict(extra="allow")
+
     voice_id: Optional[str] = None
     language: Optional[str] = None
     region_name: Optional[str] = None
     engine: str = Field("neural", pattern="^(standard|neural)$")
     temp_dir: str = "temp"
+    max_concurrency: int = Field(4, gt=0)
+    max_buffer_bytes: int = Field(64 * 1024 * 1024, gt=0)
+    voices: Optional[Dict[str, str]] = None
+    postprocess: Optional[Dict[str, Any]] = None
+    output_format: str = Field("mp3", pattern="^(mp3|ogg|opus|aac|m4a)$")
+    bitrate: Optional[str] = Field(None, pattern=r"^[0-9]+k$")
+    requests_per_minute: Optional[float] = Field(None, gt=0)
+    characters_per_minute: Optional[float] = Field(None, gt=0)
+    rate_limit_dir: Optional[str] = None
+    max_retries: int = Field(3, gt=0)
+    request_timeout: Optional[float] = Field(None, gt=0)
+    retry_deadline: Optional[float] = Field(None, gt=0)
+    cache_dir: Optional[str] = None
+    cache_max_bytes: int = Field(512 * 1024 * 1024, gt=0)
 
     @field_validator("region_name")
     def validate_region(cls, v, values):
@@ -37,10 +81,6 @@ class TTSConfig(BaseModel):
         return v
 
 
-from .llm import GeminiLLM
-from .tts import AWSPollyTTS, GoogleTTS
-from .base import BaseLLM, BaseTTS
-
 
 class LLMManager:
     """
@@ -52,11 +92,11 @@ class LLMManager:
         Initialize LLM Manager.
 
         Args:
-            llm_provider (str): Type of LLM provider ("gemini", "openai", etc.)
+            llm_provider (str): Name of a registered LLM provider ("gemini", etc.)
             **kwargs: Configuration parameters for the selected provider
         """
         # Validate configuration
-        if llm_provider not in ["gemini", "openai"]:
+        if llm_provider not in LLM_PROVIDERS:
             raise ValueError(f"Unsupported LLM provider: {llm_provider}")
 
         self.llm_provider = llm_provider
@@ -80,10 +120,9 @@ class LLMManager:
             ValueError: If llm_provider is not supported
         """
         try:
-            if self.llm_provider == "gemini":
-                return GeminiLLM(**self.config)
-            # Add support for other providers here
-            raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+            # Provider implementation is imported only at this point
+            llm_class = LLM_PROVIDERS.get(self.llm_provider)
+            return llm_class(**self.config)
         except Exception as e:
             logger.error(f"Failed to initialize LLM instance: {str(e)}")
             raise
@@ -99,11 +138,11 @@ class TTSManager:
         Initialize TTS Manager.
 
         Args:
-            tts_provider (str): Type of TTS provider ("aws", "google", etc.)
+            tts_provider (str): Name of a registered TTS provider ("aws", "google", etc.)
             **kwargs: Configuration parameters for the selected provider
         """
         # Validate configuration
-        if tts_provider not in ["aws", "google"]:
+        if tts_provider not in TTS_PROVIDERS:
             raise ValueError(f"Unsupported TTS provider: {tts_provider}")
 
         self.tts_provider = tts_provider
@@ -132,8 +171,6 @@ class TTSManager:
                 if "voice_id" not in self.config:
                     logger.warning("No voice_id specified for AWS Polly, using default")
 
-                return AWSPollyTTS(**self.config)
-
             elif self.tts_provider == "google":
                 # Additional Google-specific validation
                 if "language" not in self.config:
@@ -141,9 +178,9 @@ class TTSManager:
                         "No language specified for Google TTS, using default"
                     )
 
-                return GoogleTTS(**self.config)
-
-            raise ValueError(f"Unsupported TTS provider: {self.tts_provider}")
+            # Provider implementation is imported only at this point
+            tts_class = TTS_PROVIDERS.get(self.tts_provider)
+            return tts_class(**self.config)
 
         except Exception as e:
             logger.error(f"Failed to initialize TTS instance: {str(e)}")
@@ -0,0 +1,439 @@
+"""
+PCM mixing into a single preallocated buffer.
+
+Used where chunk audio cannot simply be concatenated at frame level:
+pauses between sections, crossfades between speaker turns and gain
+changes. The sample count of every chunk is known from its MP3 frame
+headers, so the length of the mix is computed before anything is
+decoded, one NumPy buffer is allocated, and chunks, silences and
+crossfade ramps are written into it with vectorized operations. The
+result is encoded once.
+"""
+
+import logging
+import subprocess
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .mp3 import FrameJoiner, iter_frames
+from .postprocess import PostProcessor
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Samples are 16-bit little-endian, as exchanged with ffmpeg ("s16le")
+PCM_DTYPE = np.dtype("<i2")
+
+_PCM_MIN = np.iinfo(PCM_DTYPE).min
+_PCM_MAX = np.iinfo(PCM_DTYPE).max
+
+
+def _decode(
+    data: bytes,
+    sample_rate: int,
+    channels: int,
+    ffmpeg_path: str,
+    input_format: str = "mp3",
+):
+    """Decode MP3 or Ogg data with ffmpeg into a (samples, channels) array."""
+    result = subprocess.run(
+        [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            input_format,
+            "-i",
+            "pipe:0",
+            "-ar",
+            str(sample_rate),
+            "-ac",
+            str(channels),
+            "-f",
+            "s16le",
+            "pipe:1",
+        ],
+        input=data,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        details = result.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise RuntimeError(f"ffmpeg decoding failed: {'; '.join(details[-5:])}")
+    return np.frombuffer(result.stdout, dtype=PCM_DTYPE).reshape(-1, channels)
+
+
+def decode_mp3(
+    chunks: Iterable[bytes], ffmpeg_path: str = "ffmpeg"
+) -> Tuple[List[np.ndarray], int, int]:
+    """
+    Decode MP3 chunks to 16-bit PCM.
+
+    Chunks with matching audio parameters are joined at frame level and
+    decoded by a single ffmpeg process; their frame headers tell where each
+    chunk starts in the decoded audio. Otherwise every chunk is decoded on
+    its own and converted to the format of the first.
+
+    Args:
+        chunks (Iterable[bytes]): MP3 data in playback order
+        ffmpeg_path (str): ffmpeg executable (default: "ffmpeg")
+
+    Returns:
+        Tuple[List[np.ndarray], int, int]: Read-only (samples, channels)
+            array per chunk, sample rate and channel count
+
+    Raises:
+        RuntimeError: If there is no audio or ffmpeg fails
+    """
+    # Decoding one by one needs the chunks again; the compressed audio is
+    # small next to the PCM it is decoded to
+    chunks = list(chunks)
+    joiner = FrameJoiner()
+    joined = bytearray()
+    lengths = []
+    try:
+        for data in chunks:
+            samples = joiner.samples
+            for run in joiner.feed(data):
+                joined += run
+            lengths.append(joiner.samples - samples)
+    except ValueError as e:
+        logger.info(f"Chunks cannot be decoded together: {str(e)}, decoding one by one")
+        return _decode_separately(chunks, ffmpeg_path)
+
+    if joiner.params is None:
+        raise RuntimeError("No audio to decode")
+    _, _, sample_rate, channels = joiner.params
+    pcm = _decode(bytes(joined), sample_rate, channels, ffmpeg_path)
+
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    if offsets[-1] != len(pcm):
+        logger.warning(
+            f"Decoded {len(pcm)} samples, frame headers announced {offsets[-1]}"
+        )
+    segments = [pcm[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+    return segments, sample_rate, channels
+
+
+def _decode_separately(
+    chunks: Sequence[bytes], ffmpeg_path: str
+) -> Tuple[List[np.ndarray], int, int]:
+    """Decode chunks one by one in the format of the first chunk."""
+    segments = []
+    sample_rate = channels = None
+    for data in chunks:
+        if sample_rate is None:
+            header = next((header for _, header in iter_frames(data)), None)
+            if header is None:
+                segments.append(np.zeros((0, 1), dtype=PCM_DTYPE))
+                continue
+            sample_rate, channels = header.sample_rate, header.channels
+            # Chunks without audio before the first one take its format
+            segments = [segment.reshape(0, channels) for segment in segments]
+        segments.append(_decode(data, sample_rate, channels, ffmpeg_path))
+
+    if sample_rate is None:
+        raise RuntimeError("No audio to decode")
+    return segments, sample_rate, channels
+
+
+def decode_chunks(
+    chunks: Iterable[bytes],
+    chunk_format: str = "mp3",
+    sample_rate: Optional[int] = None,
+    ffmpeg_path: str = "ffmpeg",
+) -> Tuple[List[np.ndarray], int, int]:
+    """
+    Decode chunk audio in the format a TTS provider returned it.
+
+    PCM chunks are used as they are, without a copy or ffmpeg.
+
+    Args:
+        chunks (Iterable[bytes]): Chunk audio in playback order
+        chunk_format (str): "mp3", "ogg" or "pcm" (16-bit mono at
+            sample_rate) (default: "mp3")
+        sample_rate (Optional[int]): Sample rate of PCM chunks; Ogg chunks
+            are decoded at this rate (default: 48000)
+        ffmpeg_path (str): ffmpeg executable (default: "ffmpeg")
+
+    Returns:
+        Tuple[List[np.ndarray], int, int]: Read-only (samples, channels)
+            array per chunk, sample rate and channel count
+
+    Raises:
+        RuntimeError: If ffmpeg fails
+        ValueError: If PCM chunks come without a sample rate
+    """
+    if chunk_format == "mp3":
+        return decode_mp3(chunks, ffmpeg_path)
+    if chunk_format == "pcm":
+        if not sample_rate:
+            raise ValueError("PCM chunks need a sample rate")
+        segments = [
+            np.frombuffer(data, dtype=PCM_DTYPE)[:, np.newaxis] for data in chunks
+        ]
+        return segments, sample_rate, 1
+
+    # TTS voices are mono; Opus decodes at 48 kHz natively
+    sample_rate = sample_rate or 48000
+    segments = [
+        _decode(data, sample_rate, 1, ffmpeg_path, input_format=chunk_format)
+        for data in chunks
+    ]
+    return segments, sample_rate, 1
+
+
+@lru_cache(maxsize=32)
+def _ramps(length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Equal-power fade-in and fade-out gains of a crossfade, as columns."""
+    angle = np.linspace(0.0, np.pi / 2, length, dtype=np.float32)
+    return np.sin(angle)[:, np.newaxis], np.cos(angle)[:, np.newaxis]
+
+
+def _to_pcm(samples: np.ndarray) -> np.ndarray:
+    """Round and clip floating-point samples to 16-bit PCM."""
+    return np.clip(np.rint(samples), _PCM_MIN, _PCM_MAX).astype(PCM_DTYPE)
+
+
+class PCMMixer:
+    """
+    Mixes PCM segments into one preallocated buffer.
+
+    Consecutive segments are separated by a pause or overlapped by a
+    crossfade. Output positions are computed first and the buffer is
+    allocated once, zero-filled, so pauses cost nothing. Each segment is
+    then copied in with a single slice assignment; only crossfade overlaps
+    and segments with a gain are computed in floating point.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int = 1,
+        pause: float = 0.0,
+        crossfade: float = 0.0,
+    ):
+        """
+        Initialize mixer.
+
+        Args:
+            sample_rate (int): Sample rate of all segments
+            channels (int): Channel count of all segments (default: 1)
+            pause (float): Silence between segments in seconds (default: 0)
+            crossfade (float): Overlap of segments in seconds where there is
+                no pause (default: 0)
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.pause = pause
+        self.crossfade = crossfade
+
+    def _per_boundary(
+        self, values: Optional[Sequence[float]], default: float, count: int
+    ) -> List[int]:
+        """Convert per-boundary durations in seconds to sample counts."""
+        if values is None:
+            values = [default] * count
+        elif len(values) != count:
+            raise ValueError(f"Expected {count} values per boundary, got {len(values)}")
+        return [max(0, round(value * self.sample_rate)) for value in values]
+
+    def layout(
+        self,
+        lengths: Sequence[int],
+        pauses: Optional[Sequence[float]] = None,
+        crossfades: Optional[Sequence[float]] = None,
+    ) -> Tuple[List[int], List[int], int]:
+        """
+        Compute where each segment starts in the mix.
+
+        A pause takes precedence over a crossfade at the same boundary. A
+        crossfade is limited to half of either segment, so a segment never
+        overlaps both of its neighbours at the same samples.
+
+        Args:
+            lengths (Sequence[int]): Sample count of each segment
+            pauses (Optional[Sequence[float]]): Pause in seconds at each of
+                the len(lengths) - 1 boundaries (default: pause everywhere)
+            crossfades (Optional[Sequence[float]]): Crossfade in seconds at
+                each boundary (default: crossfade everywhere)
+
+        Returns:
+            Tuple[List[int], List[int], int]: Start sample of each segment,
+                overlap in samples at each boundary and total sample count
+        """
+        boundaries = max(0, len(lengths) - 1)
+        gaps = self._per_boundary(pauses, self.pause, boundaries)
+        fades = self._per_boundary(crossfades, self.crossfade, boundaries)
+
+        starts = [0] * len(lengths)
+        overlaps = []
+        for index in range(boundaries):
+            overlap = 0
+            if not gaps[index]:
+                overlap = min(
+                    fades[index], lengths[index] // 2, lengths[index + 1] // 2
+                )
+            overlaps.append(overlap)
+            starts[index + 1] = starts[index] + lengths[index] + gaps[index] - overlap
+
+        total = starts[-1] + lengths[-1] if lengths else 0
+        return starts, overlaps, total
+
+    def mix(
+        self,
+        segments: Sequence[np.ndarray],
+        pauses: Optional[Sequence[float]] = None,
+        crossfades: Optional[Sequence[float]] = None,
+        gains: Optional[Sequence[float]] = None,
+    ) -> np.ndarray:
+        """
+        Mix segments into a single buffer.
+
+        Args:
+            segments (Sequence[np.ndarray]): 16-bit (samples, channels) arrays
+                in playback order
+            pauses (Optional[Sequence[float]]): Pause in seconds at each
+                boundary between segments (default: the mixer's pause)
+            crossfades (Optional[Sequence[float]]): Crossfade in seconds at
+                each boundary (default: the mixer's crossfade)
+            gains (Optional[Sequence[float]]): Gain of each segment in dB
+                (default: unchanged)
+
+        Returns:
+            np.ndarray: 16-bit (samples, channels) array of the mix
+        """
+        lengths = [len(segment) for segment in segments]
+        starts, overlaps, total = self.layout(lengths, pauses, crossfades)
+        if gains is None:
+            factors = [1.0] * len(segments)
+        elif len(gains) != len(segments):
+            raise ValueError(f"Expected {len(segments)} gains, got {len(gains)}")
+        else:
+            factors = [10 ** (gain / 20) for gain in gains]
+
+        output = np.zeros((total, self.channels), dtype=PCM_DTYPE)
+        for index, segment in enumerate(segments):
+            start, length, factor = starts[index], lengths[index], factors[index]
+            head = overlaps[index - 1] if index > 0 else 0
+            tail = overlaps[index] if index < len(overlaps) else 0
+
+            body = segment[head : length - tail]
+            target = output[start + head : start + length - tail]
+            if factor == 1.0:
+                target[:] = body
+            else:
+                target[:] = _to_pcm(body * np.float32(factor))
+
+            if head:
+                previous = segments[index - 1]
+                fade_in, fade_out = _ramps(head)
+                overlap = previous[len(previous) - head :] * (
+                    fade_out * np.float32(factors[index - 1])
+                )
+                overlap += segment[:head] * (fade_in * np.float32(factor))
+                output[start : start + head] = _to_pcm(overlap)
+
+        return output
+
+
+def _pcm_blocks(pcm: np.ndarray, block_size: int) -> Iterable[np.ndarray]:
+    """Split PCM into byte blocks without copying."""
+    data = np.ascontiguousarray(pcm).reshape(-1).view(np.uint8)
+    for start in range(0, len(data), block_size):
+        yield data[start : start + block_size]
+
+
+def encode_pcm(
+    pcm: np.ndarray,
+    sample_rate: int,
+    output_path: str,
+    processor: Optional[PostProcessor] = None,
+) -> int:
+    """
+    Encode 16-bit PCM into a file with one ffmpeg process.
+
+    Args:
+        pcm (np.ndarray): 16-bit (samples, channels) array
+        sample_rate (int): Sample rate of the PCM
+        output_path (str): Path of the encoded file
+        processor (Optional[PostProcessor]): Encoder settings (default: MP3
+            at the PostProcessor's bitrate, without loudness normalization)
+
+    Returns:
+        int: Size of the written file in bytes
+    """
+    processor = processor or PostProcessor(loudnorm=False)
+    return processor.process(
+        _pcm_blocks(pcm, 1024 * 1024),
+        output_path,
+        input_format="s16le",
+        input_sample_rate=sample_rate,
+        input_channels=pcm.shape[1],
+    )
+
+
+def mix_audio(
+    chunks: Iterable[bytes],
+    output_path: str,
+    pauses: Optional[Sequence[float]] = None,
+    crossfades: Optional[Sequence[float]] = None,
+    gains: Optional[Sequence[float]] = None,
+    processor: Optional[PostProcessor] = None,
+    chunk_format: str = "mp3",
+    sample_rate: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Decode chunks, mix them with pauses, crossfades and gains, and encode the
+    result once.
+
+    The whole mix is held in memory as 16-bit PCM (about 170 MB per hour of
+    24 kHz mono audio).
+
+    Args:
+        chunks (Iterable[bytes]): Chunk audio in playback order
+        output_path (str): Path of the encoded file
+        pauses (Optional[Sequence[float]]): Pause in seconds at each
+            boundary between chunks (default: none)
+        crossfades (Optional[Sequence[float]]): Crossfade in seconds at each
+            boundary (default: none)
+        gains (Optional[Sequence[float]]): Gain of each chunk in dB
+            (default: unchanged)
+        processor (Optional[PostProcessor]): Encoder settings, see encode_pcm
+        chunk_format (str): "mp3", "ogg" or "pcm", see decode_chunks
+        sample_rate (Optional[int]): Sample rate of PCM chunks
+
+    Returns:
+        Dict[str, Any]: 'size' of the written file in bytes, 'duration' in
+            seconds, average 'bitrate' in kbps, output 'sample_rate' and
+            'channels', and 'chunk_offsets' (start of each chunk in seconds);
+            duration, bitrate and offsets are None if silence was trimmed
+    """
+    processor = processor or PostProcessor(loudnorm=False)
+    segments, sample_rate, channels = decode_chunks(
+        chunks, chunk_format, sample_rate, processor.ffmpeg_path
+    )
+    mixer = PCMMixer(sample_rate, channels)
+    pcm = mixer.mix(segments, pauses, crossfades, gains)
+    size = encode_pcm(pcm, sample_rate, output_path, processor)
+
+    metadata = {
+        "size": size,
+        "duration": None,
+        "bitrate": None,
+        "sample_rate": processor.output_sample_rate(sample_rate),
+        "channels": processor.channels or channels,
+        "chunk_offsets": None,
+    }
+    if not processor.trim_silence:
+        # Removed silence would shift the chunks from where they were mixed
+        starts, _, total = mixer.layout(
+            [len(segment) for segment in segments], pauses, crossfades
+        )
+        duration = total / sample_rate
+        metadata["duration"] = duration
+        metadata["bitrate"] = round(size * 8 / duration / 1000) if duration else None
+        metadata["chunk_offsets"] = [start / sample_rate for start in starts]
+    return metadata
@@ -0,0 +1,428 @@
+"""
+MP3 frame-level helpers.
+
+Parses MPEG audio frame headers directly from bytes, so MP3 data from TTS
+providers can be inspected and concatenated without decoding.
+"""
+
+import logging
+import math
+from functools import lru_cache
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# MPEG-1 Layer III, 32 kbps, 44.1 kHz, mono, no CRC, no padding
+SILENT_FRAME_HEADER = b"\xff\xfb\x10\xc4"
+
+# 144 * bitrate / sample rate = 144 * 32000 / 44100, rounded down
+SILENT_FRAME_LENGTH = 104
+
+SAMPLES_PER_FRAME = 1152
+SILENT_SAMPLE_RATE = 44100
+
+# All-zero side information and main data decode to digital silence
+SILENT_FRAME = SILENT_FRAME_HEADER + bytes(SILENT_FRAME_LENGTH - 4)
+
+# Bitrates in kbps by (MPEG-1?, layer), indexed by the header's bitrate index
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates by version bits (0: MPEG-2.5, 2: MPEG-2, 3: MPEG-1)
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+_VERSIONS = {0: "2.5", 2: "2", 3: "1"}
+
+# Starts of tags that may follow the last frame (ID3v1, APE, ID3v2, Lyrics3)
+_TRAILING_TAGS = (b"TAG", b"APE", b"ID3", b"LYR")
+
+
+class FrameHeader(NamedTuple):
+    """Decoded MPEG audio frame header."""
+
+    version: str
+    layer: int
+    bitrate: int
+    sample_rate: int
+    channels: int
+    protected: bool
+    frame_length: int
+    samples: int
+
+    @property
+    def stream_params(self) -> Tuple[str, int, int, int]:
+        """Parameters that must match for frames to be concatenated."""
+        return (self.version, self.layer, self.sample_rate, self.channels)
+
+    @property
+    def duration(self) -> float:
+        """Playback time of the frame in seconds."""
+        return self.samples / self.sample_rate
+
+
+def parse_frame_header(data: bytes, offset: int = 0) -> Optional[FrameHeader]:
+    """
+    Parse the MPEG audio frame header at an offset.
+
+    Args:
+        data (bytes): MP3 data
+        offset (int): Position of the header
+
+    Returns:
+        Optional[FrameHeader]: Header, or None if there is no valid header
+    """
+    if offset + 4 > len(data) or data[offset] != 0xFF:
+        return None
+    return _decode_header(bytes(data[offset : offset + 4]))
+
+
+@lru_cache(maxsize=256)
+def _decode_header(raw: bytes) -> Optional[FrameHeader]:
+    """Decode 4 header bytes; streams repeat a handful of distinct headers."""
+    b0, b1, b2, b3 = raw
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (b1 >> 3) & 0x03
+    layer_bits = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version_bits == 1 or layer_bits == 0:
+        return None
+    if bitrate_index in (0, 15) or sample_rate_index == 3:
+        # Free-format streams are not produced by TTS providers
+        return None
+
+    mpeg1 = version_bits == 3
+    layer = 4 - layer_bits
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index]
+    sample_rate = _SAMPLE_RATES[version_bits][sample_rate_index]
+    padding = (b2 >> 1) & 0x01
+
+    if layer == 1:
+        samples = 384
+        frame_length = (12 * bitrate * 1000 // sample_rate + padding) * 4
+    elif layer == 3 and not mpeg1:
+        samples = 576
+        frame_length = 72 * bitrate * 1000 // sample_rate + padding
+    else:
+        samples = 1152
+        frame_length = 144 * bitrate * 1000 // sample_rate + padding
+
+    return FrameHeader(
+        version=_VERSIONS[version_bits],
+        layer=layer,
+        bitrate=bitrate,
+        sample_rate=sample_rate,
+        channels=1 if (b3 >> 6) == 3 else 2,
+        protected=not (b1 & 0x01),
+        frame_length=frame_length,
+        samples=samples,
+    )
+
+
+def id3v2_length(data: bytes) -> int:
+    """
+    Length of a leading ID3v2 tag.
+
+    Args:
+        data (bytes): MP3 data
+
+    Returns:
+        int: Bytes to skip (0 if there is no tag)
+    """
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    # Tag size is a 28-bit "syncsafe" integer, excluding the 10-byte header
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _syncsafe(value: int) -> bytes:
+    """Encode a 28-bit ID3v2 "syncsafe" integer."""
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def id3_frame(frame_id: str, body: bytes) -> bytes:
+    """
+    Build an ID3v2.4 frame.
+
+    Args:
+        frame_id (str): Four-character frame ID, e.g. "TIT2"
+        body (bytes): Frame content
+
+    Returns:
+        bytes: Frame header and content
+    """
+    return frame_id.encode("ascii") + _syncsafe(len(body)) + b"\x00\x00" + body
+
+
+def id3v2_tag(frames: Iterable[bytes]) -> bytes:
+    """
+    Build an ID3v2.4 tag, which players and iter_frames skip as metadata.
+
+    Args:
+        frames (Iterable[bytes]): Frames built with id3_frame
+
+    Returns:
+        bytes: Tag to place before the first audio frame
+    """
+    content = b"".join(frames)
+    return b"ID3\x04\x00\x00" + _syncsafe(len(content)) + content
+
+
+def is_info_frame(data: bytes, offset: int, header: FrameHeader) -> bool:
+    """
+    Check whether a frame carries a Xing/Info or VBRI header instead of audio.
+
+    Such frames describe the whole file they came from, so they must not be
+    copied into a concatenation.
+
+    Args:
+        data (bytes): MP3 data
+        offset (int): Position of the frame
+        header (FrameHeader): Parsed header of the frame
+
+    Returns:
+        bool: True if the frame is a metadata frame
+    """
+    if header.layer != 3:
+        return False
+    if header.version == "1":
+        side_info = 17 if header.channels == 1 else 32
+    else:
+        side_info = 9 if header.channels == 1 else 17
+    xing = offset + 4 + (2 if header.protected else 0) + side_info
+    if data[xing : xing + 4] in (b"Xing", b"Info"):
+        return True
+    return data[offset + 36 : offset + 40] == b"VBRI"
+
+
+def iter_frames(data: bytes) -> Iterator[Tuple[int, FrameHeader]]:
+    """
+    Iterate over the audio frames of MP3 data.
+
+    Leading ID3v2 tags, trailing ID3v1 tags, Xing/Info/VBRI frames and
+    garbage between frames are skipped. A header is only accepted if the
+    frame fits into the data and is followed by another valid header or the
+    end of the audio, which rules out false sync words.
+
+    Args:
+        data (bytes): MP3 data
+
+    Yields:
+        Tuple[int, FrameHeader]: Offset and header of each audio frame
+    """
+    end = len(data)
+    if end >= 128 and data[end - 128 : end - 125] == b"TAG":
+        end -= 128
+
+    offset = id3v2_length(data)
+    first = True
+    header = None
+    while offset + 4 <= end:
+        if header is None:
+            header = parse_frame_header(data, offset)
+        if header is not None and offset + header.frame_length <= end:
+            following = offset + header.frame_length
+            # The next header is parsed once, as lookahead and for the next frame
+            next_header = parse_frame_header(data, following)
+            if (
+                next_header is not None
+                or following + 4 > end
+                or data[following : following + 3] in _TRAILING_TAGS
+            ):
+                if not (first and is_info_frame(data, offset, header)):
+                    yield offset, header
+                first = False
+                offset = following
+                header = next_header
+                continue
+
+        # Resynchronize on the next possible sync word
+        header = None
+        next_sync = data.find(b"\xff", offset + 1, end)
+        if next_sync < 0:
+            break
+        offset = next_sync
+
+
+class MP3Info(NamedTuple):
+    """Summary of MP3 data computed from its frame headers."""
+
+    frames: int
+    duration: float
+    sample_rate: int
+    channels: int
+    bitrate: int
+    audio_bytes: int
+
+
+def probe_mp3(data: bytes) -> Optional[MP3Info]:
+    """
+    Inspect MP3 data without decoding it.
+
+    Args:
+        data (bytes): MP3 data
+
+    Returns:
+        Optional[MP3Info]: Frame count, duration (from samples per frame),
+            format and average bitrate in kbps, or None if the data holds no
+            audio frames or frames with mixed parameters
+    """
+    frames = 0
+    samples = 0
+    audio_bytes = 0
+    first = None
+
+    for _, header in iter_frames(data):
+        if first is None:
+            first = header
+        elif header.stream_params != first.stream_params:
+            return None
+        frames += 1
+        samples += header.samples
+        audio_bytes += header.frame_length
+
+    if first is None:
+        return None
+
+    duration = samples / first.sample_rate
+    return MP3Info(
+        frames=frames,
+        duration=duration,
+        sample_rate=first.sample_rate,
+        channels=first.channels,
+        bitrate=round(audio_bytes * 8 / duration / 1000),
+        audio_bytes=audio_bytes,
+    )
+
+
+def silent_mp3(duration: float) -> bytes:
+    """
+    Build an MP3 stream of silence.
+
+    Args:
+        duration (float): Length in seconds, rounded up to whole frames
+
+    Returns:
+        bytes: Concatenated silent MP3 frames (at least one)
+    """
+    frame_duration = SAMPLES_PER_FRAME / SILENT_SAMPLE_RATE
+    frames = max(1, math.ceil(duration / frame_duration))
+    return SILENT_FRAME * frames
+
+
+class FrameJoiner:
+    """
+    Joins MP3 data chunk by chunk into a single stream of audio frames.
+
+    Tags and Xing/Info headers are dropped, so the joined frames play as
+    one stream. All chunks must share MPEG version, layer, sample rate and
+    channel count.
+    """
+
+    def __init__(self):
+        self.params: Optional[Tuple[str, int, int, int]] = None
+        self.frames = 0
+        self.samples = 0
+
+    def feed(self, data: bytes) -> Iterator[memoryview]:
+        """
+        Extract the audio frames of the next chunk.
+
+        Args:
+            data (bytes): MP3 data
+
+        Yields:
+            memoryview: Contiguous runs of audio frames, in order
+
+        Raises:
+            ValueError: If the chunk's audio parameters differ from earlier chunks
+        """
+        view = memoryview(data)
+
+        # Consecutive frames are handed on as one contiguous run
+        run_start = run_end = 0
+        for offset, header in iter_frames(data):
+            if self.params is None:
+                self.params = header.stream_params
+            elif header.stream_params != self.params:
+                raise ValueError(
+                    f"audio parameters {header.stream_params} differ from {self.params}"
+                )
+            if offset != run_end:
+                if run_end > run_start:
+                    yield view[run_start:run_end]
+                run_start = offset
+            run_end = offset + header.frame_length
+            self.frames += 1
+            self.samples += header.samples
+        if run_end > run_start:
+            yield view[run_start:run_end]
+
+
+def concat_mp3(chunks: Iterable[bytes], output: BinaryIO) -> bool:
+    """
+    Concatenate MP3 data at frame level, without decoding or re-encoding.
+
+    Audio frames of each chunk are written to the output in order; tags
+    and Xing/Info headers are dropped. Chunks without audio frames are
+    skipped. Concatenation is abandoned if the chunks differ in MPEG
+    version, layer, sample rate or channel count.
+
+    Args:
+        chunks (Iterable[bytes]): MP3 data in playback order
+        output (BinaryIO): Writable binary stream for the concatenation
+
+    Returns:
+        bool: True if written; False if the chunks need re-encoding instead
+    """
+    joiner = FrameJoiner()
+
+    for index, data in enumerate(chunks):
+        frames_before = joiner.frames
+        try:
+            for run in joiner.feed(data):
+                output.write(run)
+        except ValueError as e:
+            logger.info(f"Chunk {index} cannot be concatenated: {str(e)}, re-encoding")
+            return False
+
+        if joiner.frames == frames_before:
+            logger.error(f"Chunk {index} holds no audio frames")
+
+    return joiner.frames > 0
+
+
+def concat_mp3_files(files: List[str], output_file: str) -> bool:
+    """
+    Concatenate MP3 files at frame level, see concat_mp3.
+
+    Args:
+        files (List[str]): MP3 files in playback order
+        output_file (str): Path of the concatenated file
+
+    Returns:
+        bool: True if written; False if the files need re-encoding instead
+    """
+
+    def read_files() -> Iterator[bytes]:
+        for path in files:
+            with open(path, "rb") as f:
+                yield f.read()
+
+    with open(output_file, "wb") as output:
+        return concat_mp3(read_files(), output)
@@ -0,0 +1,102 @@
+"""
+Ogg page-level helpers.
+
+Reads Ogg page headers (RFC 3533) and the identification header of Vorbis
+and Opus streams directly from bytes, so Ogg audio from TTS providers can
+be inspected without decoding.
+"""
+
+import struct
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# Granule position of pages on which no packet ends
+_NO_GRANULE = 0xFFFFFFFFFFFFFFFF
+
+# Opus granule positions always count 48 kHz samples
+_OPUS_GRANULE_RATE = 48000
+
+
+class OggInfo(NamedTuple):
+    """Summary of an Ogg Vorbis or Opus stream computed from its headers."""
+
+    pages: int
+    duration: float
+    sample_rate: int
+    channels: int
+
+
+def iter_pages(data: bytes) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Iterate over the Ogg pages in data.
+
+    Iteration stops at the first byte that does not start a complete page.
+
+    Args:
+        data (bytes): Ogg data
+
+    Yields:
+        Tuple[int, int, int, int]: Offset of the page body, its length,
+            the page's granule position and its stream serial number
+    """
+    offset = 0
+    while data[offset : offset + 4] == b"OggS" and len(data) >= offset + 27:
+        granule, serial = struct.unpack_from("<QI", data, offset + 6)
+        segments = data[offset + 26]
+        body = offset + 27 + segments
+        length = sum(data[offset + 27 : body])
+        if body + length > len(data):
+            break
+        yield body, length, granule, serial
+        offset = body + length
+
+
+def probe_ogg(data: bytes) -> Optional[OggInfo]:
+    """
+    Inspect a single Ogg Vorbis or Opus stream without decoding it.
+
+    The duration is the granule position of the last page, i.e. the sample
+    count at the end of the stream (less the Opus pre-skip).
+
+    Args:
+        data (bytes): Ogg data holding one logical stream
+
+    Returns:
+        Optional[OggInfo]: Page count, duration and format, or None if the
+            data does not start with a Vorbis or Opus stream
+    """
+    pages = iter_pages(data)
+    first = next(pages, None)
+    if first is None:
+        return None
+    body, length, _, stream = first
+    header = data[body : body + length]
+
+    if header[:7] == b"\x01vorbis" and len(header) >= 16:
+        channels = header[11]
+        sample_rate = granule_rate = struct.unpack_from("<I", header, 12)[0]
+        pre_skip = 0
+    elif header[:8] == b"OpusHead" and len(header) >= 16:
+        channels = header[9]
+        pre_skip = struct.unpack_from("<H", header, 10)[0]
+        granule_rate = sample_rate = _OPUS_GRANULE_RATE
+    else:
+        return None
+    if not granule_rate:
+        return None
+
+    count = 1
+    samples = 0
+    for _, _, granule, serial in pages:
+        if serial != stream:
+            # A chained stream follows; only the first is summarized
+            break
+        count += 1
+        if granule != _NO_GRANULE:
+            samples = granule
+
+    return OggInfo(
+        pages=count,
+        duration=max(0, samples - pre_skip) / granule_rate,
+        sample_rate=sample_rate,
+        channels=channels,
+    )
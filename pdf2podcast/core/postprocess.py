@@ -0,0 +1,340 @@
+"""
+Audio post-processing through a single streaming ffmpeg process.
+
+Chunk audio is piped into ffmpeg's stdin as one stream and the encoded
+result is read from its stdout, so memory use does not grow with the
+length of the episode.
+"""
+
+import itertools
+import logging
+import shutil
+import subprocess
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .mp3 import FrameJoiner, iter_frames
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Encoder and pipe-friendly container per output format
+OUTPUT_FORMATS: Dict[str, Dict[str, Any]] = {
+    "mp3": {"codec": "libmp3lame", "container": "mp3"},
+    "aac": {"codec": "aac", "container": "adts"},
+    "m4a": {
+        "codec": "aac",
+        "container": "mp4",
+        # A regular MP4 needs a seekable output for its index. Audio-only
+        # fragments are not cut at keyframes, so a duration (in microseconds)
+        # keeps ffmpeg from holding the whole episode as one fragment
+        "options": [
+            "-movflags",
+            "+frag_keyframe+empty_moov",
+            "-frag_duration",
+            "2000000",
+        ],
+    },
+    "opus": {
+        "codec": "libopus",
+        "container": "ogg",
+        "sample_rates": (48000, 24000, 16000, 12000, 8000),
+    },
+    "ogg": {"codec": "libvorbis", "container": "ogg"},
+}
+
+
+class PostProcessor:
+    """
+    Concatenates, normalizes, trims and encodes chunk audio with ffmpeg.
+
+    One ffmpeg process handles a whole episode: chunk audio is written to
+    its stdin by a feeder thread while the encoded output is read from its
+    stdout, so processing overlaps synthesis and memory stays constant.
+    Loudness normalization uses the single-pass EBU R128 loudnorm filter,
+    which works on a stream without seeing the whole episode first.
+    """
+
+    def __init__(
+        self,
+        output_format: str = "mp3",
+        bitrate: Optional[str] = "64k",
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+        loudnorm: bool = True,
+        target_loudness: float = -16.0,
+        true_peak: float = -1.5,
+        loudness_range: float = 11.0,
+        trim_silence: bool = False,
+        silence_threshold: float = -50.0,
+        max_pause: float = 1.0,
+        ffmpeg_path: str = "ffmpeg",
+        block_size: int = 64 * 1024,
+    ):
+        """
+        Initialize post-processor.
+
+        Args:
+            output_format (str): "mp3", "aac", "m4a", "opus" or "ogg"
+                (default: "mp3")
+            bitrate (Optional[str]): Target bitrate, e.g. "64k"; encoder
+                default if None (default: "64k")
+            sample_rate (Optional[int]): Output sample rate (default: that of
+                the input, or the nearest rate the encoder supports)
+            channels (Optional[int]): Output channel count (default: as input)
+            loudnorm (bool): Normalize loudness (default: True)
+            target_loudness (float): Integrated loudness target in LUFS
+                (default: -16, common for podcasts)
+            true_peak (float): Maximum true peak in dBTP (default: -1.5)
+            loudness_range (float): Loudness range target in LU (default: 11)
+            trim_silence (bool): Remove leading and trailing silence and
+                shorten long pauses (default: False)
+            silence_threshold (float): Level below which audio counts as
+                silence in dB (default: -50)
+            max_pause (float): Longest pause kept when trimming silence in
+                seconds (default: 1.0)
+            ffmpeg_path (str): ffmpeg executable (default: "ffmpeg")
+            block_size (int): Bytes read from ffmpeg at a time (default: 64 KiB)
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.output_format = output_format
+        self.bitrate = bitrate
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.loudnorm = loudnorm
+        self.target_loudness = target_loudness
+        self.true_peak = true_peak
+        self.loudness_range = loudness_range
+        self.trim_silence = trim_silence
+        self.silence_threshold = silence_threshold
+        self.max_pause = max_pause
+        self.ffmpeg_path = ffmpeg_path
+        self.block_size = block_size
+
+    def filters(self) -> List[str]:
+        """
+        Build the audio filter chain.
+
+        Returns:
+            List[str]: ffmpeg audio filters in order
+        """
+        filters = []
+        if self.trim_silence:
+            threshold = f"{self.silence_threshold}dB"
+            # Since ffmpeg 6.1 a pause keeps stop_duration plus stop_silence;
+            # older versions keep only stop_silence, i.e. half of max_pause
+            keep = self.max_pause / 2
+            filters.append(
+                "silenceremove="
+                f"start_periods=1:start_threshold={threshold}:"
+                f"stop_periods=-1:stop_duration={keep}:"
+                f"stop_threshold={threshold}:stop_silence={keep}"
+            )
+        if self.loudnorm:
+            filters.append(
+                f"loudnorm=I={self.target_loudness}:TP={self.true_peak}:"
+                f"LRA={self.loudness_range}"
+            )
+        return filters
+
+    def output_sample_rate(self, input_sample_rate: Optional[int] = None) -> int:
+        """
+        Determine the sample rate of the encoded output.
+
+        Args:
+            input_sample_rate (Optional[int]): Sample rate of the input audio
+
+        Returns:
+            int: The configured rate, else the input rate (default: 44100),
+                moved to the nearest rate the encoder supports
+        """
+        sample_rate = self.sample_rate or input_sample_rate or 44100
+        supported = OUTPUT_FORMATS[self.output_format].get("sample_rates")
+        if supported and sample_rate not in supported:
+            sample_rate = min(supported, key=lambda rate: abs(rate - sample_rate))
+        return sample_rate
+
+    def command(
+        self,
+        input_sample_rate: Optional[int] = None,
+        input_format: str = "mp3",
+        input_channels: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Build the ffmpeg command line.
+
+        Args:
+            input_sample_rate (Optional[int]): Sample rate of the input audio
+            input_format (str): "mp3", "ogg" or "s16le" (raw 16-bit PCM,
+                which needs input_sample_rate and input_channels)
+            input_channels (Optional[int]): Channel count of raw PCM input
+
+        Returns:
+            List[str]: Command reading audio from stdin and writing to stdout
+        """
+        output = OUTPUT_FORMATS[self.output_format]
+
+        # loudnorm works at 192 kHz internally, so the rate is always set
+        sample_rate = self.output_sample_rate(input_sample_rate)
+
+        command = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error"]
+        command += ["-f", input_format]
+        if input_format == "s16le":
+            # Raw PCM carries no header to read its format from
+            command += ["-ar", str(input_sample_rate), "-ac", str(input_channels)]
+        command += ["-i", "pipe:0", "-vn"]
+        filters = self.filters()
+        if filters:
+            command += ["-af", ",".join(filters)]
+        command += ["-ar", str(sample_rate)]
+        if self.channels:
+            command += ["-ac", str(self.channels)]
+        command += ["-c:a", output["codec"]]
+        if self.bitrate:
+            command += ["-b:a", self.bitrate]
+        command += output.get("options", [])
+        command += ["-f", output["container"], "pipe:1"]
+        return command
+
+    def stream(
+        self,
+        chunks: Iterable[bytes],
+        input_format: str = "mp3",
+        input_sample_rate: Optional[int] = None,
+        input_channels: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Process chunk audio and yield the encoded output as it is produced.
+
+        Args:
+            chunks (Iterable[bytes]): Audio of each chunk (or blocks of raw
+                PCM) in order
+            input_format (str): "mp3", "ogg" or "s16le" (default: "mp3")
+            input_sample_rate (Optional[int]): Sample rate of raw PCM input
+            input_channels (Optional[int]): Channel count of raw PCM input
+
+        Yields:
+            bytes: Encoded audio in the output format
+
+        Raises:
+            RuntimeError: If ffmpeg is missing, there is no audio or ffmpeg fails
+        """
+        if shutil.which(self.ffmpeg_path) is None:
+            raise RuntimeError(f"ffmpeg not found: {self.ffmpeg_path}")
+
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is None:
+            raise RuntimeError("No audio to process")
+        if input_format == "mp3":
+            header = next((header for _, header in iter_frames(first)), None)
+            input_sample_rate = header.sample_rate if header else None
+        elif input_format == "s16le" and not (input_sample_rate and input_channels):
+            raise ValueError(f"{input_format} input needs a sample rate and channels")
+
+        process = subprocess.Popen(
+            self.command(input_sample_rate, input_format, input_channels),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        errors = deque(maxlen=20)
+        feed_errors = []
+
+        def write(data: bytes) -> bool:
+            try:
+                process.stdin.write(data)
+                return True
+            except (BrokenPipeError, ValueError):
+                # ffmpeg exited (or was stopped); its status tells why
+                return False
+
+        def feed() -> None:
+            try:
+                for data in itertools.chain([first], chunks):
+                    if input_format != "mp3":
+                        if not write(data):
+                            return
+                        continue
+                    # Tags and Xing/Info headers would be decoded as noise
+                    for run in FrameJoiner().feed(data):
+                        if not write(run):
+                            return
+            except BaseException as e:
+                # Chunk production failed; the episode would be truncated
+                feed_errors.append(e)
+                process.kill()
+            finally:
+                # Stop synthesis of chunks that can no longer be used
+                close = getattr(chunks, "close", None)
+                if close is not None:
+                    close()
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+
+        def drain_errors() -> None:
+            for line in process.stderr:
+                errors.append(line.decode("utf-8", "replace").rstrip())
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        reader = threading.Thread(target=drain_errors, daemon=True)
+        feeder.start()
+        reader.start()
+
+        completed = False
+        try:
+            while True:
+                block = process.stdout.read(self.block_size)
+                if not block:
+                    break
+                yield block
+            completed = True
+        finally:
+            if not completed:
+                # The consumer stopped early
+                process.kill()
+            returncode = process.wait()
+            feeder.join()
+            reader.join()
+            process.stdout.close()
+            process.stderr.close()
+
+        if feed_errors:
+            raise feed_errors[0]
+        if returncode != 0:
+            details = "; ".join(errors) or f"exit status {returncode}"
+            raise RuntimeError(f"ffmpeg post-processing failed: {details}")
+
+    def process(
+        self,
+        chunks: Iterable[bytes],
+        output_path: str,
+        input_format: str = "mp3",
+        input_sample_rate: Optional[int] = None,
+        input_channels: Optional[int] = None,
+    ) -> int:
+        """
+        Process chunk audio into a file.
+
+        Args:
+            chunks (Iterable[bytes]): Audio of each chunk (or blocks of raw
+                PCM) in order
+            output_path (str): Path of the encoded file
+            input_format (str): "mp3", "ogg" or "s16le" (default: "mp3")
+            input_sample_rate (Optional[int]): Sample rate of raw PCM input
+            input_channels (Optional[int]): Channel count of raw PCM input
+
+        Returns:
+            int: Size of the written file in bytes
+        """
+        size = 0
+        blocks = self.stream(chunks, input_format, input_sample_rate, input_channels)
+        with open(output_path, "wb") as output:
+            for block in blocks:
+                output.write(block)
+                size += len(block)
+        return size
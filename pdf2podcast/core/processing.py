@@ -3,9 +3,7 @@ Text processing implementations including chunking and semantic retrieval.
 """
 
 from typing import List, Optional
-from sentence_transformers import SentenceTransformer
 import numpy as np
-import faiss
 from .base import BaseChunker, BaseRetriever
 
 
@@ -66,6 +64,10 @@ class SemanticRetriever(BaseRetriever):
             model_name (str): Name of the sentence transformer model to use
             dimension (Optional[int]): Embedding dimension (if known)
         """
+        # Heavy dependencies are imported only when a retriever is created
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
         self.model = SentenceTransformer(model_name)
         self.texts: List[str] = []
 
@@ -4,7 +4,7 @@ Prompt templates and mappings for podcast generation.
 
 from typing import Dict, Any
 
-from pdf2podcast.core.base import BasePromptBuilder
+from pdf2podcast.core.base import BasePromptBuilder, StructuredPrompt
 
 # Detailed complexity mappings
 COMPLEXITY_MAPPING = {
@@ -74,26 +74,40 @@ AUDIENCE_MAPPING = {
 class PodcastPromptTemplate:
     """Template provider for podcast generation prompts."""
 
+    # Parts of the script structure requested by get_base_instructions, each
+    # started by a "[title]" heading line if section_headings is set:
+    # (key, title, share of length)
+    SECTIONS = (
+        ("intro", "Introduction", 0.15),
+        ("main", "Main Explanation", 0.65),
+        ("applications", "Real Applications", 0.10),
+        ("conclusion", "Conclusion", 0.10),
+    )
+
     @staticmethod
-    def get_base_prompt(
-        text: str,
+    def get_base_instructions(
         complexity: str,
         target_audience: str,
         min_length: int,
+        section_headings: bool = False,
         **kwargs: Dict[str, Any],
     ) -> str:
         """
-        Get the base prompt for podcast script generation.
+        Get the static instructions for podcast script generation.
+
+        The instructions depend only on the generation settings, so they are
+        identical for every document generated with the same settings.
 
         Args:
-            text (str): Source text
             complexity (str): Desired complexity level
             target_audience (str): Target audience category
             min_length (int): Minimum target length
+            section_headings (bool): Ask for a "[title]" heading line at the
+                start of each part of SECTIONS, e.g. to render chapters
             **kwargs: Additional parameters
 
         Returns:
-            str: Formatted prompt
+            str: Formatted instructions
         """
         complexity_settings = COMPLEXITY_MAPPING.get(
             complexity, COMPLEXITY_MAPPING["intermediate"]
@@ -102,6 +116,15 @@ class PodcastPromptTemplate:
             target_audience, AUDIENCE_MAPPING["general"]
         )
 
+        titles = [title for _, title, _ in PodcastPromptTemplate.SECTIONS]
+        heading_rule = ""
+        if section_headings:
+            titles = [f"[{title}]" for title in titles]
+            heading_rule = """
+        Start each part with its heading, exactly as written below in square
+        brackets, on a line of its own. Headings are not read aloud.
+"""
+
         return f"""
         Generate a podcast script using ONLY the provided text content. Follow these STRICT requirements:
 
@@ -133,24 +156,25 @@ class PodcastPromptTemplate:
            - Example Types: {audience_settings['examples']}
            - Engagement Style: {audience_settings['engagement']}
 
-        Structure ({min_length} characters total):
-        1. Direct Content Start (15%):
+        Structure ({min_length} characters total):{heading_rule}
+        1. {titles[0]} (15%):
+           - Start directly with the content
            - Begin with clear context for the audience
            - Frame the topic appropriately
            - Set proper expectations
 
-        2. Main Explanation (65%):
+        2. {titles[1]} (65%):
            - Adapt depth to audience and complexity level
            - Build understanding progressively
            - Use appropriate terminology
            - Provide relevant context
 
-        3. Real Applications (10%):
+        3. {titles[2]} (10%):
            - Examples matching audience interests
            - Practical scenarios at right complexity
            - Relevant use cases
 
-        4. Conclusion (10%):
+        4. {titles[3]} (10%):
            - Summarize at appropriate level
            - Reinforce key points
            - Maintain technical accuracy
@@ -164,12 +188,45 @@ class PodcastPromptTemplate:
         - Pure narration style
         - Focus on substance
         - No external examples
+        """
+
+    @staticmethod
+    def get_base_prompt(
+        text: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        **kwargs: Dict[str, Any],
+    ) -> StructuredPrompt:
+        """
+        Get the base prompt for podcast script generation.
+
+        Args:
+            text (str): Source text
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length
+            **kwargs: Additional parameters
+
+        Returns:
+            StructuredPrompt: Static instructions and source text
+        """
+        instructions = PodcastPromptTemplate.get_base_instructions(
+            complexity=complexity,
+            target_audience=target_audience,
+            min_length=min_length,
+            **kwargs,
+        )
 
+        return StructuredPrompt(
+            instructions,
+            f"""
         Source text:
         {text}
 
         Generate a focused, well-adapted script that strictly follows these requirements.
-        """
+        """,
+        )
 
     @staticmethod
     def get_expand_prompt(
@@ -177,8 +234,9 @@ class PodcastPromptTemplate:
         min_length: int,
         complexity: str,
         target_audience: str,
+        section_headings: bool = False,
         **kwargs: Dict[str, Any],
-    ) -> str:
+    ) -> StructuredPrompt:
         """
         Get the prompt for expanding an existing script.
 
@@ -187,12 +245,19 @@ class PodcastPromptTemplate:
             min_length (int): Target minimum length
             complexity (str): Desired complexity level
             target_audience (str): Target audience category
+            section_headings (bool): Whether the script has section headings
+                to keep
             **kwargs: Additional parameters
 
         Returns:
-            str: Formatted expansion prompt
+            StructuredPrompt: Static instructions and current script
         """
-        return f"""
+        heading_rule = ""
+        if section_headings:
+            heading_rule = """
+        - Keep the section headings in square brackets on their own lines"""
+
+        instructions = f"""
         Expand this script to at least {min_length} characters.
         CRITICAL - Maintain all previous rules:
         - NO sound effects, music, or audio cues
@@ -201,14 +266,157 @@ class PodcastPromptTemplate:
         - Focus ONLY on content from source text
         - Keep {complexity} level complexity
         - Target {target_audience} audience
-        - Maintain pure narration style
+        - Maintain pure narration style{heading_rule}
         
         Add more detail and examples appropriate for the audience.
+        """
 
+        return StructuredPrompt(
+            instructions,
+            f"""
         Current script:
         {script}
+        """,
+        )
+
+    @staticmethod
+    def get_section_expand_prompt(
+        section: str,
+        target_length: int,
+        section_index: int,
+        section_count: int,
+        complexity: str,
+        target_audience: str,
+        section_headings: bool = False,
+        **kwargs: Dict[str, Any],
+    ) -> StructuredPrompt:
+        """
+        Get the prompt for expanding one section of an existing script.
+
+        Args:
+            section (str): Section text
+            target_length (int): Target length of the expanded section in characters
+            section_index (int): Zero-based position of the section in the script
+            section_count (int): Total number of sections
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            section_headings (bool): Whether the script has section headings
+                to keep
+            **kwargs: Additional parameters
+
+        Returns:
+            StructuredPrompt: Static instructions and section details
+        """
+        heading_rule = ""
+        if section_headings:
+            heading_rule = """
+        - Keep any section heading in square brackets unchanged on its own line"""
+
+        instructions = f"""
+        Expand the given passage of a narrated script to the requested length.
+        CRITICAL - Maintain all previous rules:
+        - NO sound effects, music, or audio cues
+        - NO intro/outro elements
+        - NO references to podcast format
+        - Focus ONLY on content already present in the passage
+        - Keep {complexity} level complexity
+        - Target {target_audience} audience
+        - Maintain pure narration style
+        - Keep the opening and closing sentences compatible with the surrounding parts{heading_rule}
+
+        Add more detail and examples appropriate for the audience.
+        Return ONLY the expanded passage.
+        """
+
+        return StructuredPrompt(
+            instructions,
+            f"""
+        Expand part {section_index + 1} of {section_count} of the script
+        to about {target_length} characters.
+
+        Passage:
+        {section}
+        """,
+        )
+
+    @staticmethod
+    def get_map_prompt(
+        text: str,
+        section_index: int,
+        section_count: int,
+        complexity: str,
+        target_audience: str,
+        **kwargs: Dict[str, Any],
+    ) -> StructuredPrompt:
+        """
+        Get the prompt for extracting section notes from one part of a long document.
+
+        Args:
+            text (str): Source text of the section
+            section_index (int): Zero-based position of the section in the document
+            section_count (int): Total number of sections
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            **kwargs: Additional parameters
+
+        Returns:
+            StructuredPrompt: Static instructions and section text
+        """
+        instructions = f"""
+        You are preparing notes for one part of a document that will later be
+        turned into a single narrated script.
+
+        Write detailed notes covering ONLY the content of this part:
+        - Key concepts, definitions and explanations
+        - Important facts, figures and results
+        - Examples and applications mentioned in the text
+        - How this part connects to the overall topic
+
+        Rules:
+        - Use ONLY information from the given text
+        - Keep technical accuracy suitable for {complexity} complexity
+        - Keep in mind the target audience: {target_audience}
+        - NO references to figures, diagrams, or visual elements
+        - Write plain prose notes, no script, no audio cues
         """
 
+        return StructuredPrompt(
+            instructions,
+            f"""
+        Text of part {section_index + 1} of {section_count}:
+        {text}
+        """,
+        )
+
+    @staticmethod
+    def get_reduce_prompt(
+        notes: str,
+        complexity: str,
+        target_audience: str,
+        min_length: int,
+        **kwargs: Dict[str, Any],
+    ) -> StructuredPrompt:
+        """
+        Get the prompt for composing the final script from section notes.
+
+        Args:
+            notes (str): Ordered notes produced for each document section
+            complexity (str): Desired complexity level
+            target_audience (str): Target audience category
+            min_length (int): Minimum target length
+            **kwargs: Additional parameters
+
+        Returns:
+            StructuredPrompt: Static instructions and notes
+        """
+        return PodcastPromptTemplate.get_base_prompt(
+            text=notes,
+            complexity=complexity,
+            target_audience=target_audience,
+            min_length=min_length,
+            **kwargs,
+        )
+
 
 class PodcastPromptBuilder(BasePromptBuilder):
     """Prompt builder for podcast script generation."""
@@ -233,3 +441,28 @@ class PodcastPromptBuilder(BasePromptBuilder):
     def build_expand_prompt(self, text: str, **kwargs) -> str:
         """Build expansion prompt."""
         return self.templates.get_expand_prompt(text, **kwargs)
+
+    def build_section_expand_prompt(
+        self,
+        text: str,
+        target_length: int,
+        section_index: int,
+        section_count: int,
+        **kwargs,
+    ) -> str:
+        """Build expansion prompt for a single script section."""
+        return self.templates.get_section_expand_prompt(
+            text, target_length, section_index, section_count, **kwargs
+        )
+
+    def build_map_prompt(
+        self, text: str, section_index: int, section_count: int, **kwargs
+    ) -> str:
+        """Build per-section notes prompt for map-reduce generation."""
+        return self.templates.get_map_prompt(
+            text, section_index, section_count, **kwargs
+        )
+
+    def build_reduce_prompt(self, notes: str, **kwargs) -> str:
+        """Build final script prompt from section notes."""
+        return self.templates.get_reduce_prompt(notes, **kwargs)
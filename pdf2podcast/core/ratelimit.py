@@ -0,0 +1,211 @@
+"""
+Token-bucket rate limiting shared across threads and processes.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests per minute and units per minute.
+
+    Units are whatever the provider meters besides requests (tokens for LLMs,
+    characters for TTS). Buckets start full, so short bursts up to the
+    per-minute quota are allowed. The limiter is thread-safe; with a
+    state_path the bucket state lives in a locked file, so every process on
+    the host using the same path draws from the same quota.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        units_per_minute: Optional[float] = None,
+        state_path: Optional[str] = None,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute (Optional[float]): Request quota (default: unlimited)
+            units_per_minute (Optional[float]): Token/character quota (default: unlimited)
+            state_path (Optional[str]): File holding the shared bucket state for
+                cross-process limiting (default: this process only)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.units_per_minute = units_per_minute
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._state: Dict[str, float] = {}
+
+        if state_path and fcntl is None:
+            logger.warning(
+                "File locking is not available on this platform, "
+                "rate limits apply to this process only"
+            )
+            self.state_path = None
+
+        if self.state_path:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    def _take(self, state: Dict[str, float], units: float, now: float) -> float:
+        """
+        Refill buckets and take one request plus units if available.
+
+        Args:
+            state (Dict[str, float]): Bucket state, updated in place
+            units (float): Units needed for the request
+            now (float): Current time
+
+        Returns:
+            float: 0 if taken, otherwise seconds to wait before retrying
+        """
+        elapsed = max(0.0, now - state.get("updated", now))
+        state["updated"] = now
+
+        buckets = []
+        if self.requests_per_minute:
+            buckets.append(("requests", self.requests_per_minute, 1.0))
+        if self.units_per_minute and units:
+            # A single request may never need more than a full bucket
+            buckets.append(
+                ("units", self.units_per_minute, min(units, self.units_per_minute))
+            )
+
+        wait = 0.0
+        for name, per_minute, needed in buckets:
+            rate = per_minute / 60.0
+            level = min(per_minute, state.get(name, per_minute) + elapsed * rate)
+            state[name] = level
+            if level < needed:
+                wait = max(wait, (needed - level) / rate)
+
+        if wait == 0.0:
+            for name, _, needed in buckets:
+                state[name] -= needed
+
+        return wait
+
+    def _try_acquire(self, units: float) -> float:
+        """Attempt to take capacity once; returns seconds to wait (0 if taken)."""
+        with self._lock:
+            if not self.state_path:
+                return self._take(self._state, units, time.time())
+
+            with open(self.state_path, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    content = f.read()
+                    try:
+                        state = json.loads(content) if content else {}
+                    except ValueError:
+                        state = {}
+                    wait = self._take(state, units, time.time())
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                    return wait
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def acquire(self, units: float = 0) -> float:
+        """
+        Block until one request with the given units may be issued.
+
+        Args:
+            units (float): Tokens/characters the request will consume
+
+        Returns:
+            float: Total seconds spent waiting
+        """
+        if not self.requests_per_minute and not self.units_per_minute:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(units)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def aacquire(self, units: float = 0) -> float:
+        """
+        Async counterpart of acquire, waiting with asyncio.sleep.
+
+        Args:
+            units (float): Tokens/characters the request will consume
+
+        Returns:
+            float: Total seconds spent waiting
+        """
+        if not self.requests_per_minute and not self.units_per_minute:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(units)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+
+_limiters: Dict[Tuple, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str,
+    requests_per_minute: Optional[float] = None,
+    units_per_minute: Optional[float] = None,
+    state_dir: Optional[str] = None,
+) -> Optional[RateLimiter]:
+    """
+    Return the process-wide limiter for a provider quota.
+
+    All callers asking for the same name and limits share one limiter, so
+    several generator instances in a process draw from one quota. With a
+    state_dir, processes using the same directory share it as well.
+
+    Args:
+        name (str): Quota name (e.g. "gemini-1.5-flash", "polly-eu-central-1")
+        requests_per_minute (Optional[float]): Request quota
+        units_per_minute (Optional[float]): Token/character quota
+        state_dir (Optional[str]): Directory for cross-process bucket state
+
+    Returns:
+        Optional[RateLimiter]: Shared limiter, or None if no limit is configured
+    """
+    if not requests_per_minute and not units_per_minute:
+        return None
+
+    state_path = None
+    if state_dir:
+        safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+        state_path = os.path.join(state_dir, f"{safe_name}.json")
+
+    key = (name, requests_per_minute, units_per_minute, state_path)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, units_per_minute, state_path)
+            _limiters[key] = limiter
+        return limiter
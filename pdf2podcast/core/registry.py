@@ -0,0 +1,218 @@
+"""
+Provider registries for LLM and TTS implementations.
+
+Providers are registered by name together with a lazy import path
+(``"package.module:ClassName"``), so the SDK behind a provider is only
+imported when that provider is actually requested. Third-party packages
+can also contribute providers through entry points in the
+``pdf2podcast.llm_providers`` and ``pdf2podcast.tts_providers`` groups.
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Union
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+ProviderTarget = Union[str, Callable[..., Any]]
+
+
+def _iter_entry_points(group: str):
+    """
+    Return the installed entry points for a group.
+
+    Args:
+        group (str): Entry point group name
+
+    Returns:
+        Iterable of entry point objects
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # pragma: no cover - Python < 3.8
+        return []
+
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=group)
+    return eps.get(group, [])
+
+
+class ProviderRegistry:
+    """
+    Name-to-implementation registry with lazy imports.
+
+    A provider target is either an import path of the form
+    ``"package.module:ClassName"`` or an already imported class/factory.
+    Import paths are resolved on first use and memoized.
+    """
+
+    def __init__(self, kind: str, entry_point_group: str):
+        """
+        Initialize an empty registry.
+
+        Args:
+            kind (str): Human readable provider kind used in messages ("LLM", "TTS")
+            entry_point_group (str): Entry point group scanned for plugins
+        """
+        self.kind = kind
+        self.entry_point_group = entry_point_group
+        self._targets: Dict[str, ProviderTarget] = {}
+        self._resolved: Dict[str, Callable[..., Any]] = {}
+        self._entry_points_loaded = False
+        self._lock = threading.RLock()
+
+    def register(
+        self, name: str, target: ProviderTarget, replace: bool = False
+    ) -> None:
+        """
+        Register a provider.
+
+        Args:
+            name (str): Provider name used in configuration (e.g. "gemini")
+            target (Union[str, Callable]): Import path ("module:attr") or class/factory
+            replace (bool): Whether to overwrite an existing registration
+
+        Raises:
+            ValueError: If the name is already registered and replace is False
+        """
+        if isinstance(target, str) and ":" not in target:
+            raise ValueError(
+                f"Invalid import path for {self.kind} provider '{name}': {target} "
+                "(expected 'package.module:ClassName')"
+            )
+
+        with self._lock:
+            if name in self._targets and not replace:
+                raise ValueError(f"{self.kind} provider already registered: {name}")
+            self._targets[name] = target
+            self._resolved.pop(name, None)
+
+    def unregister(self, name: str) -> None:
+        """
+        Remove a provider registration.
+
+        Args:
+            name (str): Provider name
+        """
+        with self._lock:
+            self._targets.pop(name, None)
+            self._resolved.pop(name, None)
+
+    def _load_entry_points(self) -> None:
+        """Register providers advertised through entry points (once)."""
+        if self._entry_points_loaded:
+            return
+
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            self._entry_points_loaded = True
+
+            for ep in _iter_entry_points(self.entry_point_group):
+                if ep.name in self._targets:
+                    logger.debug(
+                        f"Ignoring entry point {ep.name} for already registered "
+                        f"{self.kind} provider"
+                    )
+                    continue
+                # Entry point values use the same "module:attr" format
+                self._targets[ep.name] = ep.value
+
+    def names(self) -> List[str]:
+        """
+        List all known provider names.
+
+        Returns:
+            List[str]: Sorted provider names
+        """
+        self._load_entry_points()
+        return sorted(self._targets)
+
+    def __contains__(self, name: str) -> bool:
+        self._load_entry_points()
+        return name in self._targets
+
+    def get(self, name: str) -> Callable[..., Any]:
+        """
+        Resolve a provider name to its implementation, importing it if needed.
+
+        Args:
+            name (str): Provider name
+
+        Returns:
+            Callable[..., Any]: Provider class or factory
+
+        Raises:
+            ValueError: If the provider is unknown or cannot be imported
+        """
+        self._load_entry_points()
+
+        with self._lock:
+            if name in self._resolved:
+                return self._resolved[name]
+
+            if name not in self._targets:
+                raise ValueError(
+                    f"Unsupported {self.kind} provider: {name} "
+                    f"(available: {', '.join(sorted(self._targets))})"
+                )
+
+            target = self._targets[name]
+            if isinstance(target, str):
+                module_name, _, attr = target.partition(":")
+                try:
+                    module = importlib.import_module(module_name)
+                    obj = module
+                    for part in attr.split("."):
+                        obj = getattr(obj, part)
+                except (ImportError, AttributeError) as e:
+                    raise ValueError(
+                        f"Could not load {self.kind} provider '{name}' "
+                        f"from {target}: {str(e)}"
+                    )
+                target = obj
+
+            self._resolved[name] = target
+            return target
+
+
+LLM_PROVIDERS = ProviderRegistry("LLM", "pdf2podcast.llm_providers")
+TTS_PROVIDERS = ProviderRegistry("TTS", "pdf2podcast.tts_providers")
+
+# Built-in providers
+LLM_PROVIDERS.register("gemini", "pdf2podcast.core.llm:GeminiLLM")
+LLM_PROVIDERS.register("fake", "pdf2podcast.core.fake:FakeLLM")
+TTS_PROVIDERS.register("aws", "pdf2podcast.core.tts:AWSPollyTTS")
+TTS_PROVIDERS.register("google", "pdf2podcast.core.tts:GoogleTTS")
+TTS_PROVIDERS.register("fake", "pdf2podcast.core.fake:FakeTTS")
+
+
+def register_llm_provider(
+    name: str, target: ProviderTarget, replace: bool = False
+) -> None:
+    """
+    Register an LLM provider usable as ``llm_provider=name``.
+
+    Args:
+        name (str): Provider name
+        target (Union[str, Callable]): Import path ("module:attr") or BaseLLM subclass
+        replace (bool): Whether to overwrite an existing registration
+    """
+    LLM_PROVIDERS.register(name, target, replace=replace)
+
+
+def register_tts_provider(
+    name: str, target: ProviderTarget, replace: bool = False
+) -> None:
+    """
+    Register a TTS provider usable as ``tts_provider=name``.
+
+    Args:
+        name (str): Provider name
+        target (Union[str, Callable]): Import path ("module:attr") or BaseTTS subclass
+        replace (bool): Whether to overwrite an existing registration
+    """
+    TTS_PROVIDERS.register(name, target, replace=replace)
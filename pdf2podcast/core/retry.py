@@ -0,0 +1,407 @@
+"""
+Retry policy with full-jitter backoff, deadlines and circuit breaking.
+
+Policies wrap individual provider calls (one LLM request, one TTS chunk),
+so a failure only repeats the request that failed.
+"""
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from contextlib import AsyncExitStack
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the provider's circuit is open."""
+
+
+class RetryStats:
+    """Thread-safe counters of a retry policy."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+        self.trips = 0
+
+    def increment(self, name: str) -> None:
+        """Increment a counter by one."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a dictionary."""
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "trips": self.trips,
+            }
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by all calls to one provider.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    fail fast for reset_timeout seconds; then a single trial call is let
+    through (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+            reset_timeout (float): Seconds before a trial call is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be issued now.
+
+        Returns:
+            bool: False if the circuit is open
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Release a half-open trial slot without judging the provider's health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        Record a failed call.
+
+        Returns:
+            bool: True if this failure opened the circuit
+        """
+        with self._lock:
+            self._failures += 1
+            was_trial = self._trial_in_flight
+            self._trial_in_flight = False
+            if was_trial or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self.trips += 1
+                return True
+            return False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+) -> CircuitBreaker:
+    """
+    Return the process-wide circuit breaker for a provider.
+
+    Args:
+        name (str): Provider name (e.g. "gemini-1.5-flash", "polly-eu-central-1")
+        failure_threshold (int): Consecutive failures that open the circuit
+        reset_timeout (float): Seconds before a trial call is allowed
+
+    Returns:
+        CircuitBreaker: Shared breaker
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, reset_timeout)
+            _breakers[name] = breaker
+        return breaker
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """
+    Extract a server-provided retry delay from a provider exception.
+
+    Understands a retry_after attribute, Retry-After HTTP headers (including
+    botocore's ResponseMetadata), gRPC RetryInfo details and "retry in Ns"
+    messages.
+
+    Args:
+        exc (BaseException): Exception raised by a provider call
+
+    Returns:
+        Optional[float]: Delay in seconds, or None if the server gave no hint
+    """
+    value = getattr(exc, "retry_after", None)
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    response = getattr(exc, "response", None)
+    headers = None
+    if isinstance(response, dict):
+        headers = response.get("ResponseMetadata", {}).get("HTTPHeaders")
+    elif response is not None:
+        headers = getattr(response, "headers", None)
+    if headers:
+        for name in ("retry-after", "Retry-After"):
+            if name in headers:
+                try:
+                    return float(headers[name])
+                except (TypeError, ValueError):
+                    pass
+
+    for detail in getattr(exc, "details", None) or []:
+        delay = getattr(detail, "retry_delay", None)
+        if delay is not None and hasattr(delay, "seconds"):
+            return delay.seconds + getattr(delay, "nanos", 0) / 1e9
+
+    match = re.search(r"retry in ([0-9.]+)\s*s", str(exc), flags=re.IGNORECASE)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+
+    return None
+
+
+class RetryPolicy:
+    """
+    Retry policy for individual provider calls.
+
+    Backoff uses full jitter: before retry n the policy sleeps a random time
+    in [0, min(max_delay, base_delay * backoff ** n)], or the server's retry
+    hint if one is given. No attempt is started, and no sleep extends, past
+    total_timeout. Async calls are cancelled after attempt_timeout; for sync
+    calls the per-attempt deadline must be enforced by the provider client,
+    which providers configure from the same setting.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        backoff: float = 2.0,
+        max_delay: float = 30.0,
+        attempt_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        retry_on: tuple = (Exception,),
+        breaker: Optional[CircuitBreaker] = None,
+        name: str = "provider",
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts (int): Maximum number of attempts, including the first
+            base_delay (float): Backoff ceiling before the first retry in seconds
+            backoff (float): Multiplier of the backoff ceiling per retry
+            max_delay (float): Upper bound of a single backoff in seconds
+            attempt_timeout (Optional[float]): Deadline of a single attempt
+            total_timeout (Optional[float]): Deadline of all attempts together
+            retry_on (tuple): Exceptions that are retried and count as failures
+            breaker (Optional[CircuitBreaker]): Circuit breaker of the provider
+            name (str): Provider name used in log messages
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.attempt_timeout = attempt_timeout
+        self.total_timeout = total_timeout
+        self.retry_on = retry_on
+        self.breaker = breaker
+        self.name = name
+        self.stats = RetryStats()
+
+    def _before_attempt(self) -> None:
+        """Count the attempt, failing fast if the circuit is open."""
+        if self.breaker is not None and not self.breaker.allow():
+            self.stats.increment("rejected")
+            raise CircuitOpenError(f"Circuit open for {self.name}, failing fast")
+        self.stats.increment("attempts")
+
+    def _on_success(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def _on_other_error(self) -> None:
+        # Errors outside retry_on (e.g. invalid input) say nothing about the
+        # provider's health
+        if self.breaker is not None:
+            self.breaker.release()
+
+    def _next_delay(
+        self, attempt: int, exc: BaseException, deadline: Optional[float]
+    ) -> Optional[float]:
+        """
+        Record a failed attempt and compute the wait before the next one.
+
+        Args:
+            attempt (int): Zero-based index of the failed attempt
+            exc (BaseException): Exception raised by the attempt
+            deadline (Optional[float]): Monotonic time of the total deadline
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if no retry should follow
+        """
+        self.stats.increment("failures")
+        if self.breaker is not None and self.breaker.record_failure():
+            self.stats.increment("trips")
+            logger.error(f"Circuit opened for {self.name} after repeated failures")
+
+        if attempt + 1 >= self.max_attempts:
+            logger.error(f"All {self.max_attempts} attempts failed for {self.name}.")
+            return None
+
+        hint = retry_after(exc)
+        if hint is not None:
+            delay = min(hint, self.max_delay)
+        else:
+            ceiling = min(self.max_delay, self.base_delay * self.backoff**attempt)
+            delay = random.uniform(0, ceiling)
+
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            logger.error(f"Retry deadline exceeded for {self.name}.")
+            return None
+
+        logger.warning(
+            f"Attempt {attempt + 1}/{self.max_attempts} failed for {self.name}: "
+            f"{str(exc)}. Retrying in {delay:.1f}s..."
+        )
+        self.stats.increment("retries")
+        return delay
+
+    def _deadline(self) -> Optional[float]:
+        if self.total_timeout is None:
+            return None
+        return time.monotonic() + self.total_timeout
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call func, retrying on retry_on exceptions.
+
+        Args:
+            func (Callable[..., Any]): Provider call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: Result of func
+        """
+        deadline = self._deadline()
+        for attempt in range(self.max_attempts):
+            self._before_attempt()
+            try:
+                result = func(*args, **kwargs)
+            except self.retry_on as e:
+                delay = self._next_delay(attempt, e, deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            except BaseException:
+                self._on_other_error()
+                raise
+            else:
+                self._on_success()
+                return result
+
+    async def acall(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        admission: Optional[Callable[[], AsyncContextManager]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Await func, retrying on retry_on exceptions with non-blocking waits.
+
+        Each attempt is cancelled after attempt_timeout (or when the total
+        deadline is reached) and counted as a failure. Time spent waiting
+        for admission (local quota or concurrency limits) is neither part of
+        an attempt nor of the total deadline, so queueing is never mistaken
+        for a provider failure.
+
+        Args:
+            func (Callable[..., Awaitable[Any]]): Coroutine function for the call
+            *args: Positional arguments for func
+            admission (Optional[Callable[[], AsyncContextManager]]): Returns a
+                context entered before each attempt and held while it runs
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: Result of func
+        """
+        deadline = self._deadline()
+        for attempt in range(self.max_attempts):
+            self._before_attempt()
+
+            try:
+                async with AsyncExitStack() as stack:
+                    if admission is not None:
+                        queued_at = time.monotonic()
+                        await stack.enter_async_context(admission())
+                        if deadline is not None:
+                            deadline += time.monotonic() - queued_at
+
+                    timeout = self.attempt_timeout
+                    if deadline is not None:
+                        remaining = max(0.0, deadline - time.monotonic())
+                        timeout = (
+                            remaining if timeout is None else min(timeout, remaining)
+                        )
+
+                    result = await asyncio.wait_for(func(*args, **kwargs), timeout)
+            except (asyncio.TimeoutError,) + tuple(self.retry_on) as e:
+                delay = self._next_delay(attempt, e, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except BaseException:
+                self._on_other_error()
+                raise
+            else:
+                self._on_success()
+                return result
@@ -0,0 +1,381 @@
+"""
+Text helpers shared by the LLM and TTS stages.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# End of a sentence: terminal punctuation, optional closing quotes/brackets,
+# followed by whitespace.
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])[\"')\]]*\s+")
+
+# Speaker label at the start of a line: "Alex: ..." or "**Alex:** ..."; the
+# colon must be followed by a space, so "https://..." is not a label
+SPEAKER_TAG = re.compile(
+    r"^\s*\**\s*([^\W\d][\w .'-]{0,40}?)\s*\**\s*:(?=\s|\*|$)\s*\**\s*"
+)
+
+# Section heading line as PodcastPromptTemplate asks for it: "[Conclusion]"
+SECTION_HEADING = re.compile(r"^\s*\[([^\[\]\n]+)\]\s*$")
+
+
+def iter_sentence_chunks(deltas: Iterable[str], max_length: int = 3000) -> Iterator[str]:
+    """
+    Assemble streamed text fragments into TTS-sized chunks of whole sentences.
+
+    A chunk is emitted as soon as the next complete sentence would no longer
+    fit into max_length, so synthesis of a chunk can start while the rest of
+    the text is still being generated. Sentences longer than max_length are
+    split on word boundaries.
+
+    Args:
+        deltas (Iterable[str]): Text fragments in order (e.g. LLM stream tokens)
+        max_length (int): Maximum chunk length in characters
+
+    Yields:
+        str: Chunks of complete sentences
+    """
+    buffer = ""
+    current = ""
+
+    def pack(sentence: str) -> Iterator[str]:
+        nonlocal current
+        sentence = sentence.strip()
+        if not sentence:
+            return
+
+        while len(sentence) > max_length:
+            cut = sentence.rfind(" ", 0, max_length)
+            if cut <= 0:
+                cut = max_length
+            if current:
+                yield current
+                current = ""
+            yield sentence[:cut].strip()
+            sentence = sentence[cut:].strip()
+
+        if current and len(current) + 1 + len(sentence) > max_length:
+            yield current
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+
+    for delta in deltas:
+        if not delta:
+            continue
+        buffer += delta
+
+        # Move every complete sentence from the buffer into the current chunk
+        start = 0
+        for match in SENTENCE_BOUNDARY.finditer(buffer):
+            yield from pack(buffer[start : match.end()])
+            start = match.end()
+        buffer = buffer[start:]
+
+    yield from pack(buffer)
+    if current:
+        yield current
+
+
+def split_sentences(text: str, max_length: int) -> List[str]:
+    """
+    Split text into sentences in one pass, keeping their punctuation.
+
+    Whitespace inside a sentence is collapsed to single spaces, since
+    providers bill it without it affecting the audio. Sentences longer than
+    max_length are split on word boundaries.
+
+    Args:
+        text (str): Text to split
+        max_length (int): Maximum length of a piece in characters
+
+    Returns:
+        List[str]: Sentences (or sentence pieces) in order
+    """
+    sentences = []
+    starts = [0] + [match.end() for match in SENTENCE_BOUNDARY.finditer(text)]
+    ends = starts[1:] + [len(text)]
+    for start, end in zip(starts, ends):
+        sentence = " ".join(text[start:end].split())
+        while len(sentence) > max_length:
+            cut = sentence.rfind(" ", 0, max_length + 1)
+            if cut <= 0:
+                cut = max_length
+            sentences.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences
+
+
+def _pack(sentences: List[str], max_length: int) -> List[str]:
+    """Greedily join consecutive sentences into chunks of at most max_length."""
+    chunks = []
+    current = ""
+    for sentence in sentences:
+        if current and len(current) + 1 + len(sentence) > max_length:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def pack_text(text: str, max_length: int = 3000, min_chunks: int = 1) -> List[str]:
+    """
+    Pack text into chunks of whole sentences with balanced lengths.
+
+    The chunk count is that of greedy packing up to max_length, the same
+    as the former sentence splitter, so request counts do not change.
+    Among the packings with that many chunks (or min_chunks, if larger),
+    the one with the shortest longest chunk is chosen, so chunks
+    synthesized concurrently finish at about the same time.
+
+    Lengths are counted in characters, which is the unit of Polly's
+    request limit for plain text; gTTS splits chunks into requests itself.
+
+    Args:
+        text (str): Text to split
+        max_length (int): Maximum chunk length in characters (the provider's
+            request limit)
+        min_chunks (int): Split into at least this many chunks if the text
+            has enough sentences (e.g. to use all concurrent workers)
+
+    Returns:
+        List[str]: Chunks of complete sentences
+    """
+    sentences = split_sentences(text, max_length)
+    if not sentences:
+        return []
+
+    target = max(len(_pack(sentences, max_length)), min(min_chunks, len(sentences)))
+
+    # Smallest chunk length that still packs into target chunks
+    low = max(len(sentence) for sentence in sentences)
+    high = max_length
+    while low < high:
+        middle = (low + high) // 2
+        if len(_pack(sentences, middle)) <= target:
+            high = middle
+        else:
+            low = middle + 1
+
+    return _pack(sentences, low)
+
+
+def parse_dialogue(
+    script: str, speakers: Optional[Iterable[str]] = None
+) -> List[Tuple[Optional[str], str]]:
+    """
+    Split a speaker-tagged script into turns.
+
+    Lines starting with "Name:" begin a turn of that speaker; untagged lines
+    continue the current turn. Consecutive turns of the same speaker are
+    merged, so each turn can be synthesized with as few requests as
+    possible. Text before the first label belongs to speaker None.
+
+    Args:
+        script (str): Script with lines labelled by speaker
+        speakers (Optional[Iterable[str]]): Known speaker names; if given,
+            only these (case-insensitive) are treated as labels, so lines
+            like "Note: ..." stay part of the text (default: every label)
+
+    Returns:
+        List[Tuple[Optional[str], str]]: (speaker, text) turns in order
+    """
+    known = None
+    if speakers is not None:
+        known = {speaker.lower(): speaker for speaker in speakers}
+
+    turns: List[Tuple[Optional[str], str]] = []
+    speaker = None
+    for line in script.splitlines():
+        match = SPEAKER_TAG.match(line)
+        if match:
+            name = match.group(1).strip()
+            if known is None or name.lower() in known:
+                speaker = known[name.lower()] if known else name
+                line = line[match.end() :]
+
+        line = " ".join(line.split())
+        if not line:
+            continue
+        if turns and turns[-1][0] == speaker:
+            turns[-1] = (speaker, f"{turns[-1][1]} {line}")
+        else:
+            turns.append((speaker, line))
+
+    return turns
+
+
+def _section_titles(sections: Iterable[Tuple[str, str, float]]) -> Dict[str, str]:
+    """Map the title of each section to its key."""
+    return {title: key for key, title, _ in sections}
+
+
+def _heading(line: str, titles: Dict[str, str]) -> Optional[str]:
+    """Return the section key if the line is only a "[title]" heading."""
+    match = SECTION_HEADING.match(line)
+    return titles.get(match.group(1).strip()) if match else None
+
+
+def strip_section_headings(
+    script: str, sections: Iterable[Tuple[str, str, float]]
+) -> str:
+    """
+    Remove section heading lines, which mark structure but are not narrated.
+
+    Args:
+        script (str): Script text
+        sections (Iterable[Tuple[str, str, float]]): (key, title, share)
+            of each section in order
+
+    Returns:
+        str: Script without lines holding only a section's title in square
+            brackets; other lines, e.g. a plain "Conclusion", are kept
+    """
+    titles = _section_titles(sections)
+    return "\n".join(
+        line for line in script.splitlines() if _heading(line, titles) is None
+    )
+
+
+def iter_without_headings(
+    fragments: Iterable[str], sections: Iterable[Tuple[str, str, float]]
+) -> Iterator[str]:
+    """
+    Remove section heading lines from streamed text fragments.
+
+    Only the start of a line is held back, and only until it is either
+    complete or too long to be a heading, so text keeps streaming.
+
+    Args:
+        fragments (Iterable[str]): Text fragments in order
+        sections (Iterable[Tuple[str, str, float]]): (key, title, share)
+            of each section in order
+
+    Yields:
+        str: Text fragments without section heading lines
+    """
+    titles = _section_titles(sections)
+    # Room for the brackets and surrounding whitespace of the longest title
+    longest = max((len(title) for title in titles), default=0) + 10
+    line = ""
+    held = True  # Whether the text since the last newline is held back
+
+    for fragment in fragments:
+        while fragment:
+            newline = fragment.find("\n")
+            if not held:
+                if newline < 0:
+                    yield fragment
+                    break
+                yield fragment[: newline + 1]
+                fragment = fragment[newline + 1 :]
+                held = True
+                continue
+
+            if newline < 0:
+                line += fragment
+                if len(line) > longest:
+                    yield line
+                    line, held = "", False
+                break
+            line += fragment[: newline + 1]
+            fragment = fragment[newline + 1 :]
+            if _heading(line, titles) is None:
+                yield line
+            line = ""
+
+    if line and _heading(line, titles) is None:
+        yield line
+
+
+def split_sections(
+    script: str, sections: Iterable[Tuple[str, str, float]]
+) -> List[Tuple[str, str, str]]:
+    """
+    Split a script into its sections.
+
+    Lines holding only a section's title in square brackets (e.g.
+    "[Conclusion]", as PodcastPromptTemplate asks for with section_headings)
+    mark where it starts and are dropped; text before the first heading
+    belongs to the first section. Only as a last resort, with fewer than two
+    such headings, the script is cut at the paragraph boundaries (or line or
+    sentence boundaries, if there are too few paragraphs) closest to the
+    sections' shares of its length; such cuts move when the text is edited.
+
+    Args:
+        script (str): Script text
+        sections (Iterable[Tuple[str, str, float]]): (key, title, share)
+            of each section in order
+
+    Returns:
+        List[Tuple[str, str, str]]: (key, title, text) of each section that
+            has text, in order
+    """
+    sections = list(sections)
+    titles = {key: title for key, title, _ in sections}
+    keys = _section_titles(sections)
+
+    lines = script.splitlines()
+    headings = [_heading(line, keys) for line in lines]
+    if sum(heading is not None for heading in headings) >= 2:
+        result: List[Tuple[str, str, str]] = []
+        key, current = sections[0][0], []
+        # A final pseudo-heading flushes the last section
+        for line, heading in zip(lines + [""], headings + [key]):
+            if heading is None:
+                current.append(line)
+                continue
+            text = "\n".join(current).strip()
+            if text and result and result[-1][0] == key:
+                result[-1] = (key, titles[key], f"{result[-1][2]}\n\n{text}")
+            elif text:
+                result.append((key, titles[key], text))
+            key, current = heading, []
+        return result
+
+    logger.warning(
+        "Script has no section headings; splitting it by length, so section "
+        "boundaries are approximate and move when the text is edited"
+    )
+
+    # Proportional split at the coarsest boundaries giving enough pieces
+    units: List[str] = []
+    for pattern, separator in ((r"\n\s*\n", "\n\n"), (r"\n", "\n")):
+        units = [unit.strip() for unit in re.split(pattern, script) if unit.strip()]
+        if len(units) >= len(sections):
+            break
+    else:
+        units = split_sentences(script, max(1, len(script)))
+        separator = " "
+    if not units:
+        return []
+
+    ends = []
+    total = 0
+    for unit in units:
+        total += len(unit)
+        ends.append(total)
+
+    # A cut after units[:cut]; every section keeps at least one unit
+    count = min(len(sections), len(units))
+    cuts = [0]
+    target = 0.0
+    for index in range(count - 1):
+        target += sections[index][2] * total
+        candidates = range(cuts[-1] + 1, len(units) - (count - 2 - index))
+        cuts.append(min(candidates, key=lambda cut: abs(ends[cut - 1] - target)))
+    cuts.append(len(units))
+
+    return [
+        (key, title, separator.join(units[start:end]))
+        for (key, title, _), start, end in zip(sections, cuts[:-1], cuts[1:])
+    ]
@@ -0,0 +1,235 @@
+"""
+Token accounting for LLM prompts and responses.
+"""
+
+import inspect
+import math
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Average characters per token for English prose; used when the provider
+# cannot count tokens itself.
+CHARS_PER_TOKEN = 4.0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Args:
+        text (str): Text to measure
+
+    Returns:
+        int: Approximate token count
+    """
+    if not text:
+        return 0
+    return int(math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+class TokenUsage:
+    """Thread-safe record of the token usage of every model call."""
+
+    def __init__(self, parent: Optional["TokenUsage"] = None):
+        """
+        Initialize an empty usage record.
+
+        Args:
+            parent (Optional[TokenUsage]): Enclosing record that also gets
+                every call recorded here
+        """
+        self._lock = threading.Lock()
+        self.calls: List[Dict[str, Any]] = []
+        self.parent = parent
+
+    def record(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cached: bool = False,
+        estimated: bool = False,
+    ) -> None:
+        """
+        Record one model call.
+
+        Args:
+            input_tokens (int): Prompt tokens
+            output_tokens (int): Response tokens
+            cached (bool): Whether the response came from the response cache
+            estimated (bool): Whether the counts are estimates
+        """
+        with self._lock:
+            self.calls.append(
+                {
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "cached": cached,
+                    "estimated": estimated,
+                }
+            )
+        if self.parent is not None:
+            self.parent.record(
+                input_tokens, output_tokens, cached=cached, estimated=estimated
+            )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Summarize recorded usage.
+
+        Returns:
+            Dict[str, Any]: Totals and per-call records
+        """
+        with self._lock:
+            calls = list(self.calls)
+        return {
+            "input_tokens": sum(c["input_tokens"] for c in calls),
+            "output_tokens": sum(c["output_tokens"] for c in calls),
+            "calls": calls,
+        }
+
+
+_current_usage: ContextVar[Optional[TokenUsage]] = ContextVar(
+    "pdf2podcast_token_usage", default=None
+)
+
+
+@contextmanager
+def track_usage() -> Iterator[TokenUsage]:
+    """
+    Collect the usage of all model calls made in the current context.
+
+    Calls made from asyncio tasks and from worker threads started with a
+    copy of the current context are included. Trackers nest: calls are also
+    recorded by the tracker that was active when this one was entered.
+
+    Yields:
+        TokenUsage: Usage record filled while the context is active
+    """
+    usage = TokenUsage(parent=_current_usage.get())
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+def record_usage(
+    input_tokens: int,
+    output_tokens: int,
+    cached: bool = False,
+    estimated: bool = False,
+) -> None:
+    """
+    Record a model call in the active usage tracker, if any.
+
+    Args:
+        input_tokens (int): Prompt tokens
+        output_tokens (int): Response tokens
+        cached (bool): Whether the response came from the response cache
+        estimated (bool): Whether the counts are estimates
+    """
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.record(input_tokens, output_tokens, cached=cached, estimated=estimated)
+
+
+def usage_tracked(func: Callable) -> Callable:
+    """
+    Decorate an LLM generation method to store its usage in self.last_usage.
+
+    Works with plain, coroutine and generator methods; all model calls made
+    while the method runs (including retries) are included. last_usage is
+    overwritten by every call on the instance, so callers that share an
+    instance between threads or tasks should wrap their call in track_usage
+    instead, which also receives the usage.
+
+    Args:
+        func (Callable): Method to decorate
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            with track_usage() as usage:
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    self.last_usage = usage.as_dict()
+
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(func):
+
+        def tracked(self, generator, usage):
+            try:
+                while True:
+                    # Track only while the generator runs, not while the caller
+                    # consumes a fragment
+                    token = _current_usage.set(usage)
+                    try:
+                        fragment = next(generator)
+                    except StopIteration:
+                        return
+                    finally:
+                        _current_usage.reset(token)
+                    yield fragment
+            finally:
+                generator.close()
+                self.last_usage = usage.as_dict()
+
+        @wraps(func)
+        def generator_wrapper(self, *args, **kwargs):
+            # The caller's tracker is taken now, as the generator may be
+            # consumed in another context (e.g. a TTS worker thread)
+            usage = TokenUsage(parent=_current_usage.get())
+            return tracked(self, func(self, *args, **kwargs), usage)
+
+        return generator_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with track_usage() as usage:
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self.last_usage = usage.as_dict()
+
+    return wrapper
+
+
+def fit_chunks(
+    chunks: List[str],
+    budget: int,
+    count: Callable[[str], int] = estimate_tokens,
+    separator: str = "\n\n",
+) -> List[str]:
+    """
+    Keep the leading chunks that fit into a token budget.
+
+    Chunks are expected in rank order (most relevant first); the lowest-ranked
+    chunks are dropped first.
+
+    Args:
+        chunks (List[str]): Chunks in rank order
+        budget (int): Available tokens for the joined chunks
+        count (Callable[[str], int]): Token counting function
+        separator (str): Separator used when joining chunks
+
+    Returns:
+        List[str]: Chunks that fit, in their original order
+    """
+    kept = []
+    used = 0
+    separator_tokens = count(separator)
+
+    for chunk in chunks:
+        cost = count(chunk) + (separator_tokens if kept else 0)
+        if used + cost > budget:
+            break
+        kept.append(chunk)
+        used += cost
+
+    return kept
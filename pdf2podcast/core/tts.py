@@ -2,16 +2,20 @@
 Text-to-Speech (TTS) implementations for pdf2podcast.
 """
 
+import io
+import itertools
 import os
-import time
-from typing import Dict, Any, Optional, List, Callable
-from contextlib import closing
+import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Tuple, Union
+from contextlib import ExitStack, closing
 import tempfile
 import logging
-from functools import wraps
 
 # AWS Polly
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 # Google TTS
@@ -26,64 +30,35 @@ from pydub.exceptions import CouldntDecodeError
 logger = logging.getLogger(__name__)
 
 
-def retry_on_exception(
-    retries: int = 3,
-    delay: float = 1.0,
-    backoff: float = 2.0,
-    exceptions: tuple = (Exception,),
-) -> Callable:
-    """
-    Retry decorator with exponential backoff.
-
-    Args:
-        retries (int): Maximum number of retries
-        delay (float): Initial delay between retries in seconds
-        backoff (float): Backoff multiplier
-        exceptions (tuple): Exceptions to catch
-    """
-
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            retry_delay = delay
-            last_exception = None
-
-            for i in range(retries):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if i < retries - 1:
-                        logger.warning(
-                            f"Attempt {i + 1}/{retries} failed: {str(e)}. "
-                            f"Retrying in {retry_delay:.1f}s..."
-                        )
-                        time.sleep(retry_delay)
-                        retry_delay *= backoff
-                    else:
-                        logger.error(f"All {retries} attempts failed.")
-
-            raise last_exception
-
-        return wrapper
-
-    return decorator
-
-
 from .base import BaseTTS
+from .cache import AudioCache
+from .mixer import mix_audio
+from .mp3 import FrameJoiner, concat_mp3, concat_mp3_files, probe_mp3
+from .ogg import probe_ogg
+from .postprocess import OUTPUT_FORMATS, PostProcessor
+from .ratelimit import get_rate_limiter
+from .retry import RetryPolicy, get_circuit_breaker
+from .text import pack_text, parse_dialogue
 
 
-def validate_audio_file(file_path: str) -> bool:
+def validate_audio_file(file_path: str, decode: bool = False) -> bool:
     """
     Validate that an audio file is properly formatted MP3.
 
+    By default only the MP3 frame headers are checked, which takes
+    microseconds and needs no ffmpeg; decode=True fully decodes the file.
+
     Args:
         file_path (str): Path to the audio file
+        decode (bool): Decode the audio instead of checking frame headers
 
     Returns:
         bool: True if valid, False otherwise
     """
     try:
+        if not decode:
+            with open(file_path, "rb") as f:
+                return validate_audio_data(f.read())
         audio = AudioSegment.from_mp3(file_path)
         return len(audio) > 0
     except (CouldntDecodeError, OSError):
@@ -93,70 +68,68 @@ def validate_audio_file(file_path: str) -> bool:
         return False
 
 
-def split_text(text: str, max_length: int = 3000) -> List[str]:
+def validate_audio_data(data: bytes, audio_format: str = "mp3") -> bool:
     """
-    Split text into chunks that are safe for TTS processing.
+    Validate audio held in memory without decoding it.
+
+    MP3 frame headers are checked; Ogg data must start with a page and PCM
+    must hold whole 16-bit samples.
 
     Args:
-        text (str): Text to split
-        max_length (int): Maximum length per chunk
+        data (bytes): Audio data
+        audio_format (str): "mp3", "ogg" or "pcm" (default: "mp3")
 
     Returns:
-        List[str]: List of text chunks
+        bool: True if the data holds audio with consistent parameters
     """
-    chunks = []
-    sentences = text.split(". ")
-    current_chunk = ""
+    if audio_format == "pcm":
+        return len(data) > 0 and len(data) % 2 == 0
+    if audio_format == "ogg":
+        return data[:4] == b"OggS"
+    info = probe_mp3(data)
+    return info is not None and info.duration > 0
 
-    for sentence in sentences:
-        if not sentence.strip():
-            continue
 
-        # Add period back if it was removed by split
-        sentence = sentence.strip() + ". "
+def split_text(text: str, max_length: int = 3000) -> List[str]:
+    """
+    Split text into chunks that are safe for TTS processing.
 
-        if len(current_chunk) + len(sentence) > max_length:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence
-        else:
-            current_chunk += sentence
+    Sentences keep their own punctuation and are packed into as few chunks
+    as possible, see pdf2podcast.core.text.pack_text.
 
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    Args:
+        text (str): Text to split
+        max_length (int): Maximum length per chunk
 
-    return chunks
+    Returns:
+        List[str]: List of text chunks
+    """
+    return pack_text(text, max_length)
 
 
 def merge_audio_files(files: List[str], output_file: str) -> bool:
     """
     Merge multiple MP3 files into one.
 
+    Files with matching audio parameters are concatenated frame by frame
+    without decoding; otherwise they are streamed through ffmpeg once.
+
     Args:
         files (List[str]): List of MP3 file paths
         output_file (str): Path for the merged file
     """
-    try:
-        combined = AudioSegment.empty()
-        valid_files = []
 
-        # Validate and load audio files
+    def read_files() -> Iterator[bytes]:
         for file in files:
-            if validate_audio_file(file):
-                audio = AudioSegment.from_mp3(file)
-                combined += audio
-                valid_files.append(file)
-            else:
-                logger.error(f"Invalid audio file: {file}")
+            with open(file, "rb") as f:
+                yield f.read()
 
-        if not valid_files:
-            raise ValueError("No valid audio files to merge")
-
-        # Export combined audio
-        combined.export(output_file, format="mp3")
+    try:
+        if not concat_mp3_files(files, output_file):
+            _reencode_audio(read_files(), output_file)
 
         # Clean up temporary files only after successful export
-        for file in valid_files:
+        for file in files:
             try:
                 os.remove(file)
             except OSError as e:
@@ -176,7 +149,824 @@ def merge_audio_files(files: List[str], output_file: str) -> bool:
         return False
 
 
-class AWSPollyTTS(BaseTTS):
+def merge_audio_data(chunks: Iterable[bytes], output_file: str) -> bool:
+    """
+    Merge MP3 data held in memory into one file.
+
+    Chunks with matching audio parameters are concatenated frame by frame
+    without decoding; otherwise they are streamed through ffmpeg once,
+    which iterates over chunks a second time.
+
+    Args:
+        chunks (Iterable[bytes]): MP3 data in playback order
+        output_file (str): Path for the merged file
+
+    Returns:
+        bool: True if successful
+    """
+    try:
+        with open(output_file, "wb") as output:
+            if concat_mp3(chunks, output):
+                return True
+
+        _reencode_audio(chunks, output_file)
+        return True
+
+    except Exception as e:
+        logger.error(f"Error merging audio data: {str(e)}")
+        return False
+
+
+def _reencode_audio(chunks: Iterable[bytes], output_file: str) -> None:
+    """
+    Decode MP3 chunks with differing parameters and encode them as one file.
+
+    Output sample rate, channel count and bitrate follow the first chunk.
+
+    Args:
+        chunks (Iterable[bytes]): MP3 data in playback order
+        output_file (str): Path for the merged file
+    """
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    info = probe_mp3(first) if first is not None else None
+    processor = PostProcessor(
+        bitrate=f"{info.bitrate}k" if info else None,
+        sample_rate=info.sample_rate if info else None,
+        channels=info.channels if info else None,
+        loudnorm=False,
+    )
+    processor.process(itertools.chain([first], chunks), output_file)
+
+
+class ChunkBuffer:
+    """
+    Ordered audio chunks of one synthesis job.
+
+    Chunks are kept in memory until they add up to max_memory_bytes; later
+    chunks spill to a temporary directory private to the job, so concurrent
+    jobs never share chunk files. The directory is removed on close.
+    """
+
+    def __init__(self, temp_dir: str, max_memory_bytes: int):
+        """
+        Initialize chunk buffer.
+
+        Args:
+            temp_dir (str): Parent directory of the spill directory
+            max_memory_bytes (int): Audio bytes kept in memory before spilling
+        """
+        self.temp_dir = temp_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.size = 0
+        self._chunks: List[Union[bytes, str]] = []
+        self._memory_bytes = 0
+        self._spill_dir: Optional[str] = None
+
+    def append(self, data: bytes) -> None:
+        """
+        Add the audio of the next chunk.
+
+        Args:
+            data (bytes): Chunk audio
+        """
+        self.size += len(data)
+        if self._memory_bytes + len(data) <= self.max_memory_bytes:
+            self._chunks.append(data)
+            self._memory_bytes += len(data)
+            return
+
+        if self._spill_dir is None:
+            os.makedirs(self.temp_dir, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(prefix="job_", dir=self.temp_dir)
+        path = os.path.join(self._spill_dir, f"chunk_{len(self._chunks)}.mp3")
+        with open(path, "wb") as file:
+            file.write(data)
+        self._chunks.append(path)
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            if isinstance(chunk, str):
+                with open(chunk, "rb") as file:
+                    yield file.read()
+            else:
+                yield chunk
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def close(self) -> None:
+        """Release the buffered audio and remove spilled chunks."""
+        self._chunks = []
+        self._memory_bytes = 0
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def __enter__(self) -> "ChunkBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AudioTimeline:
+    """
+    Durations of the audio chunks of one synthesis job.
+
+    Each chunk is measured as it passes by, from MP3 frame headers, Ogg page
+    headers or the PCM sample count, so the duration and chunk offsets of
+    the assembled file are known without decoding or reading it again.
+    """
+
+    def __init__(self, chunk_format: str = "mp3", sample_rate: Optional[int] = None):
+        """
+        Initialize timeline.
+
+        Args:
+            chunk_format (str): "mp3", "ogg" or "pcm" (default: "mp3")
+            sample_rate (Optional[int]): Sample rate of PCM chunks
+        """
+        self.chunk_format = chunk_format
+        self.sample_rate = sample_rate
+        self.channels: Optional[int] = 1 if chunk_format == "pcm" else None
+        self.durations: List[float] = []
+        self.complete = True
+
+    def add(self, data: bytes) -> None:
+        """
+        Measure the audio of the next chunk.
+
+        Args:
+            data (bytes): Chunk audio
+        """
+        if self.chunk_format == "pcm":
+            self.durations.append(len(data) // 2 / self.sample_rate)
+            return
+
+        info = probe_ogg(data) if self.chunk_format == "ogg" else probe_mp3(data)
+        if info is None:
+            # Mixed parameters within a chunk; its length is unknown
+            self.complete = False
+            self.durations.append(0.0)
+            return
+        if self.sample_rate is None:
+            self.sample_rate = info.sample_rate
+            self.channels = info.channels
+        self.durations.append(info.duration)
+
+    def track(self, chunk_audio: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Measure chunks on their way to assembly.
+
+        Args:
+            chunk_audio (Iterable[bytes]): Audio of each chunk in order
+
+        Yields:
+            bytes: The same chunk audio, unchanged
+        """
+        for data in chunk_audio:
+            self.add(data)
+            yield data
+
+    def metadata(
+        self,
+        size: int,
+        sample_rate: Optional[int] = None,
+        channels: Optional[int] = None,
+        timed: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Describe the assembled audio.
+
+        Args:
+            size (int): Size of the assembled file in bytes
+            sample_rate (Optional[int]): Output sample rate, if the audio was
+                resampled (default: that of the chunks)
+            channels (Optional[int]): Output channel count (default: that of
+                the chunks)
+            timed (bool): Whether the output keeps the chunks' timing, i.e.
+                no silence was removed (default: True)
+
+        Returns:
+            Dict[str, Any]: 'duration' in seconds, average 'bitrate' in kbps,
+                'sample_rate', 'channels' and 'chunk_offsets' (start of each
+                chunk in seconds); duration, bitrate and offsets are None if
+                unknown
+        """
+        duration = None
+        offsets = None
+        if timed and self.complete:
+            duration = 0.0
+            offsets = []
+            for chunk_duration in self.durations:
+                offsets.append(duration)
+                duration += chunk_duration
+        return {
+            "duration": duration,
+            "bitrate": round(size * 8 / duration / 1000) if duration else None,
+            "sample_rate": sample_rate or self.sample_rate,
+            "channels": channels or self.channels,
+            "chunk_offsets": offsets,
+        }
+
+
+class ChunkedTTS(BaseTTS):
+    """
+    Base class for TTS providers that synthesize text chunk by chunk.
+
+    Subclasses implement _generate_chunk; splitting, synthesis scheduling,
+    buffering and merging of the chunk audio are shared.
+    """
+
+    # Default maximum text length per synthesis request
+    max_chunk_length: int = 3000
+
+    # Shared quota limiter (see pdf2podcast.core.ratelimit), None if unlimited
+    rate_limiter = None
+
+    # Retry policy applied to each chunk request, None to call once
+    retry_policy = None
+
+    # Maximum number of chunk requests in flight at once
+    max_concurrency: int = 1
+
+    # Chunk audio of one job kept in memory before spilling to temp_dir
+    max_buffer_bytes: int = 64 * 1024 * 1024
+
+    # Parent directory of per-job spill directories
+    temp_dir: str = "temp"
+
+    # Disk cache of synthesized chunks (see pdf2podcast.core.cache), None to
+    # always synthesize
+    audio_cache = None
+
+    # Speaker name -> voice (or language) used for dialogue scripts
+    voices: Optional[Dict[str, str]] = None
+
+    # ffmpeg post-processing of the assembled audio (see
+    # pdf2podcast.core.postprocess), None to concatenate chunks as they are
+    postprocessor = None
+
+    # Output format (a key of OUTPUT_FORMATS) and bitrate; without a bitrate
+    # the provider's own encoding is kept where possible
+    output_format: str = "mp3"
+    bitrate: Optional[str] = None
+
+    # Format of the audio returned by _generate_chunk: "mp3", "ogg" or "pcm"
+    # (16-bit little-endian mono at chunk_sample_rate)
+    chunk_format: str = "mp3"
+    chunk_sample_rate: Optional[int] = None
+
+    def _configure_output(
+        self,
+        output_format: str,
+        bitrate: Optional[str],
+        postprocess: Optional[Dict[str, Any]],
+        native_formats: Iterable[str] = ("mp3",),
+        pcm_sample_rate: Optional[int] = None,
+    ) -> None:
+        """
+        Choose the chunk format and encoder for the requested output.
+
+        If the provider synthesizes the output format itself and neither a
+        bitrate nor post-processing is requested, chunks are requested in
+        that format and only joined. Otherwise ffmpeg encodes the episode
+        once, from MP3 chunks or, if pcm_sample_rate is given, from PCM, so
+        no compressed audio is decoded first.
+
+        Args:
+            output_format (str): Output format, see OUTPUT_FORMATS
+            bitrate (Optional[str]): Target bitrate, e.g. "32k"
+            postprocess (Optional[Dict[str, Any]]): PostProcessor options;
+                their output_format and bitrate take precedence
+            native_formats (Iterable[str]): Output formats the provider
+                synthesizes directly (default: MP3 only)
+            pcm_sample_rate (Optional[int]): Sample rate of the provider's PCM
+                output, None to encode from MP3 chunks
+
+        Raises:
+            ValueError: If the output format is not supported
+        """
+        options = dict(postprocess or {})
+        output_format = options.setdefault("output_format", output_format)
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        if bitrate:
+            bitrate = options.setdefault("bitrate", bitrate)
+        self.output_format = output_format
+        self.bitrate = bitrate
+
+        if not postprocess and not bitrate and output_format in native_formats:
+            self.chunk_format = "mp3" if output_format == "mp3" else "ogg"
+            return
+
+        if not postprocess:
+            # Only encoding was asked for
+            options["loudnorm"] = False
+        self.postprocessor = PostProcessor(**options)
+        if output_format != "mp3" and pcm_sample_rate:
+            self.chunk_format = "pcm"
+            self.chunk_sample_rate = pcm_sample_rate
+
+    def _encoder_input(self) -> Dict[str, Any]:
+        """Describe the chunk audio to PostProcessor.stream."""
+        if self.chunk_format == "pcm":
+            return {
+                "input_format": "s16le",
+                "input_sample_rate": self.chunk_sample_rate,
+                "input_channels": 1,
+            }
+        return {"input_format": self.chunk_format}
+
+    def _audio_cache_key(self, text: str, voice: Optional[str] = None) -> Optional[str]:
+        """
+        Build the audio cache key of a chunk.
+
+        Providers return a key covering every setting that changes the audio;
+        the default disables caching.
+
+        Args:
+            text (str): Chunk text
+            voice (Optional[str]): Provider-specific voice/language override
+
+        Returns:
+            Optional[str]: Cache key, or None if the chunk must not be cached
+        """
+        return None
+
+    def _split_text(self, text: str, max_length: Optional[int] = None) -> List[str]:
+        """
+        Pack text into synthesis requests for this provider.
+
+        The default packs whole sentences into the fewest requests within
+        max_chunk_length, balancing their lengths.
+
+        Args:
+            text (str): Text to convert
+            max_length (Optional[int]): Maximum text length per request
+                (default: max_chunk_length)
+
+        Returns:
+            List[str]: Text chunks in order
+        """
+        return pack_text(text, max_length or self.max_chunk_length)
+
+    def _synthesize_chunk(
+        self, text: str, voice: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        Wait for provider quota, then generate audio for a single chunk.
+
+        Chunks found in the audio cache are returned without a provider
+        request. Only this chunk's request is retried on provider errors.
+
+        Args:
+            text (str): Text to convert
+            voice (Optional[str]): Provider-specific voice/language override
+
+        Returns:
+            Optional[bytes]: Audio in chunk_format, or None if generation failed
+        """
+        cache_key = None
+        if self.audio_cache is not None:
+            cache_key = self._audio_cache_key(text, voice)
+        if cache_key is not None:
+            audio = self.audio_cache.get(cache_key)
+            if audio is not None:
+                # Cached audio needs neither quota nor a provider request
+                return audio
+
+        def attempt() -> Optional[bytes]:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(len(text))
+            return self._generate_chunk(text, voice)
+
+        if self.retry_policy is None:
+            audio = attempt()
+        else:
+            audio = self.retry_policy.call(attempt)
+
+        if audio and cache_key is not None:
+            self.audio_cache.set(cache_key, audio)
+        return audio
+
+    def _generate_chunk(
+        self, text: str, voice: Optional[str] = None
+    ) -> Optional[bytes]:
+        """
+        Generate audio for a single text chunk.
+
+        Args:
+            text (str): Text to convert
+            voice (Optional[str]): Provider-specific voice/language override
+
+        Returns:
+            Optional[bytes]: Validated audio in chunk_format, or None if
+                generation failed
+        """
+        raise NotImplementedError
+
+    def _iter_chunk_audio(
+        self, chunks: Iterable[str], voice: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Synthesize text chunks in one voice and yield their audio in order.
+
+        Args:
+            chunks (Iterable[str]): Text chunks in order
+            voice (Optional[str]): Provider-specific voice/language override
+
+        Yields:
+            bytes: Audio of each chunk in chunk_format, in order
+        """
+        return self._iter_voiced_audio((chunk, voice) for chunk in chunks)
+
+    def _iter_voiced_audio(
+        self, items: Iterable[Tuple[str, Optional[str]]], skip_failed: bool = True
+    ) -> Iterator[Optional[bytes]]:
+        """
+        Synthesize text chunks concurrently and yield their audio in order.
+
+        Chunks are consumed lazily and each one is submitted for synthesis as
+        soon as it is available, so a slow producer (e.g. a streaming LLM)
+        overlaps with audio generation. Every voice gets its own queue with
+        up to max_concurrency requests in flight, so the turns of one speaker
+        never wait behind those of another. Audio is handed on as soon as all
+        earlier chunks are done, and at most 2 * max_concurrency finished or
+        running chunks per voice are held back, which bounds memory use.
+        Chunks that failed are skipped, or yield None if skip_failed is False.
+
+        Args:
+            items (Iterable[Tuple[str, Optional[str]]]): (text, voice) chunks
+                in order
+            skip_failed (bool): Leave out chunks without audio (default: True)
+
+        Yields:
+            Optional[bytes]: Audio of each chunk in chunk_format, in order
+        """
+        workers = max(1, self.max_concurrency)
+        pools: Dict[Optional[str], ThreadPoolExecutor] = {}
+        pending = deque()
+
+        def finished(future) -> Optional[bytes]:
+            audio = future.result()
+            if not audio:
+                logger.warning("Skipping chunk without audio")
+            return audio
+
+        with ExitStack() as stack:
+            try:
+                for chunk, voice in items:
+                    pool = pools.get(voice)
+                    if pool is None:
+                        pool = stack.enter_context(
+                            ThreadPoolExecutor(max_workers=workers)
+                        )
+                        pools[voice] = pool
+                    pending.append(pool.submit(self._synthesize_chunk, chunk, voice))
+
+                    while pending and (
+                        pending[0].done() or len(pending) >= 2 * workers * len(pools)
+                    ):
+                        audio = finished(pending.popleft())
+                        if audio or not skip_failed:
+                            yield audio or None
+
+                while pending:
+                    audio = finished(pending.popleft())
+                    if audio or not skip_failed:
+                        yield audio or None
+            finally:
+                # Don't start chunks that can no longer be used
+                for future in pending:
+                    future.cancel()
+
+    def _stream_chunks(
+        self, chunks: Iterable[str], voice: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Synthesize text chunks and yield their audio as one stream.
+
+        For MP3, tags and Xing/Info headers of the chunks are dropped, so the
+        pieces play as a single stream when concatenated; Ogg chunks form a
+        chained stream. With a postprocessor, the processed and encoded
+        output is yielded instead.
+
+        Args:
+            chunks (Iterable[str]): Text chunks in order
+            voice (Optional[str]): Provider-specific voice/language override
+
+        Yields:
+            bytes: Audio in playback order
+
+        Raises:
+            RuntimeError: If no audio could be generated, or chunks differ in
+                audio parameters (which would need re-encoding)
+        """
+        chunk_audio = self._iter_chunk_audio(chunks, voice)
+        if self.postprocessor is not None:
+            yield from self.postprocessor.stream(chunk_audio, **self._encoder_input())
+            return
+
+        if self.chunk_format == "ogg":
+            # Ogg chunks play one after the other as a chained stream
+            produced = False
+            for audio in chunk_audio:
+                produced = True
+                yield audio
+            if not produced:
+                raise RuntimeError("No audio chunks were generated")
+            return
+
+        joiner = FrameJoiner()
+        for audio in chunk_audio:
+            try:
+                frames = b"".join(joiner.feed(audio))
+            except ValueError as e:
+                raise RuntimeError(f"Cannot stream chunk audio: {str(e)}") from e
+            if frames:
+                yield frames
+
+        if not joiner.frames:
+            raise RuntimeError("No audio chunks were generated")
+
+    def _synthesize_chunks(
+        self, chunks: Iterable[str], output_path: str, voice: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Synthesize text chunks and merge them into output_path.
+
+        Args:
+            chunks (Iterable[str]): Text chunks in order
+            output_path (str): Path where to save the audio file
+            voice (Optional[str]): Provider-specific voice/language override
+
+        Returns:
+            Dict[str, Any]: Dictionary containing audio metadata
+                          (e.g., {'path': str, 'size': int, 'duration': float})
+        """
+        return self._write_audio(self._iter_chunk_audio(chunks, voice), output_path)
+
+    def _write_audio(
+        self, chunk_audio: Iterable[bytes], output_path: str
+    ) -> Dict[str, Any]:
+        """
+        Merge synthesized chunk audio into output_path.
+
+        Chunk audio is buffered in memory (spilling to a private temporary
+        directory above max_buffer_bytes), so concurrent jobs never share
+        intermediate files, and output_path is the only file written.
+
+        Args:
+            chunk_audio (Iterable[bytes]): Audio of each chunk in chunk_format,
+                in order
+            output_path (str): Path where to save the audio file
+
+        Returns:
+            Dict[str, Any]: 'success', 'path' and 'size', plus 'duration',
+                'bitrate', 'sample_rate', 'channels' and 'chunk_offsets' (see
+                AudioTimeline.metadata)
+        """
+        timeline = AudioTimeline(self.chunk_format, self.chunk_sample_rate)
+        chunk_audio = timeline.track(chunk_audio)
+        try:
+            if self.postprocessor is not None:
+                # ffmpeg consumes the chunks as they arrive; nothing is buffered
+                size = self.postprocessor.process(
+                    chunk_audio, output_path, **self._encoder_input()
+                )
+                metadata = timeline.metadata(
+                    size,
+                    sample_rate=self.postprocessor.output_sample_rate(
+                        timeline.sample_rate
+                    ),
+                    channels=self.postprocessor.channels,
+                    # Removed silence shifts every later chunk
+                    timed=not self.postprocessor.trim_silence,
+                )
+                return {"success": True, "path": output_path, "size": size, **metadata}
+
+            with ChunkBuffer(self.temp_dir, self.max_buffer_bytes) as buffer:
+                for audio in chunk_audio:
+                    buffer.append(audio)
+
+                if not len(buffer):
+                    raise Exception("No audio chunks were generated")
+
+                # Merge chunks if there are multiple
+                if len(buffer) > 1 and self.chunk_format == "mp3":
+                    if not merge_audio_data(buffer, output_path):
+                        raise Exception("Failed to merge audio chunks")
+                else:
+                    # A single chunk, or Ogg chunks chained as they are
+                    with open(output_path, "wb") as file:
+                        for audio in buffer:
+                            file.write(audio)
+
+            # Get file size
+            size = os.path.getsize(output_path)
+            metadata = timeline.metadata(size)
+
+            return {"success": True, "path": output_path, "size": size, **metadata}
+
+        except Exception as e:
+            return {"success": False, "error": str(e), "path": None, "size": 0}
+
+    def generate_audio(
+        self,
+        text: str,
+        output_path: str,
+        voice_id: Optional[str] = None,
+        max_chunk_length: Optional[int] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Convert text to speech and save as audio file.
+
+        Args:
+            text (str): Text to convert to speech
+            output_path (str): Path where to save the audio file
+            voice_id (Optional[str]): Voice (or language) override
+            max_chunk_length (Optional[int]): Maximum text length per chunk
+                (default: the provider's max_chunk_length)
+            **kwargs: Additional TTS-specific parameters
+
+        Returns:
+            Dict[str, Any]: Dictionary containing audio metadata
+                          (e.g., {'path': str, 'size': int, 'duration': float})
+        """
+        chunks = self._split_text(text, max_chunk_length)
+        return self._synthesize_chunks(chunks, output_path, voice_id)
+
+    def generate_audio_from_chunks(
+        self,
+        chunks: Iterable[str],
+        output_path: str,
+        voice_id: Optional[str] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Convert a stream of text chunks to speech and save as one audio file.
+
+        Args:
+            chunks (Iterable[str]): Text chunks in order, each within the
+                provider's request limit
+            output_path (str): Path where to save the audio file
+            voice_id (Optional[str]): Voice (or language) override
+            **kwargs: Additional TTS-specific parameters
+
+        Returns:
+            Dict[str, Any]: Dictionary containing audio metadata
+                          (e.g., {'path': str, 'size': int, 'duration': float})
+        """
+        return self._synthesize_chunks(chunks, output_path, voice_id)
+
+    def stream_audio(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+        max_chunk_length: Optional[int] = None,
+        first_chunk_length: Optional[int] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[bytes]:
+        """
+        Convert text to speech and yield the audio of each chunk in order.
+
+        Args:
+            text (str): Text to convert to speech
+            voice_id (Optional[str]): Voice (or language) override
+            max_chunk_length (Optional[int]): Maximum text length per chunk
+                (default: the provider's max_chunk_length)
+            first_chunk_length (Optional[int]): Split the first chunk further
+                into chunks of at most this length, which shortens the time to
+                the first audio (default: no extra split)
+            **kwargs: Additional TTS-specific parameters
+
+        Yields:
+            bytes: MP3 data in playback order
+        """
+        chunks = self._split_text(text, max_chunk_length)
+        if first_chunk_length and chunks:
+            chunks = pack_text(chunks[0], first_chunk_length) + chunks[1:]
+        return self._stream_chunks(chunks, voice_id)
+
+    def stream_audio_from_chunks(
+        self,
+        chunks: Iterable[str],
+        voice_id: Optional[str] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Iterator[bytes]:
+        """
+        Convert a stream of text chunks to speech and yield the audio in order.
+
+        Args:
+            chunks (Iterable[str]): Text chunks in order, each within the
+                provider's request limit
+            voice_id (Optional[str]): Voice (or language) override
+            **kwargs: Additional TTS-specific parameters
+
+        Yields:
+            bytes: Audio in output_format, in playback order
+        """
+        return self._stream_chunks(chunks, voice_id)
+
+    def generate_dialogue(
+        self,
+        script: str,
+        output_path: str,
+        voices: Optional[Dict[str, str]] = None,
+        turn_pause: float = 0.0,
+        turn_crossfade: float = 0.0,
+        **kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Convert a speaker-tagged script to speech with one voice per speaker.
+
+        Each turn is packed into requests on its own, since a request has a
+        single voice. Every voice has its own request queue, so a script with
+        two speakers renders in about the time of a single-voice script, as
+        long as the provider quota allows the additional requests.
+
+        With a pause or crossfade between turns the audio has to be decoded:
+        it is mixed into one PCM buffer and encoded once (see PCMMixer).
+
+        Args:
+            script (str): Script with lines labelled by speaker ("Alex: ...")
+            output_path (str): Path where to save the audio file
+            voices (Optional[Dict[str, str]]): Speaker name (case-insensitive)
+                -> voice (or language); speakers without a voice use the
+                default voice (default: the provider's voices)
+            turn_pause (float): Silence between turns in seconds (default: 0)
+            turn_crossfade (float): Overlap of consecutive turns in seconds,
+                if there is no pause (default: 0)
+            **kwargs: Additional TTS-specific parameters
+
+        Returns:
+            Dict[str, Any]: Dictionary containing audio metadata
+                          (e.g., {'path': str, 'size': int, 'duration': float})
+        """
+        voices = voices if voices is not None else (self.voices or {})
+        # Labels are found whether or not a speaker has a voice, so the turns
+        # of an unmapped speaker are not merged into the previous speaker's
+        speaker_voices = {name.lower(): voice for name, voice in voices.items()}
+        chunk_turns = []
+
+        def items() -> Iterator[Tuple[str, Optional[str]]]:
+            for turn, (speaker, text) in enumerate(parse_dialogue(script)):
+                voice = speaker_voices.get(speaker.lower()) if speaker else None
+                # Turns already run in parallel, so only the request limit
+                # applies when packing them
+                for chunk in pack_text(text, self.max_chunk_length):
+                    chunk_turns.append(turn)
+                    yield chunk, voice
+
+        if not (turn_pause or turn_crossfade):
+            return self._write_audio(self._iter_voiced_audio(items()), output_path)
+
+        try:
+            chunk_audio = []
+            pauses = []
+            crossfades = []
+            previous_turn = None
+            chunks = self._iter_voiced_audio(items(), skip_failed=False)
+            for index, audio in enumerate(chunks):
+                if audio is None:
+                    continue
+                # The chunk was taken from items(), so its turn is known
+                turn = chunk_turns[index]
+                if chunk_audio:
+                    new_turn = turn != previous_turn
+                    pauses.append(turn_pause if new_turn else 0.0)
+                    crossfades.append(turn_crossfade if new_turn else 0.0)
+                chunk_audio.append(audio)
+                previous_turn = turn
+
+            if not chunk_audio:
+                raise Exception("No audio chunks were generated")
+
+            processor = self.postprocessor
+            if processor is None:
+                encoder = {"bitrate": self.bitrate} if self.bitrate else {}
+                processor = PostProcessor(
+                    output_format=self.output_format, loudnorm=False, **encoder
+                )
+            metadata = mix_audio(
+                chunk_audio,
+                output_path,
+                pauses=pauses,
+                crossfades=crossfades,
+                processor=processor,
+                chunk_format=self.chunk_format,
+                sample_rate=self.chunk_sample_rate,
+            )
+            return {"success": True, "path": output_path, **metadata}
+
+        except Exception as e:
+            return {"success": False, "error": str(e), "path": None, "size": 0}
+
+
+class AWSPollyTTS(ChunkedTTS):
     """
     AWS Polly-based Text-to-Speech implementation.
 
@@ -185,12 +975,38 @@ class AWSPollyTTS(BaseTTS):
     or AWS configuration files.
     """
 
+    # Polly bills and limits up to 3000 characters per request; with plain
+    # text every character (including whitespace) counts
+    max_chunk_length = 3000
+
+    # Polly OutputFormat of each output format it synthesizes directly
+    polly_formats = {"mp3": "mp3", "ogg": "ogg_vorbis", "opus": "ogg_opus"}
+
+    # Highest sample rate Polly offers for PCM; its MP3 goes up to 24 kHz
+    # (the neural engine's default)
+    pcm_sample_rate = 16000
+
     def __init__(
         self,
         voice_id: str = "Joanna",
         region_name: str = "eu-central-1",
         engine: str = "neural",
         temp_dir: str = "temp",
+        requests_per_minute: Optional[float] = None,
+        characters_per_minute: Optional[float] = None,
+        rate_limit_dir: Optional[str] = None,
+        max_retries: int = 3,
+        request_timeout: Optional[float] = None,
+        retry_deadline: Optional[float] = None,
+        max_concurrency: int = 4,
+        max_buffer_bytes: int = 64 * 1024 * 1024,
+        voices: Optional[Dict[str, str]] = None,
+        postprocess: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = 512 * 1024 * 1024,
+        output_format: str = "mp3",
+        bitrate: Optional[str] = None,
+        pcm: bool = False,
     ):
         """
         Initialize AWS Polly TTS service.
@@ -199,30 +1015,104 @@ class AWSPollyTTS(BaseTTS):
             voice_id (str): ID of the voice to use (default: "Joanna")
             region_name (str): AWS region for Polly service (default: "eu-central-1")
             engine (str): Polly engine type - "standard" or "neural" (default: "neural")
-            temp_dir (str): Directory for temporary files (default: "temp")
+            temp_dir (str): Directory for chunks spilled from memory (default: "temp")
+            requests_per_minute (Optional[float]): Request quota shared by all
+                instances using the same region (default: unlimited)
+            characters_per_minute (Optional[float]): Character quota shared by all
+                instances using the same region (default: unlimited)
+            rate_limit_dir (Optional[str]): Directory holding the quota state, to
+                share it between processes on the host (default: per process)
+            max_retries (int): Maximum attempts per chunk request (default: 3)
+            request_timeout (Optional[float]): Read timeout of a single request in
+                seconds (default: botocore default)
+            retry_deadline (Optional[float]): Deadline of a chunk request including
+                all retries in seconds (default: none)
+            max_concurrency (int): Maximum chunk requests in flight (default: 4)
+            max_buffer_bytes (int): Chunk audio of one job kept in memory before
+                spilling to temp_dir (default: 64 MiB)
+            voices (Optional[Dict[str, str]]): Speaker name -> voice (or
+                language) for dialogue scripts
+            postprocess (Optional[Dict[str, Any]]): PostProcessor options for
+                ffmpeg loudness normalization, silence trimming and encoding;
+                chunks are concatenated unchanged if not set
+            cache_dir (Optional[str]): Directory for caching synthesized chunks;
+                caching is disabled if not set
+            cache_max_bytes (int): Maximum size of the audio cache in bytes
+                (default: 512 MiB)
+            output_format (str): "mp3", "ogg", "opus", "aac" or "m4a"
+                (default: "mp3"); Polly synthesizes MP3, Ogg Vorbis and Ogg
+                Opus itself, other formats are encoded once from its MP3
+            bitrate (Optional[str]): Output bitrate, e.g. "32k"; audio is then
+                encoded once by ffmpeg (default: Polly's own encoding)
+            pcm (bool): Have ffmpeg encode from Polly's PCM instead of its MP3,
+                which avoids decoding lossy audio but limits the output to
+                16 kHz (default: False)
         """
-        self.polly = boto3.client("polly", region_name=region_name)
+        # Retries are handled by retry_policy, not by botocore
+        client_config = Config(retries={"total_max_attempts": 1})
+        if request_timeout is not None:
+            client_config = client_config.merge(Config(read_timeout=request_timeout))
+        self.polly = boto3.client(
+            "polly", region_name=region_name, config=client_config
+        )
         self.voice_id = voice_id
         self.engine = engine
         self.temp_dir = temp_dir
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_buffer_bytes = max_buffer_bytes
+        self.voices = voices
+        self._configure_output(
+            output_format,
+            bitrate,
+            postprocess,
+            native_formats=self.polly_formats,
+            pcm_sample_rate=self.pcm_sample_rate if pcm else None,
+        )
+        if self.chunk_format == "pcm":
+            self.polly_format = "pcm"
+        elif self.chunk_format == "ogg":
+            self.polly_format = self.polly_formats[self.output_format]
+        else:
+            self.polly_format = "mp3"
+        if cache_dir:
+            self.audio_cache = AudioCache(cache_dir, max_bytes=cache_max_bytes)
+        self.rate_limiter = get_rate_limiter(
+            f"polly-{region_name}",
+            requests_per_minute=requests_per_minute,
+            units_per_minute=characters_per_minute,
+            state_dir=rate_limit_dir,
+        )
+        self.retry_policy = RetryPolicy(
+            max_attempts=max_retries,
+            base_delay=1.0,
+            attempt_timeout=request_timeout,
+            total_timeout=retry_deadline,
+            retry_on=(BotoCoreError, ClientError),
+            breaker=get_circuit_breaker(f"polly-{region_name}"),
+            name=f"polly-{region_name}",
+        )
 
         # Create temp directory if it doesn't exist
         os.makedirs(temp_dir, exist_ok=True)
 
-    @retry_on_exception(retries=3, delay=1.0, exceptions=(BotoCoreError, ClientError))
+    def _audio_cache_key(self, text: str, voice_id: Optional[str] = None) -> str:
+        return AudioCache.make_key(
+            "polly", voice_id or self.voice_id, self.engine, text, self.polly_format
+        )
+
     def _generate_chunk(
-        self, text: str, output_path: str, voice_id: Optional[str] = None
-    ) -> bool:
+        self, text: str, voice_id: Optional[str] = None
+    ) -> Optional[bytes]:
         """
-        Generate audio for a single text chunk with retry mechanism.
+        Generate audio for a single text chunk.
 
         Args:
             text (str): Text to convert
-            output_path (str): Where to save the audio
             voice_id (Optional[str]): Override default voice
 
         Returns:
-            bool: True if successful
+            Optional[bytes]: Validated audio in chunk_format, or None if
+                generation failed
 
         Raises:
             BotoCoreError: For AWS SDK related errors
@@ -231,32 +1121,38 @@ class AWSPollyTTS(BaseTTS):
         # Use provided voice_id or default
         voice_id = voice_id or self.voice_id
 
+        request = {
+            "Text": text,
+            "OutputFormat": self.polly_format,
+            "VoiceId": voice_id,
+            "Engine": self.engine,
+        }
+        if self.chunk_format == "pcm":
+            request["SampleRate"] = str(self.chunk_sample_rate)
+
         try:
-            response = self.polly.synthesize_speech(
-                Text=text, OutputFormat="mp3", VoiceId=voice_id, Engine=self.engine
-            )
+            response = self.polly.synthesize_speech(**request)
 
             if "AudioStream" not in response:
                 logger.error("No AudioStream in Polly response")
-                return False
+                return None
 
             with closing(response["AudioStream"]) as stream:
-                with open(output_path, "wb") as file:
-                    file.write(stream.read())
+                audio = stream.read()
 
-            # Validate generated audio file
-            if not validate_audio_file(output_path):
-                logger.error(f"Generated audio file {output_path} is invalid")
-                return False
+            # Validate the audio before it is used
+            if not validate_audio_data(audio, self.chunk_format):
+                logger.error("Polly returned invalid audio")
+                return None
 
-            return True
+            return audio
 
         except (BotoCoreError, ClientError) as e:
             logger.error(f"AWS Polly error: {str(e)}")
-            raise  # Will be caught by retry decorator
+            raise  # Retried by retry_policy
         except Exception as e:
             logger.error(f"Unexpected error in audio generation: {str(e)}")
-            return False
+            return None
 
     def generate_audio(
         self,
@@ -278,39 +1174,14 @@ class AWSPollyTTS(BaseTTS):
 
         Returns:
             Dict[str, Any]: Dictionary containing audio metadata
-                          (e.g., {'path': str, 'size': int})
+                          (e.g., {'path': str, 'size': int, 'duration': float})
         """
-        try:
-            # Split text into chunks
-            chunks = split_text(text, max_chunk_length)
-            chunk_files = []
-
-            # Generate audio for each chunk
-            for i, chunk in enumerate(chunks):
-                chunk_path = os.path.join(self.temp_dir, f"chunk_{i}.mp3")
-                if self._generate_chunk(chunk, chunk_path, voice_id):
-                    chunk_files.append(chunk_path)
-
-            if not chunk_files:
-                raise Exception("No audio chunks were generated")
-
-            # Merge chunks if there are multiple
-            if len(chunk_files) > 1:
-                merge_audio_files(chunk_files, output_path)
-            else:
-                # Just rename single chunk file
-                os.rename(chunk_files[0], output_path)
-
-            # Get file size
-            size = os.path.getsize(output_path)
+        # Split text into chunks
+        chunks = self._split_text(text, max_chunk_length)
+        return self._synthesize_chunks(chunks, output_path, voice_id)
 
-            return {"success": True, "path": output_path, "size": size}
 
-        except Exception as e:
-            return {"success": False, "error": str(e), "path": None, "size": 0}
-
-
-class GoogleTTS(BaseTTS):
+class GoogleTTS(ChunkedTTS):
     """
     Google Text-to-Speech implementation using gTTS.
 
@@ -318,12 +1189,28 @@ class GoogleTTS(BaseTTS):
     No API key required, but has usage limitations and fewer voice options.
     """
 
+    max_chunk_length = 5000  # gTTS has a different limit than Polly
+
     def __init__(
         self,
         language: str = "en",
         tld: str = "com",
         slow: bool = False,
         temp_dir: str = "temp",
+        requests_per_minute: Optional[float] = None,
+        characters_per_minute: Optional[float] = None,
+        rate_limit_dir: Optional[str] = None,
+        max_retries: int = 3,
+        request_timeout: Optional[float] = None,
+        retry_deadline: Optional[float] = None,
+        max_concurrency: int = 4,
+        max_buffer_bytes: int = 64 * 1024 * 1024,
+        voices: Optional[Dict[str, str]] = None,
+        postprocess: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = 512 * 1024 * 1024,
+        output_format: str = "mp3",
+        bitrate: Optional[str] = None,
     ):
         """
         Initialize Google TTS service.
@@ -332,30 +1219,107 @@ class GoogleTTS(BaseTTS):
             language (str): Language code (default: "en")
             tld (str): Top-level domain for accent (default: "com")
             slow (bool): Slower audio output (default: False)
-            temp_dir (str): Directory for temporary files (default: "temp")
+            temp_dir (str): Directory for chunks spilled from memory (default: "temp")
+            requests_per_minute (Optional[float]): Request quota shared by all
+                instances (default: unlimited)
+            characters_per_minute (Optional[float]): Character quota shared by all
+                instances (default: unlimited)
+            rate_limit_dir (Optional[str]): Directory holding the quota state, to
+                share it between processes on the host (default: per process)
+            max_retries (int): Maximum attempts per chunk request (default: 3)
+            request_timeout (Optional[float]): Timeout of a single request in
+                seconds (default: gTTS default)
+            retry_deadline (Optional[float]): Deadline of a chunk request including
+                all retries in seconds (default: none)
+            max_concurrency (int): Maximum chunk requests in flight (default: 4)
+            max_buffer_bytes (int): Chunk audio of one job kept in memory before
+                spilling to temp_dir (default: 64 MiB)
+            voices (Optional[Dict[str, str]]): Speaker name -> voice (or
+                language) for dialogue scripts
+            postprocess (Optional[Dict[str, Any]]): PostProcessor options for
+                ffmpeg loudness normalization, silence trimming and encoding;
+                chunks are concatenated unchanged if not set
+            cache_dir (Optional[str]): Directory for caching synthesized chunks;
+                caching is disabled if not set
+            cache_max_bytes (int): Maximum size of the audio cache in bytes
+                (default: 512 MiB)
+            output_format (str): "mp3", "ogg", "opus", "aac" or "m4a"
+                (default: "mp3"); gTTS returns MP3, other formats are
+                transcoded once by ffmpeg
+            bitrate (Optional[str]): Output bitrate, e.g. "32k"; audio is then
+                encoded once by ffmpeg (default: gTTS's own encoding)
         """
         self.language = language
         self.tld = tld
         self.slow = slow
+        self.timeout = request_timeout
         self.temp_dir = temp_dir
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_buffer_bytes = max_buffer_bytes
+        self.voices = voices
+        self._configure_output(output_format, bitrate, postprocess)
+        if cache_dir:
+            self.audio_cache = AudioCache(cache_dir, max_bytes=cache_max_bytes)
+        self.rate_limiter = get_rate_limiter(
+            "gtts",
+            requests_per_minute=requests_per_minute,
+            units_per_minute=characters_per_minute,
+            state_dir=rate_limit_dir,
+        )
+        self.retry_policy = RetryPolicy(
+            max_attempts=max_retries,
+            base_delay=2.0,
+            attempt_timeout=request_timeout,
+            total_timeout=retry_deadline,
+            retry_on=(gTTSError,),
+            breaker=get_circuit_breaker("gtts"),
+            name="gtts",
+        )
 
         # Create temp directory if it doesn't exist
         os.makedirs(temp_dir, exist_ok=True)
 
-    @retry_on_exception(retries=3, delay=2.0, exceptions=(gTTSError,))
+    def _split_text(self, text: str, max_length: Optional[int] = None) -> List[str]:
+        """
+        Pack text into chunks for gTTS, at least one per concurrent worker.
+
+        gTTS sends one request per 100 characters of a chunk, one after the
+        other, so the request count hardly depends on the chunk size while
+        synthesis time grows with it.
+
+        Args:
+            text (str): Text to convert
+            max_length (Optional[int]): Maximum text length per chunk
+                (default: max_chunk_length)
+
+        Returns:
+            List[str]: Text chunks in order
+        """
+        return pack_text(
+            text, max_length or self.max_chunk_length, min_chunks=self.max_concurrency
+        )
+
+    def _audio_cache_key(self, text: str, language: Optional[str] = None) -> str:
+        return AudioCache.make_key(
+            "gtts",
+            language or self.language,
+            f"{self.tld}/{'slow' if self.slow else 'normal'}",
+            text,
+            "mp3",
+        )
+
     def _generate_chunk(
-        self, text: str, output_path: str, language: Optional[str] = None
-    ) -> bool:
+        self, text: str, language: Optional[str] = None
+    ) -> Optional[bytes]:
         """
-        Generate audio for a single text chunk using gTTS with retry mechanism.
+        Generate audio for a single text chunk using gTTS.
 
         Args:
             text (str): Text to convert
-            output_path (str): Where to save the audio
             language (Optional[str]): Override default language
 
         Returns:
-            bool: True if successful
+            Optional[bytes]: Validated MP3 data, or None if generation failed
 
         Raises:
             gTTSError: For Google TTS specific errors
@@ -365,22 +1329,30 @@ class GoogleTTS(BaseTTS):
             lang = language or self.language
 
             # Create gTTS object and save audio
-            tts = gTTS(text=text, lang=lang, slow=self.slow, tld=self.tld)
-            tts.save(output_path)
+            tts = gTTS(
+                text=text,
+                lang=lang,
+                slow=self.slow,
+                tld=self.tld,
+                timeout=self.timeout,
+            )
+            buffer = io.BytesIO()
+            tts.write_to_fp(buffer)
+            audio = buffer.getvalue()
 
-            # Validate generated audio file
-            if not validate_audio_file(output_path):
-                logger.error(f"Generated audio file {output_path} is invalid")
-                return False
+            # Validate the audio before it is used
+            if not validate_audio_data(audio):
+                logger.error("Google TTS returned invalid audio")
+                return None
 
-            return True
+            return audio
 
         except gTTSError as e:
             logger.error(f"Google TTS error: {str(e)}")
-            raise  # Will be caught by retry decorator
+            raise  # Retried by retry_policy
         except Exception as e:
             logger.error(f"Unexpected error in audio generation: {str(e)}")
-            return False
+            return None
 
     def generate_audio(
         self,
@@ -402,33 +1374,8 @@ class GoogleTTS(BaseTTS):
 
         Returns:
             Dict[str, Any]: Dictionary containing audio metadata
-                          (e.g., {'path': str, 'size': int})
+                          (e.g., {'path': str, 'size': int, 'duration': float})
         """
-        try:
-            # Split text into chunks
-            chunks = split_text(text, max_chunk_length)
-            chunk_files = []
-
-            # Generate audio for each chunk
-            for i, chunk in enumerate(chunks):
-                chunk_path = os.path.join(self.temp_dir, f"chunk_{i}.mp3")
-                if self._generate_chunk(chunk, chunk_path, language):
-                    chunk_files.append(chunk_path)
-
-            if not chunk_files:
-                raise Exception("No audio chunks were generated")
-
-            # Merge chunks if there are multiple
-            if len(chunk_files) > 1:
-                merge_audio_files(chunk_files, output_path)
-            else:
-                # Just rename single chunk file
-                os.rename(chunk_files[0], output_path)
-
-            # Get file size
-            size = os.path.getsize(output_path)
-
-            return {"success": True, "path": output_path, "size": size}
-
-        except Exception as e:
-            return {"success": False, "error": str(e), "path": None, "size": 0}
+        # Split text into chunks
+        chunks = self._split_text(text, max_chunk_length)
+        return self._synthesize_chunks(chunks, output_path, language)
@@ -0,0 +1,16 @@
+from pdf2podcast.core.cache import AudioCache
+
+
+def test_overwriting_an_entry_does_not_grow_the_cache(tmp_path):
+    cache = AudioCache(str(tmp_path), max_bytes=1000)
+    key = cache.make_key("gtts", "en", None, "Gravity pulls.")
+
+    for _ in range(5):
+        cache.set(key, b"x" * 300)
+    other = cache.make_key("gtts", "en", None, "Mass bends spacetime.")
+    cache.set(other, b"y" * 300)
+
+    assert cache._size == 600
+    # Nothing was evicted, as the cache never held more than 600 bytes
+    assert cache.get(key) == b"x" * 300
+    assert len(cache) == 2
@@ -0,0 +1,23 @@
+import pytest
+
+from pdf2podcast.core.base import BasePodcastGenerator
+from pdf2podcast.core.fake import FakeTTS
+
+
+class FailingStreamLLM:
+    """Streams part of a script, then fails like a dropped connection."""
+
+    def stream_podcast_script(self, text, complexity="intermediate", **kwargs):
+        yield "Gravity pulls masses together. "
+        raise ConnectionError("stream interrupted")
+
+
+def test_script_stream_errors_propagate(tmp_path):
+    generator = BasePodcastGenerator.__new__(BasePodcastGenerator)
+    generator.llm = FailingStreamLLM()
+    generator.tts = FakeTTS(temp_dir=str(tmp_path))
+
+    with pytest.raises(ConnectionError, match="stream interrupted"):
+        generator._generate_streaming(
+            "Source text.", str(tmp_path / "episode.mp3"), "intermediate", None
+        )
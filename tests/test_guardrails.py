@@ -0,0 +1,47 @@
+import pytest
+
+from pdf2podcast.core.guardrails import ScriptGuardrail
+
+SCIENTIFIC_PROSE = [
+    "Sound travels fast (the speed of sound is 343 m/s in air) but light is faster.",
+    "Water boils in what physicists call a phase change (a first-order transition).",
+    "The radio signal fades out over long distances.",
+    "Colors fade in sunlight, and the music of the spheres was a medieval idea.",
+    "A resonator (tuned to the sound frequency) amplifies the vibration.",
+    "This is a figure of speech, not a diagrammatic argument.",
+]
+
+CUES = [
+    ("Intro. [SFX: whoosh] Today we talk about gravity.", "[SFX: whoosh]"),
+    ("(Music swells) Gravity is a force.", "(Music swells)"),
+    ("Gravity. *music fades* Next topic.", "*music fades*"),
+    ("(applause) Thank you.", "(applause)"),
+]
+
+
+@pytest.mark.parametrize("text", SCIENTIFIC_PROSE)
+def test_scientific_prose_passes_unchanged(text):
+    guardrail = ScriptGuardrail()
+    assert guardrail.find(text) is None
+    assert guardrail.scrub(text) == text
+    assert "".join(guardrail.monitor([text[:20], text[20:]])) == text
+
+
+@pytest.mark.parametrize("text, cue", CUES)
+def test_audio_cues_are_found(text, cue):
+    violation = ScriptGuardrail().find(text)
+    assert violation is not None
+    assert violation.text == cue
+
+
+def test_visual_reference_is_removed_as_a_sentence():
+    guardrail = ScriptGuardrail()
+    text = "Energy is conserved. See the diagram 3 for details. It never changes."
+    assert guardrail.scrub(text) == "Energy is conserved. It never changes."
+
+
+def test_scrub_stream_matches_scrub():
+    guardrail = ScriptGuardrail()
+    text = " ".join(SCIENTIFIC_PROSE) + " (Music swells) The end."
+    fragments = [text[i : i + 7] for i in range(0, len(text), 7)]
+    assert "".join(guardrail.scrub_stream(fragments)) == guardrail.scrub(text)
@@ -0,0 +1,270 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import pdf2podcast.core.llm as llm_module
+from pdf2podcast.core.llm import GeminiLLM
+from pdf2podcast.core.tokens import track_usage
+
+
+class StubChatModel:
+    """Stands in for ChatGoogleGenerativeAI, answering from a list of replies."""
+
+    def __init__(self, replies, latency=0.0):
+        self.replies = list(replies)
+        self.latency = latency
+        self.calls = 0
+        self.streamed = 0
+
+    def _next(self):
+        self.calls += 1
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def stream(self, model_input, **kwargs):
+        for word in self._next().split(" "):
+            yield SimpleNamespace(
+                content=word + " ",
+                usage_metadata={"input_tokens": 0, "output_tokens": 1},
+            )
+
+    def invoke(self, model_input, **kwargs):
+        reply = self._next()
+        return SimpleNamespace(
+            content=reply,
+            usage_metadata={"input_tokens": 10, "output_tokens": len(reply.split())},
+        )
+
+    async def ainvoke(self, model_input, **kwargs):
+        await asyncio.sleep(self.latency)
+        return self.invoke(model_input, **kwargs)
+
+    async def astream(self, model_input, **kwargs):
+        for chunk in self.stream(model_input, **kwargs):
+            await asyncio.sleep(self.latency)
+            self.streamed += 1
+            yield chunk
+
+
+def make_llm(replies, **kwargs):
+    llm = GeminiLLM(api_key="test", **kwargs)
+    llm.llm = StubChatModel(replies)
+    return llm
+
+
+def test_usage_of_aborted_guarded_streams_is_recorded():
+    llm = make_llm(
+        [
+            "Gravity pulls. (music swells) More text follows here.",
+            "Gravity pulls. [SFX: whoosh] More text follows here.",
+            "Gravity pulls things together.",
+        ],
+        guardrail=True,
+        guardrail_retries=2,
+    )
+
+    with track_usage() as usage:
+        script = llm._guarded_invoke("Explain gravity.")
+
+    assert script == "Gravity pulls things together."
+    calls = usage.as_dict()["calls"]
+    # Two aborted streams and the final request
+    assert len(calls) == 3
+    assert all(call["output_tokens"] > 0 for call in calls[:2])
+
+
+def test_async_guarded_streams_abort_at_the_violation():
+    cue = "Gravity pulls. (music swells) " + "More text follows here. " * 50
+    llm = make_llm([cue, "Gravity pulls things together."], guardrail=True)
+
+    with track_usage() as usage:
+        script = asyncio.run(llm._aguarded_invoke("Explain gravity."))
+
+    assert script == "Gravity pulls things together."
+    # The first response was cancelled a few words after the cue
+    assert 0 < llm.llm.streamed < len(cue.split()) // 2
+    assert len(usage.as_dict()["calls"]) == 2
+
+
+def test_transient_client_errors_are_retried():
+    from langchain_google_genai.chat_models import GoogleRateLimitError
+
+    llm = make_llm([GoogleRateLimitError("429 quota"), "A script."])
+    llm.retry_policy.base_delay = 0.0
+
+    assert llm._invoke("Explain gravity.") == "A script."
+    assert llm.llm.calls == 2
+
+
+def test_invalid_requests_are_not_retried():
+    from langchain_google_genai.chat_models import GoogleInvalidRequestError
+
+    llm = make_llm([GoogleInvalidRequestError("400 bad request"), "A script."])
+    llm.retry_policy.base_delay = 0.0
+
+    with pytest.raises(GoogleInvalidRequestError):
+        llm._invoke("Explain gravity.")
+    assert llm.llm.calls == 1
+
+
+def test_client_does_not_retry_on_its_own():
+    assert GeminiLLM(api_key="test").llm.max_retries == 1
+
+
+def test_map_sections_fit_the_token_budget():
+    llm = make_llm([], generation_mode="auto", max_input_tokens=1000)
+    text = "Gravity bends light around massive objects. " * 150
+    assert len(text) < llm.map_chunk_size
+
+    assert llm._use_map_reduce(text)
+    prompts = llm._build_map_prompts(text, "intermediate", "general")
+    assert len(prompts) > 1
+    assert all(llm.count_tokens(prompt) <= 1000 for prompt in prompts)
+
+
+def test_prompt_without_room_for_source_text_is_rejected():
+    llm = make_llm(["A script."], max_input_tokens=50)
+
+    with pytest.raises(ValueError, match="No source text fits"):
+        llm.generate_podcast_script("Gravity bends light. " * 50, min_length=0)
+    assert llm.llm.calls == 0
+
+
+def test_truncated_prompt_fits_by_the_configured_counter():
+    llm = make_llm([], max_input_tokens=1500)
+    # A model tokenizer counting far more tokens than the 4-character estimate
+    llm.count_tokens = lambda text: len(text.split()) * 3
+    text = "Gravity bends the path of light near massive stars. " * 40
+
+    prompt = llm._build_prompt(text, "intermediate", "general", 1000)
+    assert llm.count_tokens(prompt) <= 1500
+    assert "Gravity bends" in prompt
+
+
+def test_usage_is_tracked_per_call():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pdf2podcast.core.tokens import track_usage
+
+    llm = make_llm(["one two", "three four five"] * 4)
+
+    def generate(_):
+        with track_usage() as usage:
+            llm.generate_podcast_script("Gravity bends light.", min_length=0)
+        return usage.as_dict()["output_tokens"]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        counts = sorted(pool.map(generate, range(8)))
+    assert counts == [2] * 4 + [3] * 4
+
+
+def test_empty_draft_is_returned_unexpanded():
+    llm = make_llm([])
+    assert llm._expand_script("", "intermediate", "general", 1000) == ""
+    assert llm.llm.calls == 0
+
+
+def test_sectional_expansion_keeps_separators():
+    script = "Gravity pulls.\nIt is weak.\n\n\nIt never stops.\n"
+    llm = make_llm([])
+    sections, _ = llm._plan_expansion(script, 1000)
+    assert llm._splice_sections(script, sections, {}) == script
+
+    expanded = {0: "Gravity pulls every mass toward every other mass.\n"}
+    assert llm._splice_sections(script, sections, expanded) == (
+        "Gravity pulls every mass toward every other mass.\n\n\nIt never stops.\n"
+    )
+
+
+def test_context_cache_failures_are_retried(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_module.time, "time", lambda: now[0])
+    llm = make_llm([], context_cache=True)
+    results = [RuntimeError("503 unavailable"), "cachedContents/retry"]
+
+    def create(system):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    llm._create_context_cache = create
+    system = "Instructions of test_context_cache_failures_are_retried"
+    assert llm._cached_prefix(system) is None
+    # Within the retry delay the failure is remembered
+    now[0] += llm.CONTEXT_CACHE_RETRY_DELAY - 1
+    assert llm._cached_prefix(system) is None
+    assert len(results) == 1
+
+    now[0] += 1
+    assert llm._cached_prefix(system) == "cachedContents/retry"
+
+
+def test_context_cache_creation_blocks_only_its_prefix():
+    import threading
+
+    llm = make_llm([], context_cache=True)
+    started = threading.Event()
+    release = threading.Event()
+
+    def create(system):
+        if system.endswith("slow"):
+            started.set()
+            release.wait(5)
+        return f"cachedContents/{system[-4:]}"
+
+    llm._create_context_cache = create
+    slow = threading.Thread(target=llm._cached_prefix, args=("prefix slow",))
+    slow.start()
+    try:
+        assert started.wait(5)
+        names = []
+        fast = threading.Thread(
+            target=lambda: names.append(llm._cached_prefix("prefix fast"))
+        )
+        fast.start()
+        # Not blocked by the slow prefix still being created
+        fast.join(1)
+        assert names == ["cachedContents/fast"]
+    finally:
+        release.set()
+        slow.join()
+
+
+def test_queueing_for_a_request_slot_is_not_a_provider_failure(monkeypatch):
+    monkeypatch.setattr(llm_module, "_max_in_flight", 1)
+    llm = make_llm([], model_name="test-queueing", request_timeout=0.3)
+    llm.llm = StubChatModel(["A script."] * 6, latency=0.1)
+
+    async def generate_all():
+        return await asyncio.gather(
+            *(llm._ainvoke(f"Explain gravity, part {i}.") for i in range(6))
+        )
+
+    # Each request takes 0.1s, but the last one waits 0.5s for its slot
+    assert asyncio.run(generate_all()) == ["A script."] * 6
+    assert llm.retry_policy.stats.as_dict()["failures"] == 0
+    assert llm.retry_policy.breaker.state == "closed"
+
+
+def test_concurrent_async_generations_wait_for_their_turn(monkeypatch):
+    monkeypatch.setattr(llm_module, "_max_in_flight", 2)
+    llm = make_llm([], model_name="test-batch", request_timeout=0.3)
+    llm.llm = StubChatModel([f"Script {i}." for i in range(12)], latency=0.1)
+
+    async def generate_batch():
+        return await asyncio.gather(
+            *(
+                llm.agenerate_podcast_script(f"Gravity, part {i}.", min_length=0)
+                for i in range(12)
+            )
+        )
+
+    # Two at a time, the last generations wait 0.5s, above the 0.3s timeout
+    scripts = asyncio.run(generate_batch())
+    assert sorted(scripts) == sorted(f"Script {i}." for i in range(12))
+    assert llm.llm.calls == 12
+    assert llm.retry_policy.stats.as_dict()["failures"] == 0
@@ -0,0 +1,96 @@
+from pdf2podcast.core.prompts import PodcastPromptTemplate
+from pdf2podcast.core.text import (
+    iter_without_headings,
+    parse_dialogue,
+    split_sections,
+    strip_section_headings,
+)
+
+SECTIONS = PodcastPromptTemplate.SECTIONS
+
+SCRIPT = """[Introduction]
+Gravity shapes the universe.
+
+[Main Explanation]
+Mass bends spacetime. Objects follow the curves.
+
+More mass bends it more.
+
+[Real Applications]
+Satellites correct their clocks for it.
+
+[Conclusion]
+Gravity is geometry."""
+
+
+def test_sections_follow_headings():
+    parts = split_sections(SCRIPT, SECTIONS)
+    assert [key for key, _, _ in parts] == [key for key, _, _ in SECTIONS]
+    assert parts[0][2] == "Gravity shapes the universe."
+    assert parts[1][2].endswith("curves.\n\nMore mass bends it more.")
+    assert parts[3][2] == "Gravity is geometry."
+
+
+def test_editing_a_section_leaves_the_others_unchanged():
+    edited = SCRIPT.replace(
+        "More mass bends it more.",
+        "More mass bends it more, and light follows the same curves. " * 20,
+    )
+    before = split_sections(SCRIPT, SECTIONS)
+    after = split_sections(edited, SECTIONS)
+    assert [part for part in before if part[0] != "main"] == [
+        part for part in after if part[0] != "main"
+    ]
+
+
+def test_proportional_split_is_logged(caplog):
+    script = strip_section_headings(SCRIPT, SECTIONS)
+    with caplog.at_level("WARNING"):
+        parts = split_sections(script, SECTIONS)
+    assert len(parts) == 4
+    assert "no section headings" in caplog.text
+
+
+def test_headings_are_not_narrated():
+    script = SCRIPT.replace("Gravity is geometry.", "Conclusion\nGravity is geometry.")
+    narration = strip_section_headings(script, SECTIONS)
+    assert "[" not in narration
+    # Only the bracketed form is a heading; a plain title line is narrated
+    assert "Conclusion\nGravity is geometry." in narration
+
+    for size in (1, 5, 13):
+        fragments = [script[i : i + size] for i in range(0, len(script), size)]
+        streamed = "".join(iter_without_headings(fragments, SECTIONS))
+        assert streamed.split() == narration.split()
+
+
+def test_headings_are_requested_only_for_chapters():
+    settings = dict(complexity="basic", target_audience="general", min_length=100)
+    plain = PodcastPromptTemplate.get_base_instructions(**settings)
+    assert "[" not in plain
+    assert "4. Conclusion (10%)" in plain
+
+    marked = PodcastPromptTemplate.get_base_instructions(
+        section_headings=True, **settings
+    )
+    assert all(f"[{title}]" in marked for _, title, _ in SECTIONS)
+
+
+def test_dialogue_turns_do_not_depend_on_known_speakers():
+    script = "Alex: Gravity is a force.\nSam: Is it, though?\nAlex: Mostly."
+    assert parse_dialogue(script) == [
+        ("Alex", "Gravity is a force."),
+        ("Sam", "Is it, though?"),
+        ("Alex", "Mostly."),
+    ]
+
+
+def test_urls_are_not_speaker_labels():
+    script = "Alex: The paper is online at\nhttps://example.org/paper for details."
+    assert parse_dialogue(script) == [
+        ("Alex", "The paper is online at https://example.org/paper for details."),
+    ]
+    assert parse_dialogue("**Alex:** Hi.\nsam:\nHello.") == [
+        ("Alex", "Hi."),
+        ("sam", "Hello."),
+    ]
@@ -0,0 +1,54 @@
+import shutil
+import subprocess
+
+import pytest
+
+from pdf2podcast.core.fake import FakeTTS
+from pdf2podcast.core.mixer import decode_mp3
+
+needs_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg is not installed"
+)
+
+TEXT = "Gravity pulls masses together. " * 4
+
+
+@needs_ffmpeg
+@pytest.mark.parametrize("output_format", ["m4a", "opus"])
+def test_encoded_formats_keep_the_chunk_sample_rate(tmp_path, output_format):
+    tts = FakeTTS(output_format=output_format, bitrate="32k", temp_dir=str(tmp_path))
+    assert tts.chunk_format == "mp3"
+
+    result = tts.generate_audio(TEXT, str(tmp_path / f"episode.{output_format}"))
+    assert result["success"]
+    # FakeTTS chunks are 44.1 kHz; Opus only supports 48 kHz and below
+    assert result["sample_rate"] == (48000 if output_format == "opus" else 44100)
+
+
+@needs_ffmpeg
+def test_pcm_is_opt_in(tmp_path):
+    tts = FakeTTS(output_format="m4a", pcm=True, temp_dir=str(tmp_path))
+    assert tts.chunk_format == "pcm"
+
+    result = tts.generate_audio(TEXT, str(tmp_path / "episode.m4a"))
+    assert result["success"]
+    assert result["sample_rate"] == 16000
+
+
+def silent_mp3(sample_rate):
+    return subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-f", "lavfi", "-i"]
+        + [f"anullsrc=r={sample_rate}:cl=mono", "-t", "0.5", "-f", "mp3", "pipe:1"],
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+@needs_ffmpeg
+def test_chunks_of_different_formats_are_decoded_from_an_iterator():
+    chunks = [silent_mp3(24000), silent_mp3(22050)]
+
+    segments, sample_rate, channels = decode_mp3(iter(chunks))
+    assert (sample_rate, channels) == (24000, 1)
+    assert len(segments) == 2
+    assert all(len(segment) > 0.4 * sample_rate for segment in segments)